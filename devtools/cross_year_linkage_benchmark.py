@@ -0,0 +1,143 @@
+#! /usr/bin/env python
+"""Time the dense and sparse distance backends of the cross year record linkage.
+
+For each number of records, random features are generated for plants which are
+reported once a year with a little noise, and the distance dependent steps of
+:func:`pudl.analysis.record_linkage.link_cross_year.link_ids_cross_year` are run with
+both :class:`pudl.analysis.record_linkage.link_cross_year.DistanceMatrix` and
+:class:`pudl.analysis.record_linkage.link_cross_year.SparseDistanceMatrix`:
+computing the distances, clustering the records with DBSCAN, and matching the
+orphaned records to the clusters by their average distances. The peak memory
+allocated by each backend, measured in a separate run, and the size of the distances
+it stores, are reported alongside the time taken, and the clusters found by each
+backend are checked to be the same.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import DBSCAN, AgglomerativeClustering
+
+import pudl
+from pudl.analysis.record_linkage.link_cross_year import (
+    DistanceMatrix,
+    PenalizeReportYearDistanceConfig,
+    SparseDistanceMatrix,
+)
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "records",
+        nargs="*",
+        type=int,
+        default=[2_000, 5_000, 10_000],
+        help="Numbers of records to link.",
+    )
+    parser.add_argument(
+        "--eps",
+        type=float,
+        default=0.5,
+        help="Radius used to find neighbors with DBSCAN.",
+    )
+    return parser.parse_args()
+
+
+def random_plants(records: int, rng: np.random.Generator):
+    """Generate features of plants reported once a year for up to 30 years."""
+    years = 30
+    plants = records // years + 1
+    df = pd.DataFrame(
+        {
+            "plant": np.repeat(np.arange(plants), years),
+            "report_year": np.tile(np.arange(1994, 1994 + years), plants),
+        }
+    ).head(records)
+    centers = rng.uniform(0, plants ** (1 / 3), size=(plants, 3))
+    features = centers[df.plant] + rng.normal(scale=0.05, size=(records, 3))
+    return df, features
+
+
+def link(distance_matrix: DistanceMatrix, eps: float) -> np.ndarray:
+    """Run the steps of the linkage which depend on the distances between records."""
+    labels = DBSCAN(metric="precomputed", eps=eps, min_samples=2).fit_predict(
+        distance_matrix.radius_neighbors_graph(eps)
+    )
+    cluster_inds = pd.Series(labels).groupby(labels).indices
+    cluster_groups = [np.array([ind]) for ind in cluster_inds.get(-1, [])]
+    cluster_groups += [inds for key, inds in cluster_inds.items() if key != -1]
+    classifier = AgglomerativeClustering(
+        metric="precomputed",
+        linkage="average",
+        distance_threshold=eps,
+        n_clusters=None,
+    )
+    new_labels = np.empty(len(cluster_groups), dtype=int)
+    next_label = 0
+    for clusters, average_dist_matrix in distance_matrix.average_cluster_distances(
+        cluster_groups, eps
+    ):
+        matched = (
+            classifier.fit_predict(average_dist_matrix)
+            if len(clusters) > 1
+            else np.zeros(1, dtype=int)
+        )
+        new_labels[clusters] = matched + next_label
+        next_label += matched.max() + 1
+    labels[np.concatenate(cluster_groups)] = np.repeat(
+        new_labels, [len(inds) for inds in cluster_groups]
+    )
+    return pd.factorize(labels)[0]
+
+
+def main(records: list[int], eps: float) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    rng = np.random.default_rng(2024)
+    config = PenalizeReportYearDistanceConfig(radius=2 * eps)
+    results = {}
+    for n in records:
+        df, features = random_plants(n, rng)
+        labels = {}
+        for backend, cls in [
+            ("dense", DistanceMatrix),
+            ("sparse", SparseDistanceMatrix),
+        ]:
+            start = time.perf_counter()
+            distance_matrix = cls(features, df, config)
+            labels[backend] = link(distance_matrix, eps)
+            secs = time.perf_counter() - start
+            # Tracing allocations slows everything down, so memory is measured
+            # separately.
+            del distance_matrix
+            tracemalloc.start()
+            distance_matrix = cls(features, df, config)
+            link(distance_matrix, eps)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            stored = distance_matrix.distance_matrix
+            if backend == "sparse":
+                stored_bytes = (
+                    stored.data.nbytes + stored.indices.nbytes + stored.indptr.nbytes
+                )
+            else:
+                stored_bytes = stored.nbytes
+            results[(n, backend)] = {
+                "secs": secs,
+                "peak_mb": peak / 1e6,
+                "stored_mb": stored_bytes / 1e6,
+            }
+        np.testing.assert_array_equal(labels["dense"], labels["sparse"])
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
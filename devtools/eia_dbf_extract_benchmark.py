@@ -0,0 +1,95 @@
+#! /usr/bin/env python
+"""Compare parsing DBF sources directly against round tripping them through Excel.
+
+Every page and year of the EIA-860 partitions which are still distributed as DBF files
+is read from the datastore and then parsed into a DataFrame both ways: by writing it to
+an in-memory Excel workbook and reading it back with :func:`pandas.read_excel`, as the
+Excel extractor used to, and directly with
+:func:`pudl.extract.excel.read_dataframe_sheet`. The results of both are checked to be
+identical. None of the EIA-923 partitions ship DBF sources, so only EIA-860 is covered.
+"""
+
+import argparse
+import pathlib
+import sys
+import time
+
+import pandas as pd
+
+import pudl
+from pudl.extract.eia860 import Extractor
+from pudl.extract.excel import read_dataframe_sheet
+from pudl.workspace.datastore import Datastore
+from pudl.workspace.setup import PudlPaths
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "years",
+        nargs="*",
+        type=int,
+        default=[2001, 2002, 2003],
+        help="EIA-860 years to benchmark.",
+    )
+    return parser.parse_args()
+
+
+def benchmark_page(
+    extractor: Extractor, page: str, year: int
+) -> dict[str, float] | None:
+    """Parse one DBF page both ways and report the time taken by each."""
+    filename = extractor.source_filename(page, year=year)
+    if pathlib.Path(filename).suffix.lower() != ".dbf":
+        return None
+    # Read the DBF file out of its archive before we start timing.
+    _, source = extractor.load_workbook(page, year=year)
+    kwargs = {
+        "skiprows": extractor._metadata.get_skiprows(page, year=year),
+        "skipfooter": extractor._metadata.get_skipfooter(page, year=year),
+        "dtype": extractor.get_dtypes(page, year=year),
+    }
+
+    start = time.perf_counter()
+    excel_df = pd.read_excel(
+        pudl.helpers.convert_df_to_excel_file(source, index=False),
+        sheet_name=0,
+        **kwargs,
+    )
+    excel_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    direct_df = read_dataframe_sheet(source, **kwargs)
+    direct_secs = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(direct_df, excel_df)
+    return {
+        "file": filename,
+        "rows": len(direct_df),
+        "excel_secs": excel_secs,
+        "direct_secs": direct_secs,
+        "speedup": excel_secs / direct_secs,
+    }
+
+
+def main(years: list[int]) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    extractor = Extractor(Datastore(local_cache_path=PudlPaths().input_dir))
+    results = {}
+    for year in years:
+        for page in extractor._metadata.get_all_pages():
+            if (result := benchmark_page(extractor, page, year)) is not None:
+                logger.info(f"Benchmarked {page} {year}")
+                results[(page, year)] = result
+    if not results:
+        logger.error(f"No DBF sources found for EIA-860 years {years}.")
+        return 1
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+"""Compare harvesting the EIA entity tables one column at a time and all at once.
+
+The clean EIA-860 and EIA-923 tables which feed the harvesting process are loaded from
+the outputs of a previous ETL run, so the full history is covered if the ETL was run
+with the full settings. Each entity is then harvested twice with
+:func:`pudl.transform.eia.harvest_entity_tables`: in debug mode, which harvests every
+column separately with :func:`pudl.transform.eia.occurrence_consistency`, and normally,
+which harvests most columns in a single pass with
+:func:`pudl.transform.eia.consistent_values`. The harvested tables are checked to be
+identical.
+"""
+
+import argparse
+import sys
+import time
+
+import pandas as pd
+
+import pudl
+from pudl.etl import defs
+from pudl.settings import EiaSettings
+from pudl.transform.eia import EiaEntity, harvest_entity_tables, harvested_entities
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "entities",
+        nargs="*",
+        choices=[entity.value for entity in EiaEntity],
+        default=[entity.value for entity in EiaEntity],
+        help="EIA entities to harvest.",
+    )
+    return parser.parse_args()
+
+
+def main(entities: list[str]) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    clean_dfs = {
+        key.path[-1]: defs.load_asset_value(key)
+        for key in harvested_entities[0].keys_by_input_name.values()
+    }
+    eia_settings = EiaSettings()
+    results = {}
+    for entity in map(EiaEntity, entities):
+        logger.info(f"Harvesting {entity.value}")
+        timings = {}
+        harvested = {}
+        for debug in (True, False):
+            start = time.perf_counter()
+            harvested[debug] = harvest_entity_tables(
+                entity, clean_dfs, eia_settings=eia_settings, debug=debug
+            )
+            timings[debug] = time.perf_counter() - start
+        for legacy_df, df in zip(
+            harvested[True][:2], harvested[False][:2], strict=True
+        ):
+            pd.testing.assert_frame_equal(df, legacy_df)
+        results[entity.value] = {
+            "entities": len(harvested[False][0]),
+            "annual_records": len(harvested[False][1]),
+            "per_column_secs": timings[True],
+            "single_pass_secs": timings[False],
+            "speedup": timings[True] / timings[False],
+        }
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,110 @@
+#! /usr/bin/env python
+"""Time recoding the coded columns of the EIA tables which have the most of them.
+
+For each of the EIA resources with the most columns that have an
+:class:`pudl.metadata.classes.Encoder`, a table of random known codes (and some nulls)
+is generated, and every coded column is recoded:
+
+* the way :meth:`Encoder.encode` used to, by rebuilding the code map, checking every
+  value against it, and mapping the column through it with :meth:`pandas.Series.map`;
+* with :meth:`Encoder.encode`, on object and categorical columns;
+* with :meth:`Encoder.encode_arrow`, on dictionary encoded Arrow arrays.
+
+The results of each method are checked to be the same as those of the old one.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import pudl
+from pudl.metadata.classes import Encoder, Package
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tables",
+        type=int,
+        default=5,
+        help="Number of EIA tables to benchmark.",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=1_000_000,
+        help="Number of rows of codes to generate for each table.",
+    )
+    return parser.parse_args()
+
+
+def legacy_encode(encoder: Encoder, col: pd.Series, dtype) -> pd.Series:
+    """Recode a column the way Encoder.encode did before it was vectorized."""
+    code_map = {code: code for code in encoder.df["code"]}
+    code_map.update(encoder.code_fixes)
+    code_map.update({code: pd.NA for code in encoder.ignored_codes})
+    unknown_codes = set(col.dropna()).difference(code_map)
+    if unknown_codes:
+        raise ValueError(f"Found unknown codes while encoding {col.name}")
+    return col.map(code_map).astype(dtype)
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(tables: int, rows: int) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    rng = np.random.default_rng(2024)
+    resources = sorted(
+        (
+            resource
+            for resource in Package.from_resource_ids().resources
+            if "eia" in resource.name
+        ),
+        key=lambda resource: -sum(
+            f.encoder is not None for f in resource.schema.fields
+        ),
+    )[:tables]
+
+    results = {}
+    for resource in resources:
+        timings = dict.fromkeys(["legacy", "object", "category", "arrow"], 0.0)
+        fields = [f for f in resource.schema.fields if f.encoder is not None]
+        for field in fields:
+            known_codes = np.array(list(field.encoder.code_map), dtype=object)
+            col = pd.Series(
+                known_codes[rng.integers(len(known_codes), size=rows)], name=field.name
+            ).mask(rng.random(rows) < 0.1)
+            dtype = field.to_pandas_dtype()
+            expected, secs = _timed(legacy_encode, field.encoder, col, dtype)
+            timings["legacy"] += secs
+            for kind, values in [("object", col), ("category", col.astype("category"))]:
+                actual, secs = _timed(field.encoder.encode, values, dtype=dtype)
+                timings[kind] += secs
+                pd.testing.assert_series_equal(actual, expected)
+            if len({type(code) for code in known_codes}) == 1:
+                array = pa.array(col, from_pandas=True).dictionary_encode()
+                actual, secs = _timed(field.encoder.encode_arrow, array, field.name)
+                timings["arrow"] += secs
+                pd.testing.assert_series_equal(
+                    actual.to_pandas().astype(dtype), expected, check_names=False
+                )
+        results[resource.name] = {"coded_columns": len(fields)} | {
+            f"{kind}_secs": secs for kind, secs in timings.items()
+        }
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,115 @@
+#! /usr/bin/env python
+"""Time enforcing the schemas of PUDL resources on conformant and raw dataframes.
+
+For each requested resource, a dataframe with random values of the right type and a
+unique primary key is generated, and :meth:`pudl.metadata.classes.Resource.enforce_schema`
+is timed on it twice: once when it already conforms to the schema, as it does when
+an IO manager reads or writes it, and once with its categorical and string columns
+turned back into plain objects, so that every one of them has to be converted. The
+primary key uniqueness check is also timed on its own, both with
+:meth:`pandas.DataFrame.duplicated` and with the hashed row check in
+:func:`pudl.metadata.helpers.has_duplicate_rows`.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import pudl
+from pudl.metadata.classes import Resource
+from pudl.metadata.helpers import has_duplicate_rows
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "resources",
+        nargs="*",
+        default=[
+            "core_eia923__monthly_generation_fuel",
+            "core_eia860__scd_generators",
+            "out_eia__yearly_generators",
+            "core_epacems__hourly_emissions",
+        ],
+        help="Names of the resources to benchmark.",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=200_000,
+        help="Number of rows to generate for each resource.",
+    )
+    return parser.parse_args()
+
+
+def random_frame(resource: Resource, rows: int, rng: np.random.Generator):
+    """Generate a conformant dataframe with a unique primary key.
+
+    Like real IDs, the values of each column are drawn from a limited set, and rows
+    with duplicate primary keys are dropped.
+    """
+    data = {}
+    for name, dtype in resource.to_pandas_dtypes().items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            data[name] = rng.choice(dtype.categories, size=rows)
+        elif dtype.startswith("datetime"):
+            data[name] = pd.Timestamp("1990-01-01") + pd.to_timedelta(
+                rng.integers(rows // 10, size=rows), unit="h"
+            )
+        elif dtype == "string":
+            data[name] = rng.integers(1000, size=rows).astype(str)
+        elif dtype == "boolean":
+            data[name] = rng.random(rows) < 0.5
+        else:
+            data[name] = rng.integers(rows // 10, size=rows)
+    df = pd.DataFrame(data).drop_duplicates(subset=resource.schema.primary_key)
+    return resource.format_df(df.reset_index(drop=True))
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(resources: list[str], rows: int) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    rng = np.random.default_rng(2024)
+    results = {}
+    for resource_id in resources:
+        resource = Resource.from_id(resource_id)
+        df = random_frame(resource, rows, rng)
+        raw_df = df.astype(
+            {
+                name: object
+                for name, dtype in df.dtypes.items()
+                if isinstance(dtype, pd.CategoricalDtype | pd.StringDtype)
+            }
+        )
+        conformant, conformant_secs = _timed(resource.enforce_schema, df)
+        converted, raw_secs = _timed(resource.enforce_schema, raw_df)
+        pd.testing.assert_frame_equal(conformant, converted)
+        pk = resource.schema.primary_key or []
+        duplicated, duplicated_secs = _timed(pd.DataFrame.duplicated, df[pk])
+        duplicated = duplicated.any()
+        hashed, hashed_secs = _timed(has_duplicate_rows, df[pk])
+        assert duplicated == hashed  # noqa: S101
+        results[resource_id] = {
+            "columns": len(df.columns),
+            "conformant_secs": conformant_secs,
+            "raw_secs": raw_secs,
+            "duplicated_secs": duplicated_secs,
+            "hashed_secs": hashed_secs,
+        }
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+"""Compare the pandas and Arrow readers for the quarterly EPA CEMS CSVs.
+
+Each requested year-quarter is read from the datastore with both
+:meth:`pudl.extract.epacems.EpaCemsDatastore.get_data_frame` and
+:meth:`pudl.extract.epacems.EpaCemsDatastore.get_record_batches`. Every read happens in
+a fresh subprocess so that the peak resident memory of each reader can be measured
+independently. The throughput in MB/s is based on the uncompressed size of the CSV.
+"""
+
+import argparse
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pandas as pd
+
+import pudl
+from pudl.extract.epacems import EpaCemsDatastore, EpaCemsPartition
+from pudl.workspace.datastore import Datastore
+from pudl.workspace.setup import PudlPaths
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "year_quarters",
+        nargs="+",
+        help="Year-quarters to benchmark, e.g. 2022q1.",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=64 * 2**20,
+        help="Number of bytes of CSV to decode into each Arrow record batch.",
+    )
+    return parser.parse_args()
+
+
+def _csv_size(ds: EpaCemsDatastore, partition: EpaCemsPartition) -> int:
+    with ds.datastore.get_zipfile_resource("epacems", **partition.get_filters()) as zf:
+        return zf.getinfo(str(partition.get_quarterly_file())).file_size
+
+
+def _read(reader: str, year_quarter: str, block_size: int) -> dict[str, float]:
+    """Read one quarter with one of the readers and report time and peak memory."""
+    ds = EpaCemsDatastore(Datastore(local_cache_path=PudlPaths().input_dir))
+    partition = EpaCemsPartition(year_quarter=year_quarter)
+    # Make sure the archive is cached locally before we start timing.
+    csv_size = _csv_size(ds, partition)
+
+    start = time.perf_counter()
+    if reader == "pandas":
+        rows = len(ds.get_data_frame(partition))
+    else:
+        rows = sum(
+            batch.num_rows
+            for batch in ds.get_record_batches(partition, block_size=block_size)
+        )
+    secs = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "mb_per_sec": csv_size / 2**20 / secs,
+        # ru_maxrss is reported in kilobytes on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+    }
+
+
+def main(year_quarters: list[str], block_size: int) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    results = {}
+    for year_quarter in year_quarters:
+        for reader in ("pandas", "arrow"):
+            logger.info(f"Reading {year_quarter} with the {reader} reader")
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=get_context("spawn")
+            ) as executor:
+                results[(year_quarter, reader)] = executor.submit(
+                    _read, reader, year_quarter, block_size
+                ).result()
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
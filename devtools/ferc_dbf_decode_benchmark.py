@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+"""Compare the columnar DBF decoder with record-by-record parsing by dbfread.
+
+Every table in the requested year of a FERC DBF dataset is decoded both with
+:func:`pudl.extract.dbf.dbf_to_dataframe` and with ``pd.DataFrame(iter(dbf))``, which
+is how the tables used to be read. The resulting dataframes are checked for equality
+and the rows per second achieved by each method are logged for every table.
+"""
+
+import argparse
+import sys
+import time
+
+import pandas as pd
+
+import pudl
+from pudl.extract.dbf import FercDbfReader, dbf_to_dataframe
+from pudl.workspace.datastore import Datastore
+from pudl.workspace.setup import PudlPaths
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "dataset",
+        choices=["ferc1", "ferc2", "ferc6", "ferc60"],
+        help="FERC DBF dataset to read.",
+    )
+    parser.add_argument("year", type=int, help="Year of the DBF archive to read.")
+    parser.add_argument(
+        "tables",
+        nargs="*",
+        help="Tables to benchmark. Defaults to all tables in the archive.",
+    )
+    return parser.parse_args()
+
+
+def benchmark_table(dbf) -> dict[str, float]:
+    """Decode one table both ways and report rows per second for each."""
+    start = time.perf_counter()
+    expected = pd.DataFrame(iter(dbf))
+    records_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df = dbf_to_dataframe(dbf)
+    columnar_secs = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(df, expected)
+    return {
+        "rows": len(df),
+        "records_rows_per_sec": len(df) / records_secs,
+        "columnar_rows_per_sec": len(df) / columnar_secs,
+        "speedup": records_secs / columnar_secs,
+    }
+
+
+def main(dataset: str, year: int, tables: list[str]) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    reader = FercDbfReader(Datastore(local_cache_path=PudlPaths().input_dir), dataset)
+    archive = reader.get_archive(year=year, data_format="dbf")
+    schema = archive.get_db_schema()
+    results = {}
+    for table in tables or reader.get_table_names():
+        if table not in schema:
+            logger.warning(f"Table {table} is missing from {dataset} {year}.")
+            continue
+        logger.info(f"Benchmarking {table}")
+        results[table] = benchmark_table(archive.get_table_dbf(table))
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,110 @@
+#! /usr/bin/env python
+"""Measure how often the PUDL ETL looks up resource metadata, and what caching saves.
+
+The lookups of shared resources in :func:`pudl.metadata.registry.get_resource` made
+while the PUDL Dagster definitions were loaded (by importing :mod:`pudl`) are counted,
+and so is the time it takes to preload the whole metadata registry. Unless
+``--startup-only`` is given, the requested job is then executed in process, counting
+the registry lookups and every resource built by
+:meth:`pudl.metadata.classes.Resource.from_id`. Afterwards each resource which was built
+is built again from scratch, to estimate how long the job spent building resources, and
+how long the registry lookups would have taken if every one of them had to build and
+validate the resource.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+
+import pandas as pd
+
+import pudl
+from pudl.etl import defs
+from pudl.metadata import registry
+from pudl.metadata.classes import Resource
+from pudl.metadata.resources import RESOURCE_METADATA
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--job",
+        default="etl_fast",
+        help="Name of the PUDL Dagster job to execute.",
+    )
+    parser.add_argument(
+        "--startup-only",
+        action="store_true",
+        help="Only load the Dagster definitions, without executing the job.",
+    )
+    return parser.parse_args()
+
+
+def count_from_id_calls() -> Counter:
+    """Count the calls to :meth:`Resource.from_id` by resource from now on."""
+    calls = Counter()
+    from_id = Resource.from_id.__func__
+
+    def counted_from_id(cls, x: str) -> Resource:
+        calls[x] += 1
+        return from_id(cls, x)
+
+    Resource.from_id = classmethod(counted_from_id)
+    return calls
+
+
+def main(job: str, startup_only: bool) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    startup_info = registry.get_resource.cache_info()
+    logger.info(
+        f"Loading the Dagster definitions made {startup_info.hits + startup_info.misses}"
+        f" registry lookups for {startup_info.misses} resources."
+    )
+    start = time.perf_counter()
+    registry.preload()
+    mean_build_secs = (time.perf_counter() - start) / len(RESOURCE_METADATA)
+    logger.info(
+        f"Preloaded the metadata registry in {time.perf_counter() - start:.2f}s."
+    )
+    if startup_only:
+        return 0
+
+    calls = count_from_id_calls()
+    hits = registry.get_resource.cache_info().hits
+    defs.get_job_def(job).execute_in_process()
+    hits = registry.get_resource.cache_info().hits - hits
+    logger.info(
+        f"The {job} job made {hits} registry lookups, which would take about "
+        f"{hits * mean_build_secs:.2f}s if every one of them built the resource."
+    )
+    if not calls:
+        logger.info(f"The {job} job made no Resource.from_id() calls.")
+        return 0
+
+    results = {}
+    for resource_id, num_calls in calls.items():
+        start = time.perf_counter()
+        Resource(**Resource.dict_from_id(resource_id))
+        build_secs = time.perf_counter() - start
+        results[resource_id] = {
+            "calls": num_calls,
+            "build_secs": build_secs,
+            "total_secs": num_calls * build_secs,
+        }
+    df = pd.DataFrame.from_dict(results, orient="index").sort_values(
+        "total_secs", ascending=False
+    )
+    logger.info(f"Results:\n{df}")
+    logger.info(
+        f"{calls.total()} Resource.from_id() calls for {len(calls)} resources took "
+        f"about {df.total_secs.sum():.2f}s."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,89 @@
+#! /usr/bin/env python
+"""Measure the throughput of cleaning the utility names used in record linkage.
+
+The FERC Form 1 and EIA utility name columns are read from the PUDL Parquet outputs
+(``$PUDL_OUTPUT/parquet``), so you need to have run the ETL with Parquet output
+enabled first. Each column is cleaned with
+:class:`pudl.analysis.record_linkage.name_cleaner.CompanyNameCleaner` one name at a
+time with :meth:`pandas.Series.apply` on a sample of the rows, extrapolated to the
+whole column, and with :meth:`pudl.analysis.record_linkage.name_cleaner.CompanyNameCleaner.clean_names`
+three ways: with an empty memo, with the names already memoized in memory, and with
+the names memoized only on disk, as they are at the start of a new run. The
+throughput of each is reported in names per second.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import pudl
+from pudl.analysis.record_linkage import name_cleaner
+from pudl.analysis.record_linkage.name_cleaner import CompanyNameCleaner
+from pudl.workspace.setup import PudlPaths
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+COLUMNS = {
+    "out_ferc1__yearly_all_plants": "utility_name_ferc1",
+    "out_eia__yearly_plant_parts": "utility_name_eia",
+}
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=5_000,
+        help="Number of rows to clean one name at a time.",
+    )
+    return parser.parse_args()
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_column(names: pd.Series, sample: int, memo_dir: Path) -> dict:
+    """Clean a column of names in each way and report names per second."""
+    name_cleaner._CLEAN_NAMES_MEMO.clear()
+    cleaner = CompanyNameCleaner(memo_dir=memo_dir)
+    sample = names.head(sample)
+    rowwise, rowwise_secs = _timed(sample.apply, cleaner.get_clean_data)
+    secs = {"rowwise": rowwise_secs * len(names) / len(sample)}
+
+    name_cleaner._CLEAN_NAMES_MEMO.clear()
+    for path in memo_dir.glob("*.parquet"):
+        path.unlink()
+    clean, secs["cold"] = _timed(cleaner.clean_names, names)
+    pd.testing.assert_series_equal(clean.head(len(sample)), rowwise)
+    _, secs["memoized"] = _timed(cleaner.clean_names, names)
+    name_cleaner._CLEAN_NAMES_MEMO.clear()
+    _, secs["from_disk"] = _timed(cleaner.clean_names, names)
+    return {"names": len(names), "distinct_names": names.nunique()} | {
+        f"{method}_names_per_sec": len(names) / s for method, s in secs.items()
+    }
+
+
+def main(sample: int) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    results = {}
+    with tempfile.TemporaryDirectory() as memo_dir:
+        for table, column in COLUMNS.items():
+            names = pd.read_parquet(PudlPaths().parquet_path(table), columns=[column])[
+                column
+            ]
+            results[column] = benchmark_column(names, sample, Path(memo_dir))
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+"""Compare the SQLite IO manager bulk loader against :meth:`pandas.DataFrame.to_sql`.
+
+The largest tables found in the PUDL Parquet outputs (``$PUDL_OUTPUT/parquet``) are
+read into memory and then written to fresh, empty SQLite databases both ways, so you
+need to have run the ETL with Parquet output enabled first. Rows per second for each
+method are logged for every table.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import sqlalchemy as sa
+from dagster import AssetKey, build_output_context
+
+import pudl
+from pudl.io_managers import SQLiteIOManager
+from pudl.metadata.classes import Package, Resource
+from pudl.metadata.resources import RESOURCE_METADATA
+from pudl.workspace.setup import PudlPaths
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "tables",
+        nargs="*",
+        help="Tables to benchmark. Defaults to the largest available tables.",
+    )
+    parser.add_argument(
+        "-n",
+        "--num-tables",
+        type=int,
+        default=5,
+        help="Number of tables to benchmark if none are named explicitly.",
+    )
+    return parser.parse_args()
+
+
+def largest_tables(num_tables: int) -> list[str]:
+    """Find the largest tables which have a Parquet output and a SQLite schema."""
+    sizes = {
+        name: PudlPaths().parquet_path(name).stat().st_size
+        for name, meta in RESOURCE_METADATA.items()
+        if meta.get("create_database_schema", True)
+        and PudlPaths().parquet_path(name).exists()
+    }
+    return sorted(sizes, key=sizes.get, reverse=True)[:num_tables]
+
+
+def _empty_db(path: Path, md: sa.MetaData, table_name: str) -> sa.Engine:
+    engine = sa.create_engine(f"sqlite:///{path}")
+    md.create_all(engine, tables=[md.tables[table_name]])
+    return engine
+
+
+def benchmark_table(
+    table_name: str, md: sa.MetaData, tmp_dir: Path
+) -> dict[str, float]:
+    """Load one table with both methods and report rows per second for each."""
+    res = Resource.from_id(table_name)
+    df = res.enforce_schema(pd.read_parquet(PudlPaths().parquet_path(table_name)))
+    sa_table = md.tables[table_name]
+
+    engine = _empty_db(tmp_dir / f"{table_name}_to_sql.sqlite", md, table_name)
+    start = time.perf_counter()
+    with engine.begin() as con:
+        df.to_sql(
+            table_name,
+            con,
+            if_exists="append",
+            index=False,
+            chunksize=100_000,
+            dtype={c.name: c.type for c in sa_table.columns},
+        )
+    to_sql_secs = time.perf_counter() - start
+
+    _empty_db(tmp_dir / f"{table_name}_bulk.sqlite", md, table_name)
+    manager = SQLiteIOManager(base_dir=tmp_dir, db_name=f"{table_name}_bulk", md=md)
+    start = time.perf_counter()
+    manager.handle_output(build_output_context(asset_key=AssetKey(table_name)), df)
+    bulk_secs = time.perf_counter() - start
+
+    return {
+        "rows": len(df),
+        "to_sql_rows_per_sec": len(df) / to_sql_secs,
+        "bulk_rows_per_sec": len(df) / bulk_secs,
+        "speedup": to_sql_secs / bulk_secs,
+    }
+
+
+def main(tables: list[str], num_tables: int) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    if not tables:
+        tables = largest_tables(num_tables)
+    if not tables:
+        logger.error(f"No Parquet outputs found in {PudlPaths().parquet_path()}.")
+        return 1
+
+    md = Package.from_resource_ids().to_sql()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for table_name in tables:
+            logger.info(f"Benchmarking {table_name}")
+            results[table_name] = benchmark_table(table_name, md, Path(tmp_dir))
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
@@ -0,0 +1,127 @@
+#! /usr/bin/env python
+"""Compare the throughput of the Jaro-Winkler string similarity scorers.
+
+For each number of pairs, random plant names are generated from a limited vocabulary
+of words, so that like real record linkage comparisons many pairs of names occur more
+than once. The pairs are scored by applying
+:func:`jellyfish.jaro_winkler_similarity` row by row, as the
+:class:`pudl.analysis.record_linkage.embed_dataframe.StringSimilarityScorer` used to,
+and with :func:`pudl.analysis.record_linkage.embed_dataframe.jaro_winkler_similarities`
+in one thread, in several threads, and again once the scores are cached. The
+throughput of each scorer is reported in pairs per second, and the scores are checked
+to be identical.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from jellyfish import jaro_winkler_similarity
+
+import pudl
+from pudl.analysis.record_linkage.embed_dataframe import jaro_winkler_similarities
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+WORDS = [
+    "barry",
+    "bartow",
+    "bowen",
+    "brown",
+    "hammond",
+    "harris",
+    "mc intosh",
+    "smith",
+    "county",
+    "energy",
+    "center",
+    "generating",
+    "station",
+    "plant",
+    "unit",
+    "steam",
+    "hydro",
+    "solar",
+    "wind",
+    "farm",
+]
+
+
+def _parse():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "pairs",
+        nargs="*",
+        type=int,
+        default=[10_000, 100_000, 1_000_000],
+        help="Numbers of pairs of strings to score.",
+    )
+    parser.add_argument(
+        "--names",
+        type=int,
+        default=5_000,
+        help="Number of distinct names in each column.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of threads to score the pairs with.",
+    )
+    return parser.parse_args()
+
+
+def random_names(size: int, names: int, rng: np.random.Generator) -> pd.Series:
+    """Draw names made of 1 to 4 random words from a vocabulary of distinct names."""
+    vocabulary = np.array(
+        [" ".join(rng.choice(WORDS, size=rng.integers(1, 5))) for _ in range(names)],
+        dtype=object,
+    )
+    return pd.Series(rng.choice(vocabulary, size=size))
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(pairs: list[int], names: int, workers: int) -> int:
+    """Run the benchmark and log the results."""
+    pudl.logging_helpers.configure_root_logger()
+    rng = np.random.default_rng(2024)
+    # Compile the kernel before timing it
+    jaro_winkler_similarities(pd.Series(["barry"]), pd.Series(["bary"]), cache=False)
+    results = {}
+    for n in pairs:
+        df = pd.DataFrame(
+            {"left": random_names(n, names, rng), "right": random_names(n, names, rng)}
+        )
+        distinct = len(df.drop_duplicates())
+        expected, apply_secs = _timed(
+            df.apply,
+            lambda row: jaro_winkler_similarity(row["left"], row["right"]),
+            axis=1,
+        )
+        secs = {"apply": apply_secs}
+        for scorer, kwargs in [
+            ("batch", {"workers": 1, "cache": False}),
+            ("threads", {"workers": workers, "cache": False}),
+            ("uncached", {"workers": workers}),
+            ("cached", {"workers": workers}),
+        ]:
+            actual, secs[scorer] = _timed(
+                jaro_winkler_similarities, df.left, df.right, **kwargs
+            )
+            pd.testing.assert_series_equal(actual, expected, check_exact=True)
+        results[n] = {"distinct_pairs": distinct} | {
+            f"{scorer}_pairs_per_sec": n / s for scorer, s in secs.items()
+        }
+    logger.info(f"Results:\n{pd.DataFrame.from_dict(results, orient='index')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(**vars(_parse())))
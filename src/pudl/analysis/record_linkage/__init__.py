@@ -1,6 +1,7 @@
 """This module implements models for various forms of record linkage."""
 
 from . import (
+    blocking,
     classify_plants_ferc1,
     eia_ferc1_model_config,
     eia_ferc1_record_linkage,
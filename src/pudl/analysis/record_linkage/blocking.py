@@ -0,0 +1,263 @@
+"""Generate candidate pairs of records to compare with blocking rules.
+
+Comparing every record in one dataframe with every record in another takes time
+quadratic in the number of records, even though almost all of the pairs are obviously
+not matches. Blocking restricts the comparisons to pairs of records which agree on at
+least one :class:`BlockingRule`, i.e. which have the same values for each of the
+rule's :class:`BlockingKey` s, like the same report year and the same first few
+characters of the plant name.
+
+:func:`candidate_pairs` finds the pairs with hashed joins in pandas, and reports how
+many pairs each rule finds and how much blocking reduces the number of comparisons.
+Rules which only use exact, prefix and window keys can also be converted to SQL with
+:meth:`BlockingRule.to_sql`, e.g. so that :mod:`splink` can apply the same rules in
+DuckDB.
+"""
+
+from dataclasses import dataclass
+from typing import Literal
+
+import jellyfish
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+import pudl
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+class BlockingKey(BaseModel):
+    """A value derived from a column which records must share to be compared.
+
+    Records with a missing value in the column never share the key.
+    """
+
+    column: str
+    #: How the key is derived from the column:
+    #:
+    #: * ``exact``: the value itself.
+    #: * ``prefix``: the first ``size`` characters of the value.
+    #: * ``ngram``: every ``size`` character substring of the value. Records share
+    #:   the key if they have any n-gram in common.
+    #: * ``metaphone``: the metaphone code of the value, or its first ``size``
+    #:   characters if ``size`` is positive.
+    #: * ``window``: the integer value, which records share if their values differ by
+    #:   at most ``size``, e.g. report years within a few years of each other.
+    method: Literal["exact", "prefix", "ngram", "metaphone", "window"] = "exact"
+    size: int = 0
+
+    def __str__(self) -> str:
+        """Describe the key, like the SQL it's equivalent to."""
+        if self.method == "exact":
+            return self.column
+        return f"{self.method}({self.column}, {self.size})"
+
+    def to_sql(self) -> str:
+        """Return a SQL condition comparing the key of records ``l`` and ``r``."""
+        if self.method == "exact":
+            return f"l.{self.column} = r.{self.column}"
+        if self.method == "prefix":
+            return (
+                f"substr(l.{self.column},1,{self.size}) = "
+                f"substr(r.{self.column},1,{self.size})"
+            )
+        if self.method == "window":
+            return (
+                f"l.{self.column} between r.{self.column} - {self.size} "
+                f"and r.{self.column} + {self.size}"
+            )
+        raise ValueError(f"Can't express {self.method} blocking keys in SQL.")
+
+    def values(self, col: pd.Series) -> pd.Series:
+        """Derive the key from the values in a column.
+
+        Each distinct value is only transformed once.
+
+        Returns:
+            The key values, indexed by the position of the record they belong to.
+            Records may have several values, or none at all if theirs is missing.
+
+        Raises:
+            ValueError: if a window key is derived from a column which isn't of an
+                integer type.
+        """
+        if self.method == "window" and not pd.api.types.is_integer_dtype(col):
+            # The window is found by joining on each value offset by whole numbers,
+            # which only agrees with the SQL range condition for integers.
+            raise ValueError(
+                f"Window blocking keys need an integer column, but {col.name} is "
+                f"{col.dtype}."
+            )
+        col = col.reset_index(drop=True).dropna()
+        if self.method in ("exact", "window"):
+            return col
+        codes, uniques = pd.factorize(col)
+        uniques = pd.Series(uniques, dtype=object)
+        if self.method == "prefix":
+            keys = uniques.astype(str).str[: self.size]
+        elif self.method == "metaphone":
+            keys = uniques.astype(str).map(jellyfish.metaphone)
+            if self.size:
+                keys = keys.str[: self.size]
+        else:
+            keys = uniques.astype(str).map(
+                lambda value: sorted(
+                    {
+                        value[i : i + self.size]
+                        for i in range(len(value) - self.size + 1)
+                    }
+                )
+            )
+        values = pd.Series(keys.to_numpy()[codes], index=col.index)
+        if self.method == "ngram":
+            values = values.explode().dropna()
+        return values
+
+
+class BlockingRule(BaseModel):
+    """Records are compared if they share all of a set of blocking keys."""
+
+    keys: list[BlockingKey]
+    #: Skip blocks with more pairs of records than this. Blocks on very common keys,
+    #: like short n-grams, can contain most of the records, and add many pairs which
+    #: are unlikely to match.
+    max_block_pairs: int | None = None
+
+    def __str__(self) -> str:
+        """Describe the rule by its keys."""
+        return " & ".join(str(key) for key in self.keys)
+
+    def to_sql(self) -> str:
+        """Return the rule as a SQL condition on records ``l`` and ``r``.
+
+        This is the format of :mod:`splink` blocking rules.
+        """
+        return " and ".join(key.to_sql() for key in self.keys)
+
+
+@dataclass
+class CandidatePairs:
+    """The pairs of records which agree on any of a set of blocking rules."""
+
+    #: Positions of the records in each pair, in columns ``left`` and ``right``.
+    pairs: pd.DataFrame
+    #: Number of pairs found by each rule. Pairs can be found by several rules.
+    rule_pairs: dict[str, int]
+    #: Number of pairs which would be compared without blocking.
+    total_pairs: int
+
+    @property
+    def reduction_ratio(self) -> float:
+        """The fraction of comparisons which blocking avoids."""
+        if not self.total_pairs:
+            return 0.0
+        return 1 - len(self.pairs) / self.total_pairs
+
+
+def _block_ids(
+    rule: BlockingRule, left: pd.DataFrame, right: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Find the blocks each record of the left and right dataframes belongs to.
+
+    Each key is factorized across both dataframes, so that equal values of different
+    types (e.g. integers and floats) share a code, and the codes of all the keys are
+    hashed into a single block ID.
+    """
+    left_keys = pd.DataFrame(index=pd.RangeIndex(len(left)))
+    right_keys = pd.DataFrame(index=pd.RangeIndex(len(right)))
+    for i, key in enumerate(rule.keys):
+        left_values = key.values(left[key.column])
+        right_values = key.values(right[key.column])
+        if key.method == "window":
+            # Expand the left values to every value within the window, so that
+            # matching values can be found with an exact join.
+            offsets = np.arange(-key.size, key.size + 1)
+            left_values = pd.Series(
+                np.repeat(left_values.to_numpy(), len(offsets))
+                + np.tile(offsets, len(left_values)),
+                index=np.repeat(left_values.index, len(offsets)),
+            )
+        codes, _ = pd.factorize(
+            pd.concat([left_values, right_values], ignore_index=True)
+        )
+        left_keys = left_keys.join(
+            pd.Series(codes[: len(left_values)], index=left_values.index, name=i),
+            how="inner",
+        )
+        right_keys = right_keys.join(
+            pd.Series(codes[len(left_values) :], index=right_values.index, name=i),
+            how="inner",
+        )
+    return tuple(
+        pd.DataFrame(
+            {
+                "record": keys.index.to_numpy(),
+                "block": pd.util.hash_pandas_object(keys, index=False).to_numpy(),
+            }
+        ).drop_duplicates()
+        for keys in (left_keys, right_keys)
+    )
+
+
+def _rule_pairs(
+    rule: BlockingRule, left: pd.DataFrame, right: pd.DataFrame, dedupe: bool
+) -> pd.DataFrame:
+    """Find the pairs of records which agree on a blocking rule."""
+    left_blocks, right_blocks = _block_ids(rule, left, right)
+    if rule.max_block_pairs is not None:
+        block_pairs = left_blocks.block.value_counts().mul(
+            right_blocks.block.value_counts(), fill_value=0
+        )
+        too_big = block_pairs.index[block_pairs > rule.max_block_pairs]
+        if len(too_big):
+            logger.info(
+                f"Skipping {len(too_big)} blocks with more than "
+                f"{rule.max_block_pairs} pairs for blocking rule {rule}."
+            )
+            left_blocks = left_blocks[~left_blocks.block.isin(too_big)]
+    pairs = left_blocks.merge(right_blocks, on="block", suffixes=("_left", "_right"))
+    pairs = pairs.rename(columns={"record_left": "left", "record_right": "right"})
+    if dedupe:
+        pairs = pairs[pairs.left < pairs.right]
+    return pairs[["left", "right"]].drop_duplicates()
+
+
+def candidate_pairs(
+    left: pd.DataFrame,
+    rules: list[BlockingRule],
+    right: pd.DataFrame | None = None,
+) -> CandidatePairs:
+    """Find the pairs of records which agree on any of the blocking rules.
+
+    Args:
+        left: Records to link.
+        rules: Blocking rules. Pairs of records which agree on any of the rules are
+            candidates for comparison.
+        right: Records to link with those in ``left``. If not given, the records in
+            ``left`` are linked with each other, and each pair of records is only
+            returned once, with the ``left`` record first.
+
+    Returns:
+        The candidate pairs of records, by their positions in ``left`` and ``right``,
+        and statistics about how much blocking reduced the comparisons.
+    """
+    dedupe = right is None
+    right = left if dedupe else right
+    rule_pairs = {str(rule): _rule_pairs(rule, left, right, dedupe) for rule in rules}
+    pairs = (
+        pd.concat(rule_pairs.values(), ignore_index=True)
+        .drop_duplicates()
+        .sort_values(["left", "right"], ignore_index=True)
+    )
+    total_pairs = len(left) * (len(left) - 1) // 2 if dedupe else len(left) * len(right)
+    candidates = CandidatePairs(
+        pairs=pairs,
+        rule_pairs={rule: len(df) for rule, df in rule_pairs.items()},
+        total_pairs=total_pairs,
+    )
+    logger.info(
+        f"Blocking found {len(pairs)} candidate pairs of {total_pairs} possible, a "
+        f"reduction ratio of {candidates.reduction_ratio:.6f}."
+    )
+    return candidates
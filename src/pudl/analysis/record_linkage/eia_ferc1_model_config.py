@@ -8,30 +8,80 @@ model.
 import splink.duckdb.comparison_level_library as cll
 import splink.duckdb.comparison_library as cl
 import splink.duckdb.comparison_template_library as ctl
-from splink.duckdb.blocking_rule_library import block_on
 
-blocking_rule_1 = "l.report_year = r.report_year and substr(l.plant_name_mphone,1,3) = substr(r.plant_name_mphone,1,3)"
-blocking_rule_2 = "l.report_year = r.report_year and substr(l.utility_name_mphone,1,2) = substr(r.utility_name_mphone,1,2) and substr(l.plant_name_mphone,1,2) = substr(r.plant_name_mphone,1,2)"
-blocking_rule_3 = "l.report_year = r.report_year and l.installation_year = r.installation_year and substr(l.utility_name_mphone,1,2) = substr(r.utility_name_mphone,1,2)"
-blocking_rule_4 = "l.report_year = r.report_year and l.fuel_type_code_pudl = r.fuel_type_code_pudl and substr(l.plant_name_mphone,1,2) = substr(r.plant_name_mphone,1,2)"
-blocking_rule_5 = "l.report_year = r.report_year and l.fuel_type_code_pudl = r.fuel_type_code_pudl and substr(l.utility_name_mphone,1,3) = substr(r.utility_name_mphone,1,3)"
-blocking_rule_6 = "l.report_year = r.report_year and l.construction_year = r.construction_year and substr(l.utility_name_mphone,1,2) = substr(r.utility_name_mphone,1,2)"
-blocking_rule_7 = "l.report_year = r.report_year and l.capacity_mw = r.capacity_mw and substr(l.plant_name_mphone,1,2) = substr(r.plant_name_mphone,1,2)"
-blocking_rule_8 = "l.report_year = r.report_year and l.installation_year = r.installation_year and substr(l.plant_name_mphone,1,2) = substr(r.plant_name_mphone,1,2)"
-blocking_rule_9 = "l.report_year = r.report_year and l.construction_year = r.construction_year and substr(l.plant_name_mphone,1,2) = substr(r.plant_name_mphone,1,2)"
-blocking_rule_10 = block_on(["report_year", "net_generation_mwh"])
+from pudl.analysis.record_linkage.blocking import BlockingKey, BlockingRule
+
+
+def _prefix(column: str, size: int) -> BlockingKey:
+    return BlockingKey(column=column, method="prefix", size=size)
+
+
+_REPORT_YEAR = BlockingKey(column="report_year")
 BLOCKING_RULES = [
-    blocking_rule_1,
-    blocking_rule_2,
-    blocking_rule_3,
-    blocking_rule_4,
-    blocking_rule_5,
-    blocking_rule_6,
-    blocking_rule_7,
-    blocking_rule_8,
-    blocking_rule_9,
-    blocking_rule_10,
+    BlockingRule(keys=[_REPORT_YEAR, _prefix("plant_name_mphone", 3)]),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            _prefix("utility_name_mphone", 2),
+            _prefix("plant_name_mphone", 2),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            BlockingKey(column="installation_year"),
+            _prefix("utility_name_mphone", 2),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            BlockingKey(column="fuel_type_code_pudl"),
+            _prefix("plant_name_mphone", 2),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            BlockingKey(column="fuel_type_code_pudl"),
+            _prefix("utility_name_mphone", 3),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            BlockingKey(column="construction_year"),
+            _prefix("utility_name_mphone", 2),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            BlockingKey(column="capacity_mw"),
+            _prefix("plant_name_mphone", 2),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            BlockingKey(column="installation_year"),
+            _prefix("plant_name_mphone", 2),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            _REPORT_YEAR,
+            BlockingKey(column="construction_year"),
+            _prefix("plant_name_mphone", 2),
+        ]
+    ),
+    BlockingRule(keys=[_REPORT_YEAR, BlockingKey(column="net_generation_mwh")]),
 ]
+"""Pairs of records which agree on any of these rules are compared by the model.
+
+See :mod:`pudl.analysis.record_linkage.blocking`. They are passed to :mod:`splink` as
+SQL with :meth:`BlockingRule.to_sql`.
+"""
 
 plant_name_comparison = ctl.name_comparison(
     "plant_name",
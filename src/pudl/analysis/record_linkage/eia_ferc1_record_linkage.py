@@ -29,18 +29,21 @@ plant-parts.
 """
 
 import importlib
+import importlib.metadata
+import os
+from pathlib import Path
 from typing import Literal
 
 import jellyfish
 import mlflow
 import numpy as np
 import pandas as pd
-from dagster import Out, graph, op
+from dagster import Config, Out, graph, op
 from splink.duckdb.linker import DuckDBLinker
 
 import pudl
 from pudl.analysis.ml_tools import experiment_tracking, models
-from pudl.analysis.record_linkage import embed_dataframe, name_cleaner
+from pudl.analysis.record_linkage import blocking, embed_dataframe, name_cleaner
 from pudl.analysis.record_linkage.eia_ferc1_inputs import (
     InputManager,
     restrict_train_connections_on_date_range,
@@ -171,23 +174,104 @@ def get_input_dfs(inputs):
     return eia_df, ferc_df
 
 
-@op
-def prepare_for_matching(df, transformed_df):
-    """Prepare the input dataframes for matching with splink."""
+#: Phonetic features derived from the cleaned plant and utility names, by the suffix
+#: of the columns they're stored in.
+NAME_FEATURES = {"mphone": jellyfish.metaphone}
+
+#: Version of :mod:`jellyfish` used to compute the name features.
+JELLYFISH_VERSION = importlib.metadata.version("jellyfish")
+
+
+def get_name_features(names: pd.Series, cache_dir: Path | None = None) -> pd.DataFrame:
+    """Compute the phonetic features of each distinct name.
+
+    Names repeat across years and plant parts, so the features are only computed
+    once for each distinct name. If a ``cache_dir`` is given, features of names
+    which are already in the Parquet feature table there are read from it instead, and
+    the features of new names are added to it. The table is keyed by the version of
+    :mod:`jellyfish`, so features computed by another version are never reused.
+
+    Args:
+        names: Cleaned names. Null names are ignored.
+        cache_dir: Directory to keep the Parquet table of the features, keyed by
+            name, in.
+
+    Returns:
+        The features of each distinct name, indexed by name, with a column for each of
+        :data:`NAME_FEATURES`.
+    """
+    names = pd.Index(names.dropna().unique(), name="name")
+    features = pd.DataFrame(
+        columns=list(NAME_FEATURES), index=pd.Index([], name="name"), dtype=object
+    )
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = (
+            Path(cache_dir) / f"name_features_jellyfish_{JELLYFISH_VERSION}.parquet"
+        )
+    if cache_path is not None and cache_path.exists():
+        cached = pd.read_parquet(cache_path).set_index("name")
+        # Features which have been added or removed since the table was written mean
+        # it has to be rebuilt.
+        if set(cached.columns) == set(NAME_FEATURES):
+            features = cached[list(NAME_FEATURES)]
+    new_names = names.difference(features.index)
+    logger.info(
+        f"Computing name features for {len(new_names)} new names of {len(names)} "
+        "distinct names."
+    )
+    if len(new_names):
+        features = pd.concat(
+            [
+                features,
+                pd.DataFrame(
+                    {
+                        feature: new_names.map(func)
+                        for feature, func in NAME_FEATURES.items()
+                    },
+                    index=new_names,
+                ),
+            ]
+        )
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so a partially written table is never
+            # read.
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            features.reset_index().to_parquet(tmp_path, index=False)
+            tmp_path.replace(cache_path)
+    return features.reindex(names)
+
 
-    def _get_metaphone(row, col_name):
-        if pd.isnull(row[col_name]):
-            return None
-        return jellyfish.metaphone(row[col_name])
+class PrepareForMatchingConfig(Config):
+    """Configuration for preparing records for matching."""
 
+    #: Directory to keep the name features in, so that in later runs they're only
+    #: computed for new names. If not set, the features are computed for every name.
+    name_features_cache_dir: str | None = None
+
+
+@op
+def prepare_for_matching(config: PrepareForMatchingConfig, df, transformed_df):
+    """Prepare the input dataframes for matching with splink."""
     # replace old cols with transformed cols
     for col in transformed_df.columns:
         orig_col_name = col.split("__")[1]
         df[orig_col_name] = transformed_df[col]
     df["installation_year"] = pd.to_datetime(df["installation_year"], format="%Y")
     df["construction_year"] = pd.to_datetime(df["construction_year"], format="%Y")
-    df["plant_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("plant_name",))
-    df["utility_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("utility_name",))
+    name_cols = ["plant_name", "utility_name"]
+    features = get_name_features(
+        pd.concat([df[col] for col in name_cols]),
+        cache_dir=(
+            None
+            if config.name_features_cache_dir is None
+            else Path(config.name_features_cache_dir)
+        ),
+    )
+    for col in name_cols:
+        for feature in NAME_FEATURES:
+            df[f"{col}_{feature}"] = df[col].map(features[feature])
     cols = ID_COL + MATCHING_COLS + EXTRA_COLS
     df = df.loc[:, cols]
     return df
@@ -208,15 +292,31 @@ def get_training_data_df(inputs):
     return train_df
 
 
+def _log_blocking_metrics(eia_df: pd.DataFrame, ferc_df: pd.DataFrame) -> None:
+    """Log how many pairs of records the blocking rules leave to be compared."""
+    candidates = blocking.candidate_pairs(eia_df, BLOCKING_RULES, right=ferc_df)
+    mlflow.log_metrics(
+        {
+            "candidate_pairs": len(candidates.pairs),
+            "blocking_reduction_ratio": candidates.reduction_ratio,
+        }
+    )
+
+
 @op
 def get_model_predictions(eia_df, ferc_df, train_df, experiment_tracker):
     """Train splink model and output predicted matches."""
+    # The pairs are only found to log how well the rules block, so they're only
+    # found if experiment tracking is enabled.
+    experiment_tracker.execute_logging(lambda: _log_blocking_metrics(eia_df, ferc_df))
     settings_dict = {
         "link_type": "link_only",
         "unique_id_column_name": "record_id",
         "additional_columns_to_retain": ["plant_id_pudl", "utility_id_pudl"],
         "comparisons": COMPARISONS,
-        "blocking_rules_to_generate_predictions": BLOCKING_RULES,
+        "blocking_rules_to_generate_predictions": [
+            rule.to_sql() for rule in BLOCKING_RULES
+        ],
         "retain_matching_columns": True,
         "retain_intermediate_calculation_columns": True,
         "probability_two_random_records_match": 1 / len(eia_df),
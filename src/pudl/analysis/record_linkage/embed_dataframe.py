@@ -1,6 +1,7 @@
 """Tools for embedding a DataFrame to create feature matrix for models."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import mlflow
@@ -9,6 +10,7 @@ import pandas as pd
 import scipy
 from dagster import graph, op
 from jellyfish import jaro_winkler_similarity
+from numba import njit
 from pydantic import BaseModel
 from sklearn.base import BaseEstimator
 from sklearn.compose import ColumnTransformer
@@ -339,10 +341,199 @@ def _fill_fuel_type_from_name(
     return df[[fuel_type_col]]
 
 
-def _apply_string_similarity_func(df, function_key: str, col1: str, col2: str):
+#: Jaro-Winkler similarities of pairs of strings which have already been scored, indexed
+#: by a hash of the pair. Only the most recently scored pairs are kept.
+_JARO_WINKLER_CACHE = pd.Series(index=pd.Index([], dtype="uint64"), dtype="float64")
+_JARO_WINKLER_CACHE_SIZE = 1_000_000
+
+
+@njit(nogil=True)
+def _jaro_winkler_similarity(  # noqa: C901
+    s1: np.ndarray, s2: np.ndarray, flags1: np.ndarray, flags2: np.ndarray
+) -> float:
+    """Compute the Jaro-Winkler similarity of two strings of unicode code points.
+
+    This is the same algorithm as :func:`jellyfish.jaro_winkler_similarity`, and gives
+    identical results. ``flags1`` and ``flags2`` are scratch space, at least as long
+    as the strings, so that they don't need to be allocated for every pair.
+    """
+    len1, len2 = len(s1), len(s2)
+    if len1 == 0 or len2 == 0:
+        return 0.0
+    search_range = max(max(len1, len2) // 2 - 1, 0)
+    flags1[:len1] = False
+    flags2[:len2] = False
+    # Find the characters the strings have in common within the search range
+    common = 0
+    for i in range(len1):
+        for j in range(max(0, i - search_range), min(i + search_range + 1, len2)):
+            if not flags2[j] and s2[j] == s1[i]:
+                flags1[i] = True
+                flags2[j] = True
+                common += 1
+                break
+    if common == 0:
+        return 0.0
+    # Count the common characters which are out of order
+    transpositions = 0
+    k = 0
+    for i in range(len1):
+        if flags1[i]:
+            while not flags2[k]:
+                k += 1
+            if s1[i] != s2[k]:
+                transpositions += 1
+            k += 1
+    transpositions //= 2
+    weight = (common / len1 + common / len2 + (common - transpositions) / common) / 3
+    # Boost the similarity of strings with a common prefix of up to 4 characters
+    if weight > 0.7:
+        prefix = 0
+        while prefix < min(len1, len2, 4) and s1[prefix] == s2[prefix]:
+            prefix += 1
+        weight += prefix * 0.1 * (1.0 - weight)
+    return weight
+
+
+@njit(nogil=True)
+def _jaro_winkler_similarities(
+    chars: np.ndarray,
+    offsets: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    out: np.ndarray,
+):
+    """Compute the Jaro-Winkler similarities of pairs of encoded strings.
+
+    String ``i`` is ``chars[offsets[i]:offsets[i + 1]]``, and the similarity of strings
+    ``left[k]`` and ``right[k]`` is written to ``out[k]``. The GIL is released, so that
+    pairs can be scored in parallel threads.
+    """
+    max_len = 0
+    for i in range(len(offsets) - 1):
+        max_len = max(max_len, offsets[i + 1] - offsets[i])
+    flags1 = np.zeros(max_len, dtype=np.bool_)
+    flags2 = np.zeros(max_len, dtype=np.bool_)
+    for k in range(len(left)):
+        out[k] = _jaro_winkler_similarity(
+            chars[offsets[left[k]] : offsets[left[k] + 1]],
+            chars[offsets[right[k]] : offsets[right[k] + 1]],
+            flags1,
+            flags2,
+        )
+
+
+def _score_jaro_winkler(
+    left: np.ndarray, right: np.ndarray, workers: int = 1
+) -> np.ndarray:
+    """Compute the Jaro-Winkler similarities of pairs of strings with numba.
+
+    The strings are encoded once each as arrays of code points, and the pairs are
+    split between ``workers`` threads. :mod:`jellyfish` compares grapheme clusters
+    rather than code points, e.g. a flag emoji is a single character, so pairs of
+    strings which aren't plain ASCII are scored with it instead, to give the same
+    results.
+    """
+    codes, strings = pd.factorize(np.concatenate([left, right]))
+    left_codes, right_codes = codes[: len(left)], codes[len(left) :]
+    ascii_strings = np.array(
+        [string.isascii() and "\r\n" not in string for string in strings], dtype=bool
+    )
+    compiled = ascii_strings[left_codes] & ascii_strings[right_codes]
+
+    out = np.empty(len(left), dtype="float64")
+    out[~compiled] = [
+        jaro_winkler_similarity(s1, s2)
+        for s1, s2 in zip(left[~compiled], right[~compiled], strict=True)
+    ]
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(string) for string in strings], out=offsets[1:])
+    chars = np.frombuffer("".join(strings).encode("utf-32-le"), dtype=np.uint32)
+    left_codes, right_codes = left_codes[compiled], right_codes[compiled]
+    compiled_out = np.empty(len(left_codes), dtype="float64")
+    bounds = np.linspace(0, len(left_codes), max(workers, 1) + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [
+            executor.submit(
+                _jaro_winkler_similarities,
+                chars,
+                offsets,
+                left_codes[start:stop],
+                right_codes[start:stop],
+                compiled_out[start:stop],
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+            if stop > start
+        ]:
+            future.result()
+    out[compiled] = compiled_out
+    return out
+
+
+def jaro_winkler_similarities(
+    left: pd.Series, right: pd.Series, workers: int = 1, cache: bool = True
+) -> pd.Series:
+    """Compute the Jaro-Winkler similarity of each pair of strings in two columns.
+
+    The results are identical to applying :func:`jellyfish.jaro_winkler_similarity` to
+    each pair, but each distinct pair is only scored once, by a compiled kernel, and
+    the scores of recently seen pairs are cached by a hash of the pair, so that the
+    same names aren't scored again e.g. when a model is refit.
+
+    Args:
+        left: Strings to compare.
+        right: Strings to compare with those in ``left``, which it must be aligned with.
+        workers: Number of threads to score the pairs with.
+        cache: Whether to look up and store scores in the cache.
+
+    Returns:
+        The similarities, indexed like ``left``. Pairs where either string is missing
+        have a similarity of NaN.
+    """
+    missing = left.isna().to_numpy() | right.isna().to_numpy()
+    pairs = pd.DataFrame(
+        {"left": left.to_numpy(dtype=object), "right": right.to_numpy(dtype=object)}
+    )[~missing]
+    hashes = pd.util.hash_pandas_object(pairs, index=False).to_numpy()
+    codes, unique_hashes = pd.factorize(hashes)
+    # Codes are numbered in order of first appearance
+    first = np.flatnonzero(~pd.Series(codes).duplicated().to_numpy())
+
+    global _JARO_WINKLER_CACHE
+    if cache:
+        scores = _JARO_WINKLER_CACHE.reindex(unique_hashes).to_numpy()
+    else:
+        scores = np.full(len(unique_hashes), np.nan)
+    new = np.isnan(scores)
+    logger.debug(
+        f"Scoring {new.sum()} new pairs of strings of {len(unique_hashes)} distinct "
+        f"and {len(pairs)} total pairs."
+    )
+    if new.any():
+        scores[new] = _score_jaro_winkler(
+            pairs["left"].to_numpy()[first[new]],
+            pairs["right"].to_numpy()[first[new]],
+            workers=workers,
+        )
+        if cache:
+            _JARO_WINKLER_CACHE = pd.concat(
+                [
+                    _JARO_WINKLER_CACHE,
+                    pd.Series(scores[new], index=unique_hashes[new]),
+                ]
+            ).iloc[-_JARO_WINKLER_CACHE_SIZE:]
+
+    similarities = np.full(len(left), np.nan)
+    similarities[~missing] = scores[codes]
+    return pd.Series(similarities, index=left.index)
+
+
+def _apply_string_similarity_func(
+    df, function_key: str, col1: str, col2: str, workers: int = 1
+):
     function_transforms = {
-        "jaro_winkler": lambda df: df.apply(
-            lambda row: jaro_winkler_similarity(row[col1], row[col2]), axis=1
+        "jaro_winkler": lambda df: jaro_winkler_similarities(
+            df[col1], df[col2], workers=workers
         ).to_frame()
     }
 
@@ -350,18 +541,29 @@ def _apply_string_similarity_func(df, function_key: str, col1: str, col2: str):
 
 
 class StringSimilarityScorer(TransformStep):
-    """Vectorize two string columns with Jaro Winkler similarity."""
+    """Vectorize two string columns with Jaro Winkler similarity.
+
+    Each distinct pair of strings is only scored once, see
+    :func:`jaro_winkler_similarities`.
+    """
 
     name: str = "string_sim"
     metric: str
     col1: str
     col2: str
+    #: Number of threads to score the pairs of strings with.
+    workers: int = 1
 
     def as_transformer(self):
         """Return configured Jaro Winkler similarity function."""
         return FunctionTransformer(
             _apply_string_similarity_func,
-            kw_args={"function_key": self.metric, "col1": self.col1, "col2": self.col2},
+            kw_args={
+                "function_key": self.metric,
+                "col1": self.col1,
+                "col2": self.col2,
+                "workers": self.workers,
+            },
         )
 
 
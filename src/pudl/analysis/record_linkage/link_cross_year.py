@@ -1,16 +1,18 @@
 """Define a record linkage model interface and implement common functionality."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import mlflow
 import numpy as np
 import pandas as pd
+import scipy
 from dagster import Config, graph, op
 from numba import njit
 from numba.typed import List
 from sklearn.cluster import DBSCAN, AgglomerativeClustering
-from sklearn.metrics import pairwise_distances_chunked
+from sklearn.metrics import pairwise_distances, pairwise_distances_chunked
 from sklearn.neighbors import NearestNeighbors
 
 import pudl
@@ -30,9 +32,21 @@ class PenalizeReportYearDistanceConfig(Config):
     distance_penalty: float = 10000.0
     metric: str = "euclidean"
 
+    #: ``dense`` computes the distance between every pair of records, which takes time
+    #: and memory quadratic in the number of records. ``sparse`` only stores the
+    #: distances between records within ``radius`` of each other, see
+    #: :class:`SparseDistanceMatrix`.
+    backend: str = "dense"
+    #: Maximum distance between records stored by the ``sparse`` backend.
+    radius: float = 1.0
+
 
 class DistanceMatrix:
-    """Class to wrap a distance matrix saved in a np.memmap."""
+    """Class to wrap a distance matrix saved in a np.memmap.
+
+    The linkage steps only access the distances through the methods of this class, so
+    that :class:`SparseDistanceMatrix` can be used instead.
+    """
 
     def __init__(
         self,
@@ -61,10 +75,7 @@ class DistanceMatrix:
         # Apply distance penalty to records from the same year
         year_inds = original_df.groupby("report_year").indices
         for inds in year_inds.values():
-            matching_year_inds = np.array(np.meshgrid(inds, inds)).T.reshape(-1, 2)
-            self.distance_matrix[matching_year_inds[:, 0], matching_year_inds[:, 1]] = (
-                config.distance_penalty
-            )
+            self.distance_matrix[np.ix_(inds, inds)] = config.distance_penalty
 
         np.fill_diagonal(self.distance_matrix, 0)
         self.distance_matrix.flush()
@@ -77,6 +88,180 @@ class DistanceMatrix:
             shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
         )
 
+    def radius_neighbors_graph(self, radius: float) -> scipy.sparse.csr_matrix:
+        """Return a sparse matrix of the distances between records within radius."""
+        neighbor_computer = NearestNeighbors(radius=radius, metric="precomputed")
+        neighbor_computer.fit(self.distance_matrix)
+        return neighbor_computer.radius_neighbors_graph(mode="distance")
+
+    def cluster_distances(self, cluster_inds: np.ndarray) -> np.ndarray:
+        """Return a distance matrix with only distances within a cluster."""
+        return get_cluster_distance_matrix(self.distance_matrix, cluster_inds)
+
+    def average_cluster_distances(
+        self, cluster_groups: list[np.ndarray], max_distance: float
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Compute the average distances between clusters of records.
+
+        Args:
+            cluster_groups: Indices of the records in each cluster.
+            max_distance: Largest average distance between clusters which matters to
+                the caller. Only used by :class:`SparseDistanceMatrix`.
+
+        Yields:
+            The indices of a set of clusters in ``cluster_groups``, and the matrix of
+            average distances between them. Clusters in different sets are further
+            than ``max_distance`` from each other. Here, all the clusters are in a
+            single set.
+        """
+        yield (
+            np.arange(len(cluster_groups)),
+            get_average_distance_matrix(
+                self.distance_matrix, List([List(inds) for inds in cluster_groups])
+            ),
+        )
+
+
+class SparseDistanceMatrix(DistanceMatrix):
+    """Class to wrap the distances between nearby records in a sparse matrix.
+
+    Only the distances between records from different report years which are within
+    ``radius`` of each other are stored, so memory use grows with the number of nearby
+    pairs of records rather than the square of the number of records. Distances within
+    the small sets of records which the linkage steps compare exhaustively are
+    computed from the feature matrix when they are needed, with the same penalty for
+    records from the same year as :class:`DistanceMatrix`. The linkage steps find the
+    same clusters as long as ``radius`` covers the distances they compare:
+
+    * :func:`cluster_records_dbscan` only uses distances up to ``eps``.
+    * :func:`split_clusters` only uses distances within the clusters found by DBSCAN.
+    * :func:`match_orphaned_records` can only merge clusters with an average distance
+      under its ``distance_threshold``. The average distance between clusters with
+      no records within ``radius`` of each other is more than half of ``radius``, so
+      it isn't computed, and they're treated like clusters with records from the same
+      year. Clusters which aren't connected by any such records are matched
+      separately. Unlike with the dense backend, average linkage can't then merge
+      them by averaging their distance with those of much closer clusters, so a
+      ``radius`` a few times the threshold is safest.
+    """
+
+    def __init__(
+        self,
+        feature_matrix: np.ndarray | scipy.sparse.csr_matrix,
+        original_df: pd.DataFrame,
+        config: PenalizeReportYearDistanceConfig,
+    ):
+        """Find the records within radius of each other in different report years."""
+        self.feature_matrix = feature_matrix
+        self.report_years = original_df["report_year"].to_numpy()
+        self.metric = config.metric
+        self.distance_penalty = config.distance_penalty
+        self.radius = config.radius
+
+        neighbor_computer = NearestNeighbors(radius=config.radius, metric=config.metric)
+        neighbor_computer.fit(feature_matrix)
+        graph = neighbor_computer.radius_neighbors_graph(mode="distance").tocoo()
+        different_years = self.report_years[graph.row] != self.report_years[graph.col]
+        self.distance_matrix = scipy.sparse.csr_matrix(
+            (
+                graph.data[different_years].astype("float32"),
+                (graph.row[different_years], graph.col[different_years]),
+            ),
+            shape=graph.shape,
+        )
+
+    def _distances(
+        self, inds: np.ndarray, other_inds: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Compute the penalized distances between two sets of records.
+
+        If ``other_inds`` isn't given, the distances between the records in ``inds``
+        are computed, and the distance between each record and itself is zero.
+        """
+        other_inds = inds if other_inds is None else other_inds
+        distances = pairwise_distances(
+            self.feature_matrix[inds],
+            self.feature_matrix[other_inds],
+            metric=self.metric,
+        ).astype("float32")
+        years = self.report_years[inds]
+        other_years = self.report_years[other_inds]
+        distances[years[:, None] == other_years[None, :]] = self.distance_penalty
+        if other_inds is inds:
+            np.fill_diagonal(distances, 0)
+        return distances
+
+    def radius_neighbors_graph(self, radius: float) -> scipy.sparse.csr_matrix:
+        """Return a sparse matrix of the distances between records within radius."""
+        if radius > self.radius:
+            raise ValueError(
+                f"Can't find neighbors within {radius}, only distances up to "
+                f"{self.radius} are stored."
+            )
+        graph = self.distance_matrix.tocoo()
+        within = graph.data <= radius
+        return scipy.sparse.csr_matrix(
+            (graph.data[within], (graph.row[within], graph.col[within])),
+            shape=graph.shape,
+        )
+
+    def cluster_distances(self, cluster_inds: np.ndarray) -> np.ndarray:
+        """Return a distance matrix with only distances within a cluster."""
+        return self._distances(cluster_inds)
+
+    def average_cluster_distances(
+        self, cluster_groups: list[np.ndarray], max_distance: float
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Compute the average distances between clusters of records.
+
+        Clusters are split into connected components, linked by any pair of their
+        records within ``radius`` of each other. Average distances are only computed
+        between linked clusters, and other clusters are treated as if they contained
+        records from the same year.
+
+        Args:
+            cluster_groups: Indices of the records in each cluster.
+            max_distance: Largest average distance between clusters which matters to
+                the caller. It can be at most half of ``radius``.
+
+        Yields:
+            The indices of a set of clusters in ``cluster_groups``, and the matrix of
+            average distances between them. Clusters in different sets are further
+            than ``max_distance`` from each other.
+        """
+        if 2 * max_distance > self.radius:
+            raise ValueError(
+                f"Can't compare clusters up to {max_distance} apart, radius must be at "
+                f"least {2 * max_distance}."
+            )
+        cluster_of = np.empty(self.distance_matrix.shape[0], dtype=int)
+        for cluster, inds in enumerate(cluster_groups):
+            cluster_of[inds] = cluster
+        graph = self.distance_matrix.tocoo()
+        cluster_links = scipy.sparse.csr_matrix(
+            (np.ones(graph.nnz), (cluster_of[graph.row], cluster_of[graph.col])),
+            shape=(len(cluster_groups), len(cluster_groups)),
+        )
+        _, components = scipy.sparse.csgraph.connected_components(
+            cluster_links, directed=False
+        )
+        for clusters in pd.Series(components).groupby(components).indices.values():
+            average_dist_matrix = np.full(
+                (len(clusters), len(clusters)), self.distance_penalty
+            )
+            np.fill_diagonal(average_dist_matrix, 0)
+            links = scipy.sparse.triu(cluster_links[clusters][:, clusters], k=1).tocoo()
+            for i, j in zip(links.row, links.col, strict=True):
+                inds_i = cluster_groups[clusters[i]]
+                inds_j = cluster_groups[clusters[j]]
+                # Same definition of the average as get_average_distance_matrix()
+                average_dist = self._distances(inds_i, inds_j).sum(dtype="float64") / (
+                    len(inds_i) + len(inds_j)
+                )
+                average_dist_matrix[i, j] = average_dist
+                average_dist_matrix[j, i] = average_dist
+            yield clusters, average_dist_matrix
+
 
 def get_cluster_distance_matrix(
     distance_matrix: np.ndarray, cluster_inds: np.ndarray
@@ -122,8 +307,12 @@ def compute_distance_with_year_penalty(
     original_df: pd.DataFrame,
 ) -> DistanceMatrix:
     """Compute a distance matrix and penalize records from the same year."""
-    logger.info(f"Dist metric: {config.metric}")
-    return DistanceMatrix(feature_matrix.matrix, original_df, config)
+    logger.info(f"Dist metric: {config.metric}, backend: {config.backend}")
+    if config.backend == "dense":
+        return DistanceMatrix(feature_matrix.matrix, original_df, config)
+    if config.backend == "sparse":
+        return SparseDistanceMatrix(feature_matrix.matrix, original_df, config)
+    raise ValueError(f"Unknown distance matrix backend: {config.backend}")
 
 
 class DBSCANConfig(Config):
@@ -143,9 +332,7 @@ def cluster_records_dbscan(
 ) -> pd.DataFrame:
     """Generate initial IDs using DBSCAN algorithm."""
     # DBSCAN is very efficient when passed a sparse radius neighbor graph
-    neighbor_computer = NearestNeighbors(radius=config.eps, metric="precomputed")
-    neighbor_computer.fit(distance_matrix.distance_matrix)
-    neighbor_graph = neighbor_computer.radius_neighbors_graph(mode="distance")
+    neighbor_graph = distance_matrix.radius_neighbors_graph(config.eps)
 
     # Classify records
     classifier = DBSCAN(metric="precomputed", eps=config.eps, min_samples=2)
@@ -218,9 +405,7 @@ def split_clusters(
         cluster_inds = id_year_df[
             id_year_df.record_label == duplicated_id
         ].index.to_numpy()
-        cluster_distances = get_cluster_distance_matrix(
-            distance_matrix.distance_matrix, cluster_inds
-        )
+        cluster_distances = distance_matrix.cluster_distances(cluster_inds)
 
         new_labels = classifier.fit_predict(cluster_distances)
         for new_label in np.unique(new_labels):
@@ -270,20 +455,29 @@ def match_orphaned_records(
     cluster_inds = id_year_df.groupby("record_label").indices
 
     # Orphaned records are considered a cluster of a single record
-    cluster_groups = [List([ind]) for ind in cluster_inds.get(-1, [])]
+    cluster_groups = [np.array([ind]) for ind in cluster_inds.get(-1, [])]
 
     # Get list of all points in each assigned cluster
-    cluster_groups += [List(inds) for key, inds in cluster_inds.items() if key != -1]
-    cluster_groups = List(cluster_groups)
+    cluster_groups += [inds for key, inds in cluster_inds.items() if key != -1]
 
-    average_dist_matrix = get_average_distance_matrix(
-        distance_matrix.distance_matrix, cluster_groups
-    )
+    # Clusters are matched within sets which are too far apart to be matched together
+    new_labels = np.empty(len(cluster_groups), dtype=int)
+    next_label = 0
+    for clusters, average_dist_matrix in distance_matrix.average_cluster_distances(
+        cluster_groups, config.distance_threshold
+    ):
+        labels = (
+            classifier.fit_predict(average_dist_matrix)
+            if len(clusters) > 1
+            else np.zeros(1, dtype=int)
+        )
+        new_labels[clusters] = labels + next_label
+        next_label += labels.max() + 1
 
     # Assign new labels to all points
-    new_labels = classifier.fit_predict(average_dist_matrix)
-    for inds, label in zip(cluster_groups, new_labels, strict=True):
-        id_year_df.loc[inds, "record_label"] = label
+    id_year_df.loc[np.concatenate(cluster_groups), "record_label"] = np.repeat(
+        new_labels, [len(inds) for inds in cluster_groups]
+    )
 
     logger.info(
         f"{id_year_df.record_label.nunique()} unique record IDs found after match orphaned records step."
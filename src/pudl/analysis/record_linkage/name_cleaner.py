@@ -1,12 +1,23 @@
-"""This module contains the implementation of CompanyNameCleaner class from OS-Climate's financial-entity-cleaner package."""
+"""This module contains the implementation of CompanyNameCleaner class from OS-Climate's financial-entity-cleaner package.
+
+Names are cleaned by applying a sequence of regex rules, and then normalizing legal
+terms like "ltd" to "limited". The rules are compiled once, and only applied to each
+distinct name, since names repeat across years and tables. Cleaned names are memoized in memory by the configuration of
+the cleaner, and optionally in a Parquet file, so that they carry over between runs.
+"""
 
 import enum
+import hashlib
 import json
 import logging
+import os
 import re
+from functools import cache
 from importlib.resources import files
+from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
@@ -56,13 +67,77 @@ class LegalTermLocation(enum.Enum):
     ANYWHERE = 2
 
 
+@cache
+def _legal_terms() -> dict[str, list[str]]:
+    """Load the dictionary of legal terms to normalize, by their normalized form."""
+    json_source = files("pudl.package_data.settings").joinpath("us_legal_forms.json")
+    with json_source.open() as json_file:
+        return json.load(json_file)["legal_forms"]["en"]
+
+
+@cache
+def _compile_cleaning_rules(
+    rule_names: tuple[str, ...],
+) -> list[tuple[re.Pattern, str, bool]]:
+    """Compile the named cleaning rules, in order.
+
+    Rules which refer to another rule by name, so that it is applied twice, are
+    replaced by the rule they refer to.
+
+    Returns:
+        The regex, replacement, and whether to prefix the name with "the" if the
+        regex matches, for each rule.
+    """
+    compiled = []
+    for rule_name in rule_names:
+        replacement, regex_rule = CLEANING_RULES_DICT[rule_name]
+        if regex_rule in rule_names:
+            replacement, regex_rule = CLEANING_RULES_DICT[regex_rule]
+        compiled.append(
+            (
+                re.compile(regex_rule),
+                replacement,
+                rule_name == "place_word_the_at_the_beginning",
+            )
+        )
+    return compiled
+
+
+@cache
+def _compile_legal_terms(
+    legal_term_location: LegalTermLocation,
+) -> tuple[re.Pattern, list[tuple[re.Pattern, str]]]:
+    """Compile the regexes which normalize legal terms, in order.
+
+    Returns:
+        A single regex which matches any of the legal terms, so that names without
+        any can be skipped, and the regex and replacement for each legal term.
+    """
+    compiled = []
+    for replacement, legal_terms in _legal_terms().items():
+        replacement = " " + replacement.lower() + " "
+        for legal_term in legal_terms:
+            legal_term = legal_term.lower()
+            # Legal terms with dots are matched anywhere, and other legal terms only
+            # as whole words
+            if legal_term.find(".") > -1:
+                legal_term = legal_term.replace(".", "\\.")
+            else:
+                legal_term = "\\b" + legal_term + "\\b"
+            if legal_term_location == LegalTermLocation.AT_THE_END:
+                legal_term = legal_term + "$"
+            compiled.append((re.compile(legal_term), replacement))
+    any_term = re.compile("|".join(f"(?:{regex.pattern})" for regex, _ in compiled))
+    return any_term, compiled
+
+
+#: Cleaned names by their original value, for each configuration of the cleaner.
+_CLEAN_NAMES_MEMO: dict[str, pd.Series] = {}
+
+
 class CompanyNameCleaner(BaseModel):
     """Class to normalize/clean up text based company names."""
 
-    # Constants used internally by the class
-    __NAME_LEGAL_TERMS_DICT_FILE = "us_legal_forms.json"
-    __NAME_JSON_ENTRY_LEGAL_TERMS = "legal_forms"
-
     #: A flag to indicate if the cleaning process must normalize
     #: text's legal terms. e.g. LTD => LIMITED.
     cleaning_rules_list: list[str] = [
@@ -101,113 +176,88 @@ class CompanyNameCleaner(BaseModel):
     #: Define if the letters with accents are replaced with non-accented ones
     remove_accents: bool = False
 
-    def _apply_regex_rules(
-        self, str_value: str, dict_regex_rules: dict[str, list[str]]
-    ) -> str:
-        r"""Applies several cleaning rules based on a custom dictionary.
-
-        The dictionary must contain cleaning rules written in regex format.
-
-        Arguments:
-            str_value (str): any value as string to be cleaned up.
-            dict_regex_rules (dict): a dictionary of cleaning rules writen in regex with the format
-                [rule name] : ['replacement', 'regex rule']
-
-        Returns:
-            (str): the modified/cleaned value.
-        """
-        clean_value = str_value
-        # Iterate through the dictionary and apply each regex rule
-        for name_rule, cleaning_rule in dict_regex_rules.items():
-            # First element is the replacement
-            replacement = cleaning_rule[0]
-            # Second element is the regex rule
-            regex_rule = cleaning_rule[1]
-
-            # Check if the regex rule is actually a reference to another regex rule.
-            # By adding a name of another regex rule in the place of the rule itself allows the execution
-            # of a regex rule twice
-            if regex_rule in dict_regex_rules:
-                replacement = dict_regex_rules[cleaning_rule[1]][0]
-                regex_rule = dict_regex_rules[cleaning_rule[1]][1]
-
-            # Make sure to use raw string
-            regex_rule = rf"{regex_rule}"
-
-            # Treat the special case of the word THE at the end of a text's name
-            found_the_word_the = None
-            if name_rule == "place_word_the_at_the_beginning":
-                found_the_word_the = re.search(regex_rule, clean_value)
-
-            # Apply the regex rule
-            clean_value = re.sub(regex_rule, replacement, clean_value)
-
-            # Adjust the name for the case of rule <place_word_the_at_the_beginning>
-            if found_the_word_the is not None:
-                clean_value = "the " + clean_value
-
-        return clean_value
-
-    def _remove_unicode_chars(self, value: str) -> str:
-        """Removes unicode character that is unreadable when converted to ASCII format.
-
-        Arguments:
-            value (str): any string containing unicode characters.
+    #: Directory to keep the memo of cleaned names in, so that names cleaned in one
+    #: run don't need to be cleaned again in the next. If not set, the memo is only
+    #: kept in memory.
+    memo_dir: Path | None = None
+
+    def _fingerprint(self) -> str:
+        """Hash the configuration and rules which determine the cleaned names."""
+        config = self.model_dump(mode="json", exclude={"memo_dir"})
+        config["rules"] = [
+            CLEANING_RULES_DICT[rule] for rule in self.cleaning_rules_list
+        ]
+        config["legal_terms"] = _legal_terms()
+        return hashlib.sha256(json.dumps(config).encode()).hexdigest()[:16]
+
+    def _memo_path(self, fingerprint: str) -> Path | None:
+        if self.memo_dir is None:
+            return None
+        return Path(self.memo_dir) / f"clean_names_{fingerprint}.parquet"
+
+    def _get_memo(self, fingerprint: str) -> pd.Series:
+        """Get the memo of cleaned names, reading it from disk the first time."""
+        if fingerprint not in _CLEAN_NAMES_MEMO:
+            memo = pd.Series(dtype=object)
+            path = self._memo_path(fingerprint)
+            if path is not None and path.exists():
+                memo = pd.read_parquet(path).set_index("name")["clean_name"]
+                logger.info(f"Read {len(memo)} cleaned names from {path}.")
+            _CLEAN_NAMES_MEMO[fingerprint] = memo
+        return _CLEAN_NAMES_MEMO[fingerprint]
+
+    def _update_memo(self, fingerprint: str, clean_names: pd.Series):
+        """Add newly cleaned names to the memo, and write it to disk."""
+        memo = pd.concat([self._get_memo(fingerprint), clean_names])
+        _CLEAN_NAMES_MEMO[fingerprint] = memo
+        path = self._memo_path(fingerprint)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so a partially written memo is never
+            # read.
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            memo.rename_axis("name").rename("clean_name").reset_index().to_parquet(
+                tmp_path, index=False
+            )
+            tmp_path.replace(path)
 
-        Returns:
-            (str): the corresponding input string without unicode characters.
-        """
-        # Remove all unicode characters if any
-        clean_value = value.encode("ascii", "ignore").decode()
-        return clean_value
+    def _clean_string(self, name: str) -> str:
+        """Clean a string with the compiled cleaning rules and legal terms."""
+        # Remove all unicode characters in the text's name, if requested
+        if self.remove_unicode:
+            name = name.encode("ascii", "ignore").decode()
 
-    def _apply_cleaning_rules(self, company_name: str) -> str:
-        """Apply the cleaning rules from the dictionary of regex rules."""
-        cleaning_dict = {}
-        for rule_name in self.cleaning_rules_list:
-            cleaning_dict[rule_name] = CLEANING_RULES_DICT[rule_name]
+        # Remove space in the beginning and in the end and convert it to lower case
+        name = name.strip().lower()
 
         # Apply all the cleaning rules
-        clean_company_name = self._apply_regex_rules(company_name, cleaning_dict)
-        return clean_company_name
+        for regex, replacement, prefix_the in _compile_cleaning_rules(
+            tuple(self.cleaning_rules_list)
+        ):
+            # Treat the special case of the word THE at the end of a text's name
+            found_the = prefix_the and regex.search(name) is not None
+            name = regex.sub(replacement, name)
+            if found_the:
+                name = "the " + name
+
+        # Apply normalization for legal terms, making sure to remove extra spaces, so
+        # legal terms can be found in the end (if requested). Most names don't contain
+        # any legal terms, and are skipped with a single search.
+        if self.normalize_legal_terms:
+            name = name.strip()
+            any_term, legal_terms = _compile_legal_terms(self.legal_term_location)
+            if any_term.search(name):
+                for regex, replacement in legal_terms:
+                    name = regex.sub(replacement, name)
 
-    def _apply_normalization_of_legal_terms(self, company_name: str) -> str:
-        """Apply the normalizattion of legal terms according to dictionary of regex rules."""
-        # Make sure to remove extra spaces, so legal terms can be found in the end (if requested)
-        clean_company_name = company_name.strip()
+        # Apply the letter case, if different from 'lower'
+        if self.output_lettercase == "upper":
+            name = name.upper()
+        elif self.output_lettercase == "title":
+            name = name.title()
 
-        # The dictionary of legal terms define how to normalize the text's legal form abreviations
-        json_source = files("pudl.package_data.settings").joinpath(
-            self.__NAME_LEGAL_TERMS_DICT_FILE
-        )
-        with json_source.open() as json_file:
-            _dict_legal_terms = json.load(json_file)[
-                self.__NAME_JSON_ENTRY_LEGAL_TERMS
-            ]["en"]
-
-        # Apply normalization for legal terms
-        # Iterate through the dictionary of legal terms
-        for replacement, legal_terms in _dict_legal_terms.items():
-            # Each replacement has a list of possible terms to be searched for
-            replacement = " " + replacement.lower() + " "
-            for legal_term in legal_terms:
-                # Make sure to use raw string
-                legal_term = legal_term.lower()
-                # If the legal term has . (dots), then apply regex directly on the legal term
-                # Otherwise, if it's a legal term with only letters in sequence, make sure
-                # that regex find the legal term as a word (\\bLEGAL_TERM\\b)
-                if legal_term.find(".") > -1:
-                    legal_term = legal_term.replace(".", "\\.")
-                else:
-                    legal_term = "\\b" + legal_term + "\\b"
-                # Check if the legal term should be found only at the end of the string
-                if self.legal_term_location == LegalTermLocation.AT_THE_END:
-                    legal_term = legal_term + "$"
-                # ...and it's a raw string
-                regex_rule = rf"{legal_term}"
-                # Apply the replacement
-                clean_company_name = re.sub(regex_rule, replacement, clean_company_name)
-        return clean_company_name
+        # Remove excess of white space that might be introduced during previous cleaning
+        return re.sub(r"\s+", " ", name.strip())
 
     def get_clean_data(self, company_name: str) -> str:
         """Clean a name and normalize legal terms.
@@ -225,36 +275,47 @@ class CompanyNameCleaner(BaseModel):
             if company_name is not pd.NA:
                 logger.warning(f"{company_name} is not a string.")
             return pd.NA
+        return self._clean_string(company_name)
 
-        # Remove all unicode characters in the text's name, if requested
-        if self.remove_unicode:
-            clean_company_name = self._remove_unicode_chars(company_name)
-        else:
-            clean_company_name = company_name
+    def clean_names(self, names: pd.Series) -> pd.Series:
+        """Clean a series of names and normalize legal terms.
 
-        # Remove space in the beginning and in the end and convert it to lower case
-        clean_company_name = clean_company_name.strip().lower()
+        Each distinct name is only cleaned once, and names which have been cleaned
+        before with the same configuration are looked up in the memo instead. Values
+        which are null or not strings are returned as pd.NA.
 
-        # Apply all the cleaning rules
-        clean_company_name = self._apply_cleaning_rules(clean_company_name)
+        Arguments:
+            names: the original names.
 
-        # Apply normalization for legal terms
-        if self.normalize_legal_terms:
-            clean_company_name = self._apply_normalization_of_legal_terms(
-                clean_company_name
+        Returns:
+            The clean version of the names, with the same index.
+        """
+        codes, uniques = pd.factorize(names)
+        uniques = pd.Series(uniques, dtype=object)
+        is_str = uniques.map(lambda name: isinstance(name, str)).astype(bool)
+        if not is_str.all():
+            logger.warning(f"{list(uniques[~is_str])} are not strings.")
+        uniques = uniques[is_str]
+
+        fingerprint = self._fingerprint()
+        memo = self._get_memo(fingerprint)
+        clean_uniques = uniques.map(memo).astype(object)
+        new = clean_uniques.isna()
+        if new.any():
+            new_names = uniques[new].map(self._clean_string)
+            clean_uniques[new] = new_names
+            self._update_memo(
+                fingerprint, pd.Series(new_names.to_numpy(), index=uniques[new])
             )
+        logger.debug(
+            f"Cleaned {new.sum()} new names of {len(uniques)} distinct and "
+            f"{len(names)} total names."
+        )
 
-        # Apply the letter case, if different from 'lower'
-        if self.output_lettercase == "upper":
-            clean_company_name = clean_company_name.upper()
-        elif self.output_lettercase == "title":
-            clean_company_name = clean_company_name.title()
-
-        # Remove excess of white space that might be introduced during previous cleaning
-        clean_company_name = clean_company_name.strip()
-        clean_company_name = re.sub(r"\s+", " ", clean_company_name)
-
-        return clean_company_name
+        # Non-strings and nulls, with a code of -1, are all NA
+        clean = np.full(len(is_str) + 1, pd.NA, dtype=object)
+        clean[np.flatnonzero(is_str)] = clean_uniques.to_numpy()
+        return pd.Series(clean[codes], index=names.index, name=names.name)
 
     def apply_name_cleaning(
         self, df: pd.DataFrame, return_as_dframe: bool = False
@@ -272,13 +333,8 @@ class CompanyNameCleaner(BaseModel):
             df (dataframe): the clean version of the input dataframe
         """
         if isinstance(df, pd.DataFrame) and len(df.columns) > 1:
-            clean_df = pd.DataFrame()
-            for col in df.columns:
-                clean_df = pd.concat(
-                    [clean_df, df[col].apply(self.get_clean_data)], axis=1
-                )
-            return clean_df
-        out = df.squeeze().apply(self.get_clean_data)
+            return pd.DataFrame({col: self.clean_names(df[col]) for col in df.columns})
+        out = self.clean_names(df.squeeze())
         if return_as_dframe:
             return out.to_frame()
         return out
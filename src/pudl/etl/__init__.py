@@ -2,6 +2,7 @@
 
 import importlib.resources
 import itertools
+import os
 import warnings
 
 import pandera as pr
@@ -174,6 +175,8 @@ def _get_keys_from_assets(
 
 
 _package = pudl.metadata.classes.Package.from_resource_ids()
+if os.getenv("PUDL_PRELOAD_METADATA"):
+    pudl.metadata.registry.preload()
 _asset_keys = itertools.chain.from_iterable(
     _get_keys_from_assets(asset_def) for asset_def in default_assets
 )
@@ -1,14 +1,28 @@
-"""Check that foreign key constraints in the PUDL database are respected."""
-
+"""Check that foreign key constraints in the PUDL database are respected.
+
+:func:`check_foreign_keys` relies on the foreign key constraints declared in the PUDL
+SQLite database, and identifies every row which violates them.
+:func:`find_foreign_key_violations` instead checks the foreign key relationships
+declared in the PUDL metadata with a single anti-join per relationship, and reports
+how many rows violate each of them, along with a sample of the keys they refer to.
+It works with the SQLite database, or with DuckDB views of the Parquet outputs made by
+:func:`parquet_views`.
+"""
+
+import json
 import pathlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import click
+import duckdb
 import pandas as pd
 import sqlalchemy as sa
 from dotenv import load_dotenv
 
 import pudl
+from pudl.metadata.classes import Package
 from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -43,7 +57,45 @@ logger = pudl.logging_helpers.get_logger(__name__)
     ),
     default=None,
 )
-def pudl_check_fks(logfile: pathlib.Path, loglevel: str, db_path: pathlib.Path):
+@click.option(
+    "--parquet_dir",
+    help=(
+        "Check the Parquet outputs in this directory instead of the SQLite database. "
+        "Only the relationships between tables that have been written to Parquet are "
+        "checked."
+    ),
+    type=click.Path(
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+        path_type=pathlib.Path,
+    ),
+    default=None,
+)
+@click.option(
+    "--report",
+    help="If specified, write a JSON report of the foreign key violations to this file.",
+    type=click.Path(
+        exists=False,
+        resolve_path=True,
+        path_type=pathlib.Path,
+    ),
+    default=None,
+)
+@click.option(
+    "--workers",
+    help="Number of relationships to check at the same time.",
+    type=int,
+    default=None,
+)
+def pudl_check_fks(
+    logfile: pathlib.Path,
+    loglevel: str,
+    db_path: pathlib.Path,
+    parquet_dir: pathlib.Path,
+    report: pathlib.Path,
+    workers: int | None,
+):
     """Check that foreign key constraints in the PUDL database are respected.
 
     Dagster manages the dependencies between various assets in our ETL pipeline,
@@ -55,18 +107,28 @@ def pudl_check_fks(logfile: pathlib.Path, loglevel: str, db_path: pathlib.Path):
 
     However, we still expect foreign key constraints to be satisfied once all of the
     tables have been loaded, so we check that they are valid after the ETL has
-    completed. This script runs the same check.
+    completed. This script checks every foreign key relationship declared in the PUDL
+    metadata, either in the database or in the Parquet outputs.
     """
     load_dotenv()
 
     # Display logged output from the PUDL package:
     pudl.logging_helpers.configure_root_logger(logfile=logfile, loglevel=loglevel)
 
-    # Using PudlPaths to get default value for CLI causes validation issues
-    if not db_path:
-        db_path = PudlPaths().output_dir / "pudl.sqlite"
-
-    check_foreign_keys(sa.create_engine(f"sqlite:///{db_path}"))
+    if parquet_dir:
+        con = parquet_views(parquet_dir)
+    else:
+        # Using PudlPaths to get default value for CLI causes validation issues
+        if not db_path:
+            db_path = PudlPaths().output_dir / "pudl.sqlite"
+        con = sa.create_engine(f"sqlite:///{db_path}")
+
+    violations = find_foreign_key_violations(con, max_workers=workers)
+    if report:
+        report.write_text(json.dumps(violations, indent=2, default=str))
+        logger.info(f"Wrote foreign key violation report to {report}")
+    if any(v["violations"] for v in violations):
+        raise ForeignKeyViolations(violations)
     return 0
 
 
@@ -130,8 +192,30 @@ class ForeignKeyErrors(sa.exc.SQLAlchemyError):  # noqa: N818
         return self.fk_errors[idx]
 
 
-def _get_fk_list(engine: sa.Engine, table: str) -> pd.DataFrame:
-    """Retrieve a dataframe of foreign keys for a table.
+class ForeignKeyViolations(sa.exc.SQLAlchemyError):  # noqa: N818
+    """Raised when data violate foreign key relationships in the PUDL metadata."""
+
+    def __init__(self, violations: list[dict[str, Any]]):
+        """Initialize a new ForeignKeyViolations object.
+
+        Args:
+            violations: Foreign key relationships which were checked, as returned by
+                :func:`find_foreign_key_violations`.
+        """
+        self.violations = [v for v in violations if v["violations"]]
+
+    def __str__(self):
+        """Create string representation of ForeignKeyViolations object."""
+        return "\n".join(
+            f"Foreign key error for table: {v['child_table']} -- {v['parent_table']} "
+            f"({', '.join(v['parent_fields'])}) -- on {v['violations']} rows with "
+            f"{v['distinct_keys']} distinct keys, e.g. {v['sample_keys']}"
+            for v in self.violations
+        )
+
+
+def _get_fk_list(engine: sa.Engine, tables: list[str]) -> pd.DataFrame:
+    """Retrieve a dataframe of the foreign keys of several tables.
 
     Description from the SQLite Docs: 'This pragma returns one row for each foreign
     key constraint created by a REFERENCES clause in the CREATE TABLE statement of
@@ -139,23 +223,24 @@ def _get_fk_list(engine: sa.Engine, table: str) -> pd.DataFrame:
 
     The PRAGMA returns one row for each field in a foreign key constraint. This
     method collapses foreign keys with multiple fields into one record for
-    readability.
+    readability. The foreign keys of all the tables are retrieved with a single query,
+    using the table-valued form of the PRAGMA.
     """
+    query = sa.text(
+        'SELECT m.name AS "table", p.id AS fkid, p."table" AS parent, p."to" '
+        "FROM sqlite_master AS m JOIN pragma_foreign_key_list(m.name) AS p "
+        "WHERE m.type = 'table' ORDER BY m.name, p.id, p.seq"
+    )
     with engine.begin() as con:
-        table_fks = pd.read_sql_query(f"PRAGMA foreign_key_list({table});", con)
+        table_fks = pd.read_sql_query(query, con)
+    table_fks = table_fks[table_fks["table"].isin(tables)]
 
     # Foreign keys with multiple fields are reported in separate records.
     # Combine the multiple fields into one string for readability.
-    # Drop duplicates so we have one FK for each table and foreign key id
-    table_fks["fk"] = table_fks.groupby("table")["to"].transform(
-        lambda field: "(" + ", ".join(field) + ")"
+    # Aggregate so we have one FK for each table and foreign key id
+    return table_fks.groupby(["table", "fkid", "parent"], as_index=False).agg(
+        fk=("to", lambda field: "(" + ", ".join(field) + ")")
     )
-    table_fks = table_fks[["id", "table", "fk"]].drop_duplicates()
-
-    # Rename the fields so we can easily merge with the foreign key errors.
-    table_fks = table_fks.rename(columns={"id": "fkid", "table": "parent"})
-    table_fks["table"] = table
-    return table_fks
 
 
 def check_foreign_keys(engine: sa.Engine):
@@ -179,9 +264,7 @@ def check_foreign_keys(engine: sa.Engine):
     if not fk_errors.empty:
         # Merge in the actual FK descriptions
         tables_with_fk_errors = fk_errors.table.unique().tolist()
-        table_foreign_keys = pd.concat(
-            [_get_fk_list(engine, table) for table in tables_with_fk_errors]
-        )
+        table_foreign_keys = _get_fk_list(engine, tables_with_fk_errors)
 
         fk_errors_with_keys = fk_errors.merge(
             table_foreign_keys,
@@ -210,5 +293,160 @@ def check_foreign_keys(engine: sa.Engine):
     logger.info("Success! No foreign key constraint errors found.")
 
 
+def parquet_views(parquet_dir: pathlib.Path | None = None) -> duckdb.DuckDBPyConnection:
+    """Create an in-memory DuckDB database with a view of each Parquet output.
+
+    Args:
+        parquet_dir: Directory containing one Parquet file per table. Defaults to the
+            Parquet outputs in the PUDL output directory.
+
+    Returns:
+        A DuckDB connection with a view named after each table, which reads the table
+        directly from its Parquet file.
+    """
+    if parquet_dir is None:
+        parquet_dir = PudlPaths().parquet_path()
+    con = duckdb.connect()
+    for path in sorted(pathlib.Path(parquet_dir).glob("*.parquet")):
+        source = str(path).replace("'", "''")
+        con.execute(
+            f"CREATE VIEW \"{path.stem}\" AS SELECT * FROM read_parquet('{source}')"  # noqa: S608
+        )
+    return con
+
+
+def _table_names(con: sa.Engine | duckdb.DuckDBPyConnection) -> set[str]:
+    """List the tables and views which can be queried through a connection."""
+    if isinstance(con, sa.Engine):
+        inspector = sa.inspect(con)
+        return set(inspector.get_table_names()) | set(inspector.get_view_names())
+    return set(
+        con.cursor()
+        .execute("SELECT table_name FROM information_schema.tables")
+        .df()["table_name"]
+    )
+
+
+def _read_query(con: sa.Engine | duckdb.DuckDBPyConnection, query: str) -> pd.DataFrame:
+    """Run a query on its own connection, so that queries can run concurrently."""
+    if isinstance(con, sa.Engine):
+        with con.connect() as conn:
+            return pd.read_sql_query(sa.text(query), conn)
+    return con.cursor().execute(query).df()
+
+
+def _foreign_key_violations_query(
+    child_table: str,
+    child_fields: list[str],
+    parent_table: str,
+    parent_fields: list[str],
+    sample_size: int,
+) -> str:
+    """Build an anti-join which finds the keys in a child table missing from its parent.
+
+    Like SQLite foreign key constraints, child rows with any missing key field don't
+    violate the relationship. The query returns the most common missing keys, with the
+    number of rows referring to each of them, the total number of distinct missing
+    keys, and the total number of rows referring to them.
+    """
+    keys = ", ".join(f'c."{field}"' for field in child_fields)
+    not_null = " AND ".join(f'c."{field}" IS NOT NULL' for field in child_fields)
+    matches = " AND ".join(
+        f'p."{parent}" = c."{child}"'
+        for child, parent in zip(child_fields, parent_fields, strict=True)
+    )
+    return (
+        f"SELECT {keys}, COUNT(*) AS row_count, "  # noqa: S608
+        "COUNT(*) OVER () AS distinct_keys, SUM(COUNT(*)) OVER () AS violations "
+        f'FROM "{child_table}" AS c WHERE {not_null} '
+        f'AND NOT EXISTS (SELECT 1 FROM "{parent_table}" AS p WHERE {matches}) '
+        f"GROUP BY {keys} ORDER BY row_count DESC, {keys} LIMIT {sample_size}"
+    )
+
+
+def find_foreign_key_violations(
+    con: sa.Engine | duckdb.DuckDBPyConnection,
+    package: Package | None = None,
+    sample_size: int = 5,
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """Check the foreign key relationships declared in the PUDL metadata.
+
+    Each relationship is checked with a single anti-join between the child and parent
+    tables, so the database does all the work, and the relationships are checked
+    concurrently. Relationships between tables which can't be found through ``con``
+    are skipped, so that e.g. only the tables which are written to Parquet are checked.
+
+    Args:
+        con: An engine connected to a SQLite database, like ``pudl.sqlite``, or a DuckDB
+            connection, like one returned by :func:`parquet_views`.
+        package: Metadata declaring the foreign key relationships to check. Defaults to
+            all of the PUDL resources.
+        sample_size: Maximum number of distinct missing keys to report for each
+            relationship. The most common ones are reported.
+        max_workers: Maximum number of relationships to check at the same time.
+
+    Returns:
+        One record for each relationship which was checked, with the child and parent
+        tables and fields, the number of child rows which violate the relationship,
+        the number of distinct keys they refer to, and a sample of those keys with the
+        number of rows which refer to each one. The records can be serialized to JSON.
+    """
+    if package is None:
+        package = Package.from_resource_ids()
+    tables = _table_names(con)
+    relationships = [
+        {
+            "child_table": resource.name,
+            "child_fields": list(fk.fields),
+            "parent_table": fk.reference.resource,
+            "parent_fields": list(fk.reference.fields),
+        }
+        for resource in package.resources
+        for fk in resource.schema.foreign_keys
+    ]
+    skipped = [
+        r
+        for r in relationships
+        if not {r["child_table"], r["parent_table"]}.issubset(tables)
+    ]
+    if skipped:
+        logger.info(
+            f"Skipping {len(skipped)} foreign key relationships with missing tables."
+        )
+    relationships = [r for r in relationships if r not in skipped]
+    logger.info(f"Checking {len(relationships)} foreign key relationships.")
+
+    def check(relationship: dict[str, Any]) -> dict[str, Any]:
+        sample = _read_query(
+            con,
+            _foreign_key_violations_query(
+                sample_size=sample_size,
+                **relationship,
+            ),
+        )
+        totals = sample[["violations", "distinct_keys"]].head(1).to_dict("records")
+        return relationship | {
+            "violations": int(totals[0]["violations"]) if totals else 0,
+            "distinct_keys": int(totals[0]["distinct_keys"]) if totals else 0,
+            "sample_keys": sample[relationship["child_fields"] + ["row_count"]].to_dict(
+                "records"
+            ),
+        }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        violations = list(executor.map(check, relationships))
+
+    for v in violations:
+        if v["violations"]:
+            logger.error(
+                f"{v['violations']} rows of {v['child_table']} refer to "
+                f"{v['distinct_keys']} keys missing from {v['parent_table']}."
+            )
+    if not any(v["violations"] for v in violations):
+        logger.info("Success! No foreign key violations found.")
+    return violations
+
+
 if __name__ == "__main__":
     sys.exit(pudl_check_fks())
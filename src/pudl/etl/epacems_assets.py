@@ -9,19 +9,20 @@ for processing each year of EPA CEMS data and execute these ops in parallel. For
 see: https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs and https://docs.dagster.io/concepts/assets/graph-backed-assets.
 """
 
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from pathlib import Path
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from dagster import AssetIn, DynamicOut, DynamicOutput, asset, graph_asset, op
 
 import pudl
 from pudl.extract.epacems import EpaCemsPartition
-from pudl.metadata.classes import Resource
-from pudl.metadata.enums import EPACEMS_STATES
+from pudl.metadata.registry import get_pyarrow_schema
 from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -38,6 +39,117 @@ def _partitioned_path() -> Path:
     return partitioned_path
 
 
+EPACEMS_SORT_KEYS: list[tuple[str, str]] = [
+    ("plant_id_eia", "ascending"),
+    ("plant_id_epa", "ascending"),
+    ("emissions_unit_id_epa", "ascending"),
+    ("operating_datetime_utc", "ascending"),
+]
+"""Order of the records within each row group of the EPA CEMS Parquet outputs.
+
+Sorting by ``plant_id_eia`` first keeps the range of plants in each row group narrow,
+so :func:`pudl.output.epacems.epacems_row_groups` can skip row groups of other plants.
+"""
+
+EPACEMS_ROW_GROUP_SIZE: int = 500_000
+"""Maximum number of records in a row group of the EPA CEMS Parquet outputs."""
+
+EPACEMS_MAX_BUFFERED_ROWS: int = 5_000_000
+"""Maximum number of records held in memory while consolidating a year of data."""
+
+EPACEMS_HIVE_NULL_PARTITION: str = "__HIVE_DEFAULT_PARTITION__"
+"""Name of the state partition holding records with no state."""
+
+
+def _split_by_state(batch: pa.RecordBatch) -> dict[str | None, pa.RecordBatch]:
+    """Split a record batch of EPA CEMS data into one record batch per state."""
+    states = batch.column("state")
+    if not pa.types.is_dictionary(states.type):
+        states = pc.dictionary_encode(states)
+    # Records with no state get their own code at the end of the dictionary.
+    dictionary = states.dictionary.to_pylist() + [None]
+    codes = states.indices.fill_null(len(dictionary) - 1).to_numpy()
+    counts = np.bincount(codes, minlength=len(dictionary))
+    batch = batch.take(np.argsort(codes, kind="stable"))
+    splits = {}
+    offset = 0
+    for state, count in zip(dictionary, counts, strict=True):
+        if count:
+            splits[state] = batch.slice(offset, count)
+            offset += count
+    return splits
+
+
+def epacems_partition_path(
+    base_path: Path, year: int, state: str | None, year_quarter: str
+) -> Path:
+    """Path to the partition of the EPA CEMS data for a given year, state and quarter.
+
+    The partitions are laid out in a hive-style ``year=YYYY/state=XX`` directory
+    structure so that readers can skip whole years and states based on the path alone.
+    Records with no state go in the ``state=__HIVE_DEFAULT_PARTITION__`` directory.
+    """
+    if state is None:
+        state = EPACEMS_HIVE_NULL_PARTITION
+    return (
+        base_path
+        / f"year={year}"
+        / f"state={state}"
+        / f"epacems-{year_quarter}.parquet"
+    )
+
+
+def write_state_partitions(
+    table: pa.Table,
+    base_path: Path,
+    year: int,
+    year_quarter: str,
+    row_group_size: int = EPACEMS_ROW_GROUP_SIZE,
+) -> list[Path]:
+    """Write a quarter of EPA CEMS data to one Parquet file per state.
+
+    Any existing partitions for the same quarter are removed first, so that states
+    which no longer have any data don't leave stale files behind. Within each file the
+    records are sorted by :data:`EPACEMS_SORT_KEYS` and split into row groups of a
+    consistent size.
+
+    Args:
+        table: A quarter of EPA CEMS data, conforming to the resource schema.
+        base_path: The root of the hive-partitioned EPA CEMS dataset.
+        year: The year that the data pertains to.
+        year_quarter: The year and quarter that the data pertains to, e.g. ``2022q1``.
+        row_group_size: The maximum number of records per row group.
+
+    Returns:
+        The paths of the Parquet files that were written.
+    """
+    for stale in base_path.glob(f"**/epacems-{year_quarter}.parquet"):
+        stale.unlink()
+
+    paths = []
+    # After combining chunks an empty table has no batches and any other table has one.
+    for batch in table.combine_chunks().to_batches():
+        for state, state_batch in _split_by_state(batch).items():
+            path = epacems_partition_path(base_path, year, state, year_quarter)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            state_table = pa.Table.from_batches([state_batch])
+            with pq.ParquetWriter(
+                where=path,
+                schema=table.schema,
+                compression="snappy",
+                version="2.6",
+                sorting_columns=pq.SortingColumn.from_ordering(
+                    table.schema, EPACEMS_SORT_KEYS
+                ),
+            ) as writer:
+                writer.write_table(
+                    state_table.sort_by(EPACEMS_SORT_KEYS),
+                    row_group_size=row_group_size,
+                )
+            paths.append(path)
+    return paths
+
+
 @op(
     out=DynamicOut(),
     required_resource_keys={"dataset_settings"},
@@ -78,7 +190,7 @@ def process_single_year(
     ds = context.resources.datastore
     epacems_settings = context.resources.dataset_settings.epacems
 
-    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    schema = get_pyarrow_schema("core_epacems__hourly_emissions")
     partitioned_path = _partitioned_path()
 
     year_quarters_in_year = {
@@ -89,29 +201,80 @@ def process_single_year(
 
     for year_quarter in year_quarters_in_year:
         logger.info(f"Processing EPA CEMS hourly data for {year_quarter}")
-        df = pudl.extract.epacems.extract(year_quarter=year_quarter, ds=ds)
-        if not df.empty:  # If state-year combination has data
-            df = pudl.transform.epacems.transform(
-                df, core_epa__assn_eia_epacamd, core_eia__entity_plants
-            )
-        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-
-        # Write to a directory of partitioned parquet files
-        with pq.ParquetWriter(
-            where=partitioned_path / f"epacems-{year_quarter}.parquet",
+        # Extract and transform the quarter in bounded chunks, only accumulating the
+        # much more compact Arrow representation of the transformed data.
+        dfs = pudl.extract.epacems.extract_batches(year_quarter=year_quarter, ds=ds)
+        table = pa.Table.from_batches(
+            [
+                pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+                for df in pudl.transform.epacems.transform_batches(
+                    (df for df in dfs if not df.empty),
+                    core_epa__assn_eia_epacamd,
+                    core_eia__entity_plants,
+                )
+            ],
             schema=schema,
-            compression="snappy",
-            version="2.6",
-        ) as partitioned_writer:
-            partitioned_writer.write_table(table)
+        )
+        write_state_partitions(table, partitioned_path, year, year_quarter)
 
     return YearPartitions(year_quarters_in_year)
 
 
+def write_year_state_row_groups(
+    writer: pq.ParquetWriter,
+    sources: list[Path],
+    max_buffered_rows: int = EPACEMS_MAX_BUFFERED_ROWS,
+    row_group_size: int = EPACEMS_ROW_GROUP_SIZE,
+) -> None:
+    """Reorganize several EPA CEMS Parquet files into year-state row groups.
+
+    Each of the source files is read exactly once, one record batch at a time. The
+    batches are split up by state and buffered until all of the sources have been
+    read, at which point each state's records are sorted by :data:`EPACEMS_SORT_KEYS`
+    and written out as one or more row groups. If more than ``max_buffered_rows``
+    records are buffered at any point, the state with the most buffered records is
+    written out early, so each row group still contains a single state (and year, if
+    the sources are all from the same year) but memory use is bounded.
+
+    Because the records in each row group are sorted and only belong to one state,
+    the row group statistics let readers skip row groups which don't contain the
+    states, plants or times they are interested in.
+
+    Args:
+        writer: The Parquet writer to write the row groups with.
+        sources: The Parquet files to read the records from.
+        max_buffered_rows: The maximum number of records to buffer in memory.
+        row_group_size: The maximum number of records per row group.
+    """
+    buffers: dict[str | None, list[pa.RecordBatch]] = defaultdict(list)
+    buffered_rows: dict[str | None, int] = defaultdict(int)
+
+    def flush(state: str | None) -> None:
+        table = pa.Table.from_batches(buffers.pop(state)).cast(writer.schema)
+        del buffered_rows[state]
+        writer.write_table(
+            table.sort_by(EPACEMS_SORT_KEYS), row_group_size=row_group_size
+        )
+
+    for source in sources:
+        for batch in pq.ParquetFile(source).iter_batches():
+            for state, state_batch in _split_by_state(batch).items():
+                buffers[state].append(state_batch)
+                buffered_rows[state] += state_batch.num_rows
+            while sum(buffered_rows.values()) > max_buffered_rows:
+                flush(max(buffered_rows, key=buffered_rows.get))
+
+    for state in sorted(buffers, key=lambda state: (state is None, state)):
+        flush(state)
+
+
 @op
 def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     """Read partitions into memory and write to a single monolithic output.
 
+    Each year's quarterly partitions are streamed into year-state row groups in a
+    single pass using :func:`write_year_state_row_groups`.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         partitions: Year and state combinations in the output database.
@@ -120,28 +283,28 @@ def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     monolithic_path = (
         PudlPaths().output_dir / "parquet" / "core_epacems__hourly_emissions.parquet"
     )
-    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    schema = get_pyarrow_schema("core_epacems__hourly_emissions")
 
     with pq.ParquetWriter(
-        where=monolithic_path, schema=schema, compression="snappy", version="2.6"
+        where=monolithic_path,
+        schema=schema,
+        compression="snappy",
+        version="2.6",
+        sorting_columns=pq.SortingColumn.from_ordering(schema, EPACEMS_SORT_KEYS),
     ) as monolithic_writer:
         for year_partition in partitions:
-            for state in EPACEMS_STATES:
-                monolithic_writer.write_table(
-                    # Concat a slice of each state's data from all quarters in a year
-                    # and write to parquet to create year-state row groups
-                    pa.concat_tables(
-                        [
-                            pq.read_table(
-                                source=partitioned_path
-                                / f"epacems-{year_quarter}.parquet",
-                                filters=[[("state", "=", state.upper())]],
-                                schema=schema,
-                            )
-                            for year_quarter in year_partition.year_quarters
-                        ]
+            write_year_state_row_groups(
+                monolithic_writer,
+                sources=[
+                    path
+                    for year_quarter in sorted(year_partition.year_quarters)
+                    for path in sorted(
+                        partitioned_path.glob(
+                            f"year=*/state=*/epacems-{year_quarter}.parquet"
+                        )
                     )
-                )
+                ],
+            )
 
 
 @graph_asset
@@ -152,7 +315,8 @@ def core_epacems__hourly_emissions(
     """Extract, transform and load CSVs for EPA CEMS.
 
     This asset creates a dynamic graph of ops to process EPA CEMS data in parallel. It
-    will create both a partitioned and single monolithic parquet output. For more
+    will create both a hive-partitioned (``year=YYYY/state=XX``) and single monolithic
+    parquet output. For more
     information see:
     https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs.
     """
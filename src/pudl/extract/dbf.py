@@ -3,14 +3,17 @@
 import contextlib
 import csv
 import importlib.resources
+import multiprocessing
 import warnings
 import zipfile
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import IO, Any, Protocol, Self
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
 from dagster import op
@@ -186,11 +189,10 @@ class FercDbfArchive:
             table_name: name of the table.
         """
         sch = self.get_table_schema(table_name)
-        df = pd.DataFrame(iter(self.get_table_dbf(table_name)))
-        df = df.drop("_NullFlags", axis=1, errors="ignore").rename(
-            sch.get_column_rename_map(), axis=1
+        df = dbf_to_dataframe(
+            self.get_table_dbf(table_name), skip_fields=("_NullFlags",)
         )
-        return df
+        return df.rename(sch.get_column_rename_map(), axis=1)
 
 
 class AbstractFercDbfReader(Protocol):
@@ -276,6 +278,231 @@ which should result in an error if encountered.
 """
 
 
+def _factorize_fixed_width(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Finds the distinct values in a column of fixed width byte strings.
+
+    Args:
+        values: 2D array of bytes, with one row per value.
+
+    Returns:
+        The index of the distinct value found in each row, and the distinct values as a
+        2D array of bytes.
+    """
+    num_rows, width = values.shape
+    if width <= 8:
+        # Short values can be hashed as integers, which is much faster than sorting.
+        padded = np.zeros((num_rows, 8), dtype=np.uint8)
+        padded[:, :width] = values
+        codes, uniques = pd.factorize(padded.view(np.uint64).ravel())
+        return codes, uniques.view(np.uint8).reshape(-1, 8)[:, :width]
+    uniques, codes = np.unique(
+        np.ascontiguousarray(values).view(f"V{width}").ravel(), return_inverse=True
+    )
+    return codes, uniques.view(np.uint8).reshape(-1, width)
+
+
+def _parse_distinct(
+    values: np.ndarray, field: Any, parse: Callable[[Any, bytes], Any]
+) -> np.ndarray:
+    """Parses each distinct value in a column only once.
+
+    Args:
+        values: 2D array of bytes, with one row per value.
+        field: the DBF field the values belong to.
+        parse: the field parser method to apply to the raw bytes of each value.
+
+    Returns:
+        Object array with the parsed value of each row.
+    """
+    codes, uniques = _factorize_fixed_width(values)
+    parsed = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques):
+        parsed[i] = parse(field, value.tobytes())
+    return parsed[codes]
+
+
+def _decode_decimals(values: np.ndarray) -> dict[str, np.ndarray]:
+    """Decodes a column of space padded decimal numbers like ``"  -12.50"``.
+
+    The column is scanned one character position at a time, so that only a few arrays
+    with one element per row are needed. A row is valid if, apart from surrounding
+    spaces, it consists of an optional leading minus sign followed by digits with at
+    most one decimal point. Valid rows can have at most 15 digits, so their digits are
+    exactly representable as both 64 bit integers and floats.
+
+    Args:
+        values: 2D array of bytes, with one row per value.
+
+    Returns:
+        Dictionary of arrays describing each row: ``valid``, ``started`` (not all
+        spaces), ``negative``, ``has_point``, ``num_digits``, ``num_frac_digits`` and
+        ``mantissa``, which holds the digits interpreted as an integer.
+    """
+    num_rows = values.shape[0]
+    invalid = np.zeros(num_rows, dtype=bool)
+    started = np.zeros(num_rows, dtype=bool)
+    ended = np.zeros(num_rows, dtype=bool)
+    negative = np.zeros(num_rows, dtype=bool)
+    has_point = np.zeros(num_rows, dtype=bool)
+    num_digits = np.zeros(num_rows, dtype=np.int64)
+    num_frac_digits = np.zeros(num_rows, dtype=np.int64)
+    mantissa = np.zeros(num_rows, dtype=np.int64)
+    # Transpose, so that each character position is contiguous in memory.
+    for char in np.ascontiguousarray(values.T):
+        space = char == ord(" ")
+        minus = char == ord("-")
+        point = char == ord(".")
+        # Characters below "0" wrap around to large unsigned values.
+        digit_value = char - np.uint8(ord("0"))
+        digit = digit_value <= 9
+        invalid |= ~(space | minus | point | digit)
+        invalid |= ended & ~space
+        invalid |= minus & started
+        invalid |= point & has_point
+        ended |= started & space
+        started |= ~space
+        negative |= minus
+        has_point |= point
+        num_digits += digit
+        num_frac_digits += digit & has_point
+        # Digits beyond the 15th are invalid anyway, so don't let the mantissa overflow.
+        mantissa = np.where(
+            digit & (num_digits <= 15), mantissa * 10 + digit_value, mantissa
+        )
+    return {
+        "valid": ~invalid & (num_digits <= 15),
+        "started": started,
+        "negative": negative,
+        "has_point": has_point,
+        "num_digits": num_digits,
+        "num_frac_digits": num_frac_digits,
+        "mantissa": mantissa,
+    }
+
+
+def _decode_numeric(
+    values: np.ndarray, field: Any, parser: FieldParser
+) -> np.ndarray | pd.Series:
+    """Decodes a numeric (N or F) DBF column in bulk.
+
+    Values are converted exactly as :meth:`FercFieldParser.parseN` and
+    :meth:`dbfread.FieldParser.parseF` would, including the FERC specific quirks: a
+    bare ``.`` is 0, and zero values without a decimal point are read as nulls because
+    leading zeros are stripped. Values which aren't plain decimal numbers, e.g. those
+    padded with ``*`` or NUL characters, are passed to the field parser one distinct
+    value at a time.
+
+    Returns:
+        An int64 array if every value is an integer, a float64 array if some values are
+        floats or nulls, and an object array of parsed values otherwise.
+    """
+    num_rows, width = values.shape
+    if width <= 8:
+        # Narrow columns like IDs and years often repeat their values, in which case
+        # it's cheaper to decode each distinct value once.
+        codes, uniques = _factorize_fixed_width(values)
+        if len(uniques) <= num_rows // 2:
+            return _decode_numeric(uniques, field, parser)[codes]
+    dec = _decode_decimals(values)
+    numbers = dec["mantissa"].astype(np.float64) / 10.0 ** dec["num_frac_digits"]
+    numbers = np.where(dec["negative"], -numbers, numbers)
+    if field.type == "N":
+        # FercFieldParser.parseN returns an int unless the value has a decimal point,
+        # except that a bare point (possibly with leading zeros) is the integer 0.
+        zero = ~dec["negative"] & (dec["mantissa"] == 0)
+        is_null = ~dec["has_point"] & zero
+        is_int = ~dec["has_point"] & ~zero | dec["has_point"] & zero & (
+            dec["num_frac_digits"] == 0
+        )
+        # A minus sign without any digits is invalid.
+        valid = dec["valid"] & ~(dec["negative"] & (dec["num_digits"] == 0))
+    else:
+        # parseF returns a float, or None for blank values.
+        is_null = ~dec["started"]
+        is_int = np.zeros_like(is_null)
+        valid = dec["valid"] & (is_null | (dec["num_digits"] > 0))
+
+    if valid.all():
+        if is_null.all():
+            return np.full(len(values), None, dtype=object)
+        if is_int.all():
+            return np.where(dec["negative"], -dec["mantissa"], dec["mantissa"])
+        return np.where(is_null, np.nan, numbers)
+
+    parsed = np.empty(len(values), dtype=object)
+    ints = np.where(dec["negative"], -dec["mantissa"], dec["mantissa"])
+    parsed[valid & is_int] = ints[valid & is_int].tolist()
+    parsed[valid & ~is_int & ~is_null] = numbers[valid & ~is_int & ~is_null].tolist()
+    parsed[~valid] = _parse_distinct(values[~valid], field, parser.parse)
+    return pd.Series(parsed).infer_objects().to_numpy()
+
+
+def _decode_text(values: np.ndarray, field: Any, parser: FieldParser) -> np.ndarray:
+    """Decodes a character (C) DBF column in bulk, like :meth:`FieldParser.parseC`."""
+    text = np.ascontiguousarray(values).view(f"S{values.shape[1]}").ravel()
+    return np.char.decode(
+        np.char.rstrip(text, b"\0 "), parser.encoding, parser.char_decode_errors
+    ).astype(object)
+
+
+def dbf_to_dataframe(dbf: DBF, skip_fields: tuple[str, ...] = ()) -> pd.DataFrame:
+    """Decodes the records of a DBF file column by column.
+
+    DBF records are fixed width, so the whole record block is viewed as a 2D array of
+    bytes and each field is sliced out and decoded as a column. Numeric, float and
+    character fields are decoded in bulk if the DBF uses the standard parsers for them
+    (or :class:`FercFieldParser` for numeric fields). All other fields are decoded
+    with the DBF's field parser, once per distinct value.
+
+    The result is the same as ``pd.DataFrame(iter(dbf))``: deleted records are skipped,
+    reading stops at the end of file marker, and the column dtypes are inferred from
+    the parsed values in the same way.
+
+    Args:
+        dbf: the DBF table to decode.
+        skip_fields: names of fields to leave out of the dataframe.
+    """
+    parser = dbf.parserclass(dbf)
+    record_len = dbf.header.recordlen
+    data = dbf.dbf_bytes().getbuffer()
+    num_records = (len(data) - dbf.header.headerlen) // record_len
+    if num_records <= 0:
+        return pd.DataFrame()
+    records = np.frombuffer(
+        data,
+        dtype=np.uint8,
+        offset=dbf.header.headerlen,
+        count=num_records * record_len,
+    ).reshape(-1, record_len)
+    eof = np.flatnonzero(records[:, 0] == 0x1A)
+    if eof.size:
+        records = records[: eof[0]]
+    records = records[records[:, 0] == ord(" ")]
+    if len(records) == 0:
+        return pd.DataFrame()
+
+    columns = {}
+    offset = 1
+    for field in dbf.fields:
+        start, offset = offset, offset + field.length
+        if field.name in skip_fields:
+            continue
+        values = records[:, start:offset]
+        if (field.type == "N" and type(parser).parseN is FercFieldParser.parseN) or (
+            field.type == "F" and type(parser).parseF is FieldParser.parseF
+        ):
+            columns[field.name] = _decode_numeric(values, field, parser)
+        elif field.type == "C" and type(parser).parseC is FieldParser.parseC:
+            columns[field.name] = _decode_text(values, field, parser)
+        else:
+            columns[field.name] = (
+                pd.Series(_parse_distinct(values, field, parser.parse))
+                .infer_objects()
+                .to_numpy()
+            )
+    return pd.DataFrame(columns)
+
+
 class PartitionedDataFrame:
     """This class bundles pandas.DataFrame with partition information."""
 
@@ -397,6 +624,30 @@ class FercDbfReader:
         return dfs
 
 
+_worker_dbf_reader: AbstractFercDbfReader | None = None
+"""The reader used by the current DBF extraction worker process."""
+
+
+def _init_dbf_worker(dbf_reader: AbstractFercDbfReader) -> None:
+    """Sets up a forked worker process to read tables with the given reader.
+
+    Archives opened by the parent process are forgotten, so that each worker opens its
+    own file handles instead of sharing the parent's file offsets.
+    """
+    global _worker_dbf_reader
+    _worker_dbf_reader = dbf_reader
+    get_archive = getattr(type(dbf_reader), "get_archive", None)
+    if hasattr(get_archive, "cache_clear"):
+        get_archive.cache_clear()
+
+
+def _load_table_dfs(
+    table_name: str, partition: dict[str, Any]
+) -> list[PartitionedDataFrame]:
+    """Loads a single table from a single partition in a DBF extraction worker."""
+    return _worker_dbf_reader.load_table_dfs(table_name, [partition])
+
+
 class FercDbfExtractor:
     """Generalized class for loading data from foxpro databases into SQLAlchemy.
 
@@ -423,6 +674,10 @@ class FercDbfExtractor:
     respondent_ids).
 
     The extraction logic is invoked by calling execute() method of this class.
+
+    Tables are parsed by a pool of worker processes, one (table, partition) pair at a
+    time, while the data is aggregated, transformed and written to sqlite in the main
+    process. Each worker opens each partition's archive at most once.
     """
 
     DATABASE_NAME = None
@@ -434,6 +689,7 @@ class FercDbfExtractor:
         settings: FercToSqliteSettings,
         output_path: Path,
         clobber: bool = False,
+        workers: int = 1,
     ):
         """Constructs new instance of FercDbfExtractor.
 
@@ -442,9 +698,12 @@ class FercDbfExtractor:
             settings: generic settings object for this extrctor.
             output_path: directory where the output databases should be stored.
             clobber: if True, existing databases should be replaced.
+            workers: number of worker processes used to parse the DBF files. If set to
+                1, tables are parsed serially in the current process.
         """
         self.settings: GenericDatasetSettings = self.get_settings(settings)
         self.clobber = clobber
+        self.workers = workers
         self.output_path = output_path
         self.datastore = datastore
         self.dbf_reader = self.get_dbf_reader(datastore)
@@ -490,6 +749,7 @@ class FercDbfExtractor:
                 settings=context.resources.ferc_to_sqlite_settings,
                 clobber=rs.clobber,
                 output_path=PudlPaths().output_dir,
+                workers=rs.dbf_num_workers,
             )
             dbf_extractor.execute()
 
@@ -573,6 +833,60 @@ class FercDbfExtractor:
             aggregated_df = pd.concat([df.df for df in dfs])
         return aggregated_df
 
+    def iter_table_dfs(
+        self, partitions: list[dict[str, Any]]
+    ) -> Iterator[tuple[str, list[PartitionedDataFrame]]]:
+        """Yields the partitioned data frames of each table, in table order.
+
+        If more than one worker is configured, each partition's archive is fetched in
+        the current process, and then the (table, partition) pairs are parsed in
+        parallel by a pool of forked worker processes. Only enough tables are
+        scheduled ahead of the one being yielded to keep all the workers busy, which
+        limits the number of parsed tables held in memory.
+
+        Args:
+            partitions: partition filters selecting the archives to read.
+        """
+        tables = self.dbf_reader.get_table_names()
+        if self.workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            for table in tables:
+                logger.info(f"Pandas: reading {table} into a DataFrame.")
+                yield table, self.dbf_reader.load_table_dfs(table, partitions)
+            return
+
+        # Fetch every archive before forking, so that workers starting with a cold
+        # cache don't all download the same archives at once.
+        for partition in partitions:
+            self.dbf_reader.get_archive(**partition)
+        logger.info(f"Reading {self.DATASET} tables with {self.workers} workers.")
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_dbf_worker,
+            initargs=(self.dbf_reader,),
+        ) as executor:
+            try:
+                scheduled = deque()
+                unscheduled = iter(tables)
+                while True:
+                    # Keep twice as many tasks in flight as there are workers.
+                    num_tasks = sum(len(futures) for _, futures in scheduled)
+                    while num_tasks < 2 * self.workers and (
+                        table := next(unscheduled, None)
+                    ):
+                        futures = [
+                            executor.submit(_load_table_dfs, table, p)
+                            for p in partitions
+                        ]
+                        scheduled.append((table, futures))
+                        num_tasks += len(futures)
+                    if not scheduled:
+                        break
+                    table, futures = scheduled.popleft()
+                    yield table, [pdf for f in futures for pdf in f.result()]
+            finally:
+                executor.shutdown(cancel_futures=True)
+
     def load_table_data(self):
         """Loads all tables from fox pro database and writes them to sqlite."""
         partitions = [
@@ -585,11 +899,8 @@ class FercDbfExtractor:
         logger.info(
             f"Loading {self.DATASET} table data from {len(partitions)} partitions."
         )
-        for table in self.dbf_reader.get_table_names():
-            logger.info(f"Pandas: reading {table} into a DataFrame.")
-            new_df = self.aggregate_table_frames(
-                table, self.dbf_reader.load_table_dfs(table, partitions)
-            )
+        for table, dfs in self.iter_table_dfs(partitions):
+            new_df = self.aggregate_table_frames(table, dfs)
             if new_df is None or len(new_df) <= 0:
                 logger.warning(f"Table {table} contains no data, skipping.")
                 continue
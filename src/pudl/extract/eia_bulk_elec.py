@@ -13,7 +13,6 @@ module.
 """
 
 import warnings
-from io import BytesIO
 from pathlib import Path
 
 import pandas as pd
@@ -120,6 +119,6 @@ def extract(ds: Datastore) -> dict[str, pd.DataFrame]:
     Returns:
         Dictionary of dataframes with keys 'metadata' and 'timeseries'
     """
-    raw_zipfile = ds.get_unique_resource("eia_bulk_elec")
-    dfs = _extract(BytesIO(raw_zipfile))
+    raw_zipfile = ds.get_unique_resource_file("eia_bulk_elec")
+    dfs = _extract(raw_zipfile)
     return dfs
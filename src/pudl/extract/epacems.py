@@ -20,10 +20,15 @@ Hence, we've called it `plant_id_epa` until it gets transformed into `plant_id_e
 during the transform process with help from the crosswalk.
 """
 
+import csv
+import itertools
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
 from pydantic import BaseModel, StringConstraints
 
 import pudl.logging_helpers
@@ -137,6 +142,28 @@ API_DTYPE_DICT = {
 }
 
 
+def _arrow_type(dtype: pd.api.extensions.ExtensionDtype) -> pa.DataType:
+    """Find the Arrow type corresponding to one of the pandas types above."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(dtype, pd.StringDtype):
+        return pa.string()
+    return pa.from_numpy_dtype(dtype.numpy_dtype)
+
+
+API_ARROW_TYPES: dict[str, pa.DataType] = {
+    col: _arrow_type(dtype) for col, dtype in API_DTYPE_DICT.items()
+}
+"""Arrow types to use when reading the EPA CEMS columns with :mod:`pyarrow.csv`."""
+
+API_PANDAS_TYPES: dict[pa.DataType, pd.api.extensions.ExtensionDtype] = {
+    API_ARROW_TYPES[col]: dtype
+    for col, dtype in API_DTYPE_DICT.items()
+    if not isinstance(dtype, pd.CategoricalDtype)
+}
+"""Pandas types to use when converting Arrow record batches of EPA CEMS data."""
+
+
 class EpaCemsPartition(BaseModel):
     """Represents EpaCems partition identifying unique resource file."""
 
@@ -188,6 +215,75 @@ class EpaCemsDatastore:
             )
         return df
 
+    def get_record_batches(
+        self, partition: EpaCemsPartition, block_size: int = 64 * 2**20
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream record batches from a zipfile for a given (year_quarter) partition.
+
+        Unlike :meth:`get_data_frame`, the CSV is read incrementally and decoded in
+        parallel using :mod:`pyarrow.csv`, so only a few blocks of the file need to be
+        held in memory at once.
+
+        Args:
+            partition: The year and quarter of data to read.
+            block_size: Approximate number of bytes of CSV to decode into each batch.
+
+        Yields:
+            Record batches with the columns renamed and typed as in
+            :meth:`get_data_frame`.
+        """
+        with (
+            self.datastore.get_zipfile_resource(
+                "epacems", **partition.get_filters()
+            ) as zf,
+            zf.open(str(partition.get_quarterly_file()), "r") as csv_file,
+        ):
+            yield from self._csv_to_record_batches(
+                csv_file,
+                ignore_cols=API_IGNORE_COLS,
+                rename_dict=API_RENAME_DICT,
+                arrow_types=API_ARROW_TYPES,
+                block_size=block_size,
+            )
+
+    def _csv_to_record_batches(
+        self,
+        csv_file: IO[bytes],
+        ignore_cols: set[str],
+        rename_dict: dict[str, str],
+        arrow_types: dict[str, pa.DataType],
+        block_size: int = 64 * 2**20,
+    ) -> Iterator[pa.RecordBatch]:
+        """Convert a CEMS csv file into a stream of :class:`pyarrow.RecordBatch`.
+
+        Args:
+            csv_file: Open binary file containing the CSV data to read.
+
+        Yields:
+            Record batches containing the filtered and typed contents of the CSV file.
+        """
+        # Consume the header ourselves so we know which columns to ask Arrow for.
+        header = next(csv.reader([csv_file.readline().decode("utf-8-sig")]))
+        include_columns = [col for col in header if col not in ignore_cols]
+        reader = pyarrow.csv.open_csv(
+            csv_file,
+            read_options=pyarrow.csv.ReadOptions(
+                column_names=header, block_size=block_size, use_threads=True
+            ),
+            convert_options=pyarrow.csv.ConvertOptions(
+                column_types={
+                    col: arrow_types[col]
+                    for col in include_columns
+                    if col in arrow_types
+                },
+                include_columns=include_columns,
+                strings_can_be_null=True,
+            ),
+        )
+        names = [rename_dict.get(col, col) for col in reader.schema.names]
+        for batch in reader:
+            yield pa.RecordBatch.from_arrays(batch.columns, names=names)
+
     def _csv_to_dataframe(
         self,
         csv_path: Path,
@@ -218,6 +314,41 @@ class EpaCemsDatastore:
         return df.astype(dtypes).rename(columns=rename_dict)
 
 
+def extract_batches(
+    year_quarter: str, ds: Datastore, block_size: int = 64 * 2**20
+) -> Iterator[pd.DataFrame]:
+    """Stream a quarter of EPA CEMS hourly data in bounded chunks.
+
+    This is the incremental equivalent of :func:`extract`, built on
+    :meth:`EpaCemsDatastore.get_record_batches`.
+
+    Args:
+        year_quarter: report year and quarter of the data to extract
+        ds: Initialized datastore
+        block_size: Approximate number of bytes of CSV to read into each chunk.
+
+    Yields:
+        Consecutive chunks of a single quarter of EPA CEMS hourly emissions data. If
+        the quarter is not available, nothing is yielded.
+    """
+    partition = EpaCemsPartition(year_quarter=year_quarter)
+    logger.info(f"Extracting record batches for {year_quarter}")
+    batches = EpaCemsDatastore(ds).get_record_batches(partition, block_size=block_size)
+    # The datastore is only searched once the first batch is requested. Any later
+    # errors must propagate rather than silently truncating the quarter.
+    try:
+        first_batch = next(batches)
+    except KeyError:
+        logger.warning(f"No data found for {year_quarter}.")
+        return
+    except StopIteration:
+        return
+    for batch in itertools.chain([first_batch], batches):
+        yield batch.to_pandas(types_mapper=API_PANDAS_TYPES.get).assign(
+            year=partition.year
+        )
+
+
 def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
     """Coordinate the extraction of EPA CEMS hourly DataFrames.
 
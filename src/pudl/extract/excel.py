@@ -1,11 +1,19 @@
 """Load excel metadata CSV files form a python data package."""
 
+import math
 import pathlib
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import date
 from io import BytesIO
+from typing import Any
 
 import dbfread
 import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
 
 import pudl
 from pudl.extract.extractor import GenericExtractor, GenericMetadata, PartitionSelection
@@ -13,6 +21,147 @@ from pudl.extract.extractor import GenericExtractor, GenericMetadata, PartitionS
 logger = pudl.logging_helpers.get_logger(__name__)
 
 
+def _as_excel_cell(value: Any) -> Any:
+    """Convert a value to what reading it back from an Excel cell would produce.
+
+    Missing values become empty cells, infinities are written out as strings, whole
+    floats are read back as integers and dates as timestamps, just like when a
+    DataFrame is written with :meth:`pandas.DataFrame.to_excel` and read back with the
+    calamine engine.
+    """
+    if value is None or value is pd.NaT or value is pd.NA:
+        return ""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return int(value) if value.is_integer() else value
+    if isinstance(value, date):
+        return pd.Timestamp(value)
+    return value
+
+
+def read_dataframe_sheet(
+    df: pd.DataFrame,
+    skiprows: int = 0,
+    skipfooter: int = 0,
+    dtype: dict | None = None,
+) -> pd.DataFrame:
+    """Parse a DataFrame as if it were a single Excel sheet, without an Excel file.
+
+    Non-Excel sources like DBF files used to be written out to an in-memory workbook
+    just so they could be read back with :func:`pandas.read_excel`. Instead, this
+    converts each cell the way the round trip would have and hands the rows to the
+    same :class:`pandas.io.parsers.TextParser` that :func:`pandas.read_excel` uses, so
+    the column names, type inference and NA handling are all unchanged.
+
+    Args:
+        df: The source data. Its column names are treated as the first row of the
+            sheet.
+        skiprows: Number of rows at the top of the sheet to skip.
+        skipfooter: Number of rows at the bottom of the sheet to skip.
+        dtype: Data types to use for specific columns.
+
+    Returns:
+        The parsed sheet.
+    """
+    rows = [[_as_excel_cell(col) for col in df.columns]]
+    rows += (
+        list(row)
+        for row in zip(
+            *(map(_as_excel_cell, df[col].tolist()) for col in df.columns),
+            strict=True,
+        )
+    )
+    # Entirely empty rows at the bottom of a sheet aren't part of its used range.
+    while rows and all(cell == "" for cell in rows[-1]):
+        rows.pop()
+    if not rows:
+        return pd.DataFrame()
+    try:
+        return TextParser(
+            rows,
+            header=0,
+            dtype=dtype,
+            skiprows=skiprows,
+            skipfooter=skipfooter,
+            skip_blank_lines=False,
+        ).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+Workbook = pd.ExcelFile | pd.DataFrame
+"""A source file opened by an :class:`ExcelExtractor`.
+
+Excel files are opened as :class:`pandas.ExcelFile` objects, while sources in other
+formats which only contain a single table are read into a DataFrame.
+"""
+
+
+class WorkbookCache:
+    """Thread safe LRU cache of opened workbooks, bounded by their size in bytes.
+
+    The cache is shared by all of the Excel extractors in a process, so that a workbook
+    which contains pages for several extractors, or which is extracted again later on,
+    doesn't need to be read out of its archive and opened again.
+    """
+
+    def __init__(self, max_bytes: int):
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached workbooks. Workbooks larger
+                than this are never cached.
+        """
+        self.max_bytes = max_bytes
+        self._workbooks: OrderedDict[Hashable, tuple[Workbook, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached workbooks."""
+        return len(self._workbooks)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the total size of the cached workbooks."""
+        return self._nbytes
+
+    def clear(self):
+        """Remove all workbooks from the cache."""
+        with self._lock:
+            self._workbooks.clear()
+            self._nbytes = 0
+
+    def get(self, key: Hashable, load: Callable[[], tuple[Workbook, int]]) -> Workbook:
+        """Returns a cached workbook, loading and caching it first if necessary.
+
+        Args:
+            key: uniquely identifies the workbook.
+            load: function which opens the workbook and returns it with its size.
+        """
+        with self._lock:
+            if key in self._workbooks:
+                self._workbooks.move_to_end(key)
+                return self._workbooks[key][0]
+        # Don't hold the lock while loading, so other workbooks can be read meanwhile.
+        workbook, nbytes = load()
+        with self._lock:
+            if key not in self._workbooks and nbytes <= self.max_bytes:
+                self._workbooks[key] = (workbook, nbytes)
+                self._nbytes += nbytes
+                while self._nbytes > self.max_bytes:
+                    _, (_, evicted_nbytes) = self._workbooks.popitem(last=False)
+                    self._nbytes -= evicted_nbytes
+        return workbook
+
+
+WORKBOOK_CACHE = WorkbookCache(max_bytes=512 * 2**20)
+"""Workbooks opened by all of the Excel extractors in this process."""
+
+
 class ExcelMetadata(GenericMetadata):
     """Load Excel metadata from Python package data.
 
@@ -138,15 +287,31 @@ class ExcelExtractor(GenericExtractor):
 
     METADATA: ExcelMetadata = None
 
-    def __init__(self, ds):
+    def __init__(self, ds, workers: int = 1):
         """Create new extractor object and load metadata.
 
         Args:
             ds (datastore.Datastore): An initialized datastore, or subclass
+            workers: Number of threads used to extract different source files
+                concurrently.
         """
-        super().__init__(ds)
+        super().__init__(ds, workers=workers)
         self._metadata = self.METADATA
-        self._file_cache = {}
+        self._parsed_sheets = threading.local()
+
+    def extract_pages(
+        self, pages: list[str], **partition: PartitionSelection
+    ) -> dict[str, pd.DataFrame]:
+        """Load and process the given pages of a single partition.
+
+        Several pages are often read from the same sheet with the same parameters, so
+        each distinct sheet is only parsed once while extracting the pages.
+        """
+        self._parsed_sheets.frames = {}
+        try:
+            return super().extract_pages(pages, **partition)
+        finally:
+            del self._parsed_sheets.frames
 
     def process_raw(
         self, df: pd.DataFrame, page: str, **partition: PartitionSelection
@@ -208,7 +373,12 @@ class ExcelExtractor(GenericExtractor):
         return partition
 
     def load_source(self, page: str, **partition: PartitionSelection) -> pd.DataFrame:
-        """Produce the ExcelFile object for the given (partition, page).
+        """Produce the DataFrame for the given (partition, page).
+
+        Excel files are parsed with :func:`pandas.read_excel`. Sources in other formats
+        (DBF files) only contain a single table, which is read directly into a
+        DataFrame and parsed as if it were the requested sheet with
+        :func:`read_dataframe_sheet`.
 
         Args:
             page: pudl name for the dataset contents, eg "boiler_generator_assn" or
@@ -220,39 +390,82 @@ class ExcelExtractor(GenericExtractor):
         Returns:
             pd.DataFrame instance with the parsed Excel spreadsheet frame
         """
+        workbook_key, workbook = self.load_workbook(page, **partition)
+        sheet_name = self._metadata.get_sheet_name(page, **partition)
+        skiprows = self._metadata.get_skiprows(page, **partition)
+        skipfooter = self._metadata.get_skipfooter(page, **partition)
+        dtype = self.get_dtypes(page, **partition)
+
+        # Parsed sheets are only reused within a call to extract_pages().
+        parsed_sheets = getattr(self._parsed_sheets, "frames", None)
+        sheet_key = (
+            workbook_key,
+            str(sheet_name),
+            int(skiprows),
+            int(skipfooter),
+            tuple((col, str(col_type)) for col, col_type in dtype.items()),
+        )
+        if parsed_sheets is not None and sheet_key in parsed_sheets:
+            # Pages are processed in place, so every page needs its own copy.
+            return parsed_sheets[sheet_key].copy()
+
+        if isinstance(workbook, pd.DataFrame):
+            df = read_dataframe_sheet(
+                workbook, skiprows=skiprows, skipfooter=skipfooter, dtype=dtype
+            )
+        else:
+            df = pd.read_excel(
+                workbook,
+                sheet_name=sheet_name,
+                skiprows=skiprows,
+                skipfooter=skipfooter,
+                dtype=dtype,
+            )
+        if parsed_sheets is not None:
+            parsed_sheets[sheet_key] = df.copy()
+        return df
+
+    def load_workbook(
+        self, page: str, **partition: PartitionSelection
+    ) -> tuple[tuple, Workbook]:
+        """Open the file containing the given (partition, page).
+
+        Workbooks are cached in :data:`WORKBOOK_CACHE`, which is shared by all
+        extractors.
+
+        Args:
+            page: pudl name for the dataset contents, eg "boiler_generator_assn" or
+                "coal_stocks",
+            partition: partition to load. Examples:
+                {'year': 2009}
+                {'year_month': '2020-08'}
+
+        Returns:
+            The key identifying the workbook and the workbook itself.
+        """
         xlsx_filename = self.source_filename(page, **partition)
+        zip_partition = self.zipfile_resource_partitions(page, **partition)
+        key = (
+            self._dataset_name,
+            tuple(sorted((name, str(value)) for name, value in zip_partition.items())),
+            xlsx_filename,
+        )
 
-        if xlsx_filename not in self._file_cache:
-            excel_file = None
+        def load() -> tuple[Workbook, int]:
             with self.ds.get_zipfile_resource(
-                self._dataset_name,
-                **self.zipfile_resource_partitions(page, **partition),
+                self._dataset_name, **zip_partition
             ) as zf:
-                # If loading the excel file from the zip fails then try to open a dbf file.
                 extension = pathlib.Path(xlsx_filename).suffix.lower()
                 if extension == ".dbf":
                     with zf.open(xlsx_filename) as dbf_filepath:
                         df = pd.DataFrame(
                             iter(dbfread.DBF(xlsx_filename, filedata=dbf_filepath))
                         )
-                        excel_file = pudl.helpers.convert_df_to_excel_file(
-                            df, index=False
-                        )
-                else:
-                    excel_file = pd.ExcelFile(
-                        BytesIO(zf.read(xlsx_filename)), engine="calamine"
-                    )
-            self._file_cache[xlsx_filename] = excel_file
-        # TODO(rousik): this _file_cache could be replaced with @cache or @memoize annotations
-        excel_file = self._file_cache[xlsx_filename]
-
-        return pd.read_excel(
-            excel_file,
-            sheet_name=self._metadata.get_sheet_name(page, **partition),
-            skiprows=self._metadata.get_skiprows(page, **partition),
-            skipfooter=self._metadata.get_skipfooter(page, **partition),
-            dtype=self.get_dtypes(page, **partition),
-        )
+                    return df, int(df.memory_usage(deep=True).sum())
+                contents = zf.read(xlsx_filename)
+                return pd.ExcelFile(BytesIO(contents), engine="calamine"), len(contents)
+
+        return key, WORKBOOK_CACHE.get(key, load)
 
     def source_filename(self, page: str, **partition: PartitionSelection) -> str:
         """Produce the xlsx document file name as it will appear in the archive.
@@ -1,14 +1,17 @@
 """Generic functionality for extractors."""
 
 import importlib.resources
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from dagster import (
     AssetsDefinition,
     DynamicOut,
     DynamicOutput,
+    Field,
     OpDefinition,
     graph_asset,
     op,
@@ -96,18 +99,44 @@ class GenericExtractor(ABC):
     BLACKLISTED_PAGES = []
     """List of supported pages that should not be extracted."""
 
-    def __init__(self, ds):
+    def __init__(self, ds, workers: int = 1):
         """Create new extractor object and load metadata.
 
         Args:
             ds (datastore.Datastore): An initialized datastore, or subclass
+            workers: Number of threads used to extract different source files
+                concurrently. Pages from the same source file are always extracted
+                by the same thread.
         """
         if not self.METADATA:
             raise NotImplementedError("self.METADATA must be set.")
         self._metadata = self.METADATA
         self._dataset_name = self._metadata.get_dataset_name()
         self.ds = ds
-        self.cols_added: list[str] = []
+        self.workers = workers
+        self.cols_added = []
+
+    @property
+    def cols_added(self) -> list[str]:
+        """Columns added to the page currently being extracted, beyond those read.
+
+        Pages may be extracted concurrently by several threads, so each thread keeps
+        track of the columns added to its own page.
+        """
+        page_state = self._page_state()
+        if not hasattr(page_state, "cols_added"):
+            page_state.cols_added = []
+        return page_state.cols_added
+
+    @cols_added.setter
+    def cols_added(self, cols: list[str]):
+        self._page_state().cols_added = cols
+
+    def _page_state(self) -> threading.local:
+        # Subclasses may set cols_added before calling Extractor.__init__
+        if "_page_local" not in self.__dict__:
+            self._page_local = threading.local()
+        return self._page_local
 
     @abstractmethod
     def source_filename(self, page: str, **partition: PartitionSelection) -> str:
@@ -199,6 +228,39 @@ class GenericExtractor(ABC):
 
         return self.process_final_page(df, page)
 
+    def extract_pages(
+        self, pages: list[str], **partition: PartitionSelection
+    ) -> dict[str, pd.DataFrame]:
+        """Load and process the given pages of a single partition.
+
+        Args:
+            pages: names of the pages to extract.
+            partition: partition to load. Examples:
+                {'year': 2009}
+                {'year_month': '2020-08'}
+
+        Returns:
+            dict where keys are page names and values are the processed DataFrames.
+            Pages which don't exist in the partition are left out.
+        """
+        page_dfs = {}
+        for page in pages:
+            # we are going to skip
+            if self.source_filename(page, **partition) == "-1":
+                logger.debug(f"No page for {self._dataset_name} {page} {partition}")
+                continue
+            logger.debug(
+                f"Loading dataframe for {self._dataset_name} {page} {partition}"
+            )
+            df = self.load_source(page, **partition)
+            self.cols_added = []
+            df = pudl.helpers.simplify_columns(df)
+            df = self.process_raw(df, page, **partition)
+            df = self.process_renamed(df, page, **partition)
+            self.validate(df, page, **partition)
+            page_dfs[page] = df
+        return page_dfs
+
     def extract(self, **partitions: PartitionSelection) -> dict[str, pd.DataFrame]:
         """Extracts dataframes.
 
@@ -221,28 +283,37 @@ class GenericExtractor(ABC):
             return all_page_dfs
         logger.info(f"Extracting {self._dataset_name} spreadsheet data.")
 
+        pages = []
         for page in self._metadata.get_all_pages():
             if page in self.BLACKLISTED_PAGES:
                 logger.debug(f"Skipping blacklisted page {page}.")
                 continue
+            pages.append(page)
+        # Group the pages of each partition by the file they come from, so that each
+        # file only needs to be opened once, and different files can be extracted
+        # concurrently.
+        tasks = []
+        for partition in pudl.helpers.iterate_multivalue_dict(**partitions):
+            pages_by_file = defaultdict(list)
+            for page in pages:
+                pages_by_file[self.source_filename(page, **partition)].append(page)
+            tasks += [(file_pages, partition) for file_pages in pages_by_file.values()]
+
+        def extract_task(task):
+            file_pages, partition = task
+            return self.extract_pages(file_pages, **partition)
+
+        if self.workers > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                task_dfs = list(executor.map(extract_task, tasks))
+        else:
+            task_dfs = list(map(extract_task, tasks))
+
+        for page in pages:
             current_page_dfs = [
                 pd.DataFrame(),
             ]
-            for partition in pudl.helpers.iterate_multivalue_dict(**partitions):
-                # we are going to skip
-                if self.source_filename(page, **partition) == "-1":
-                    logger.debug(f"No page for {self._dataset_name} {page} {partition}")
-                    continue
-                logger.debug(
-                    f"Loading dataframe for {self._dataset_name} {page} {partition}"
-                )
-                df = self.load_source(page, **partition)
-                df = pudl.helpers.simplify_columns(df)
-                df = self.process_raw(df, page, **partition)
-                df = self.process_renamed(df, page, **partition)
-                self.validate(df, page, **partition)
-                current_page_dfs.append(df)
-
+            current_page_dfs += [dfs[page] for dfs in task_dfs if page in dfs]
             all_page_dfs[page] = self.combine(current_page_dfs, page)
         return all_page_dfs
 
@@ -290,6 +361,16 @@ def year_extractor_factory(
     """
 
     @op(
+        config_schema={
+            "workers": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of threads used to parse the source files of the year "
+                    "concurrently."
+                ),
+            ),
+        },
         required_resource_keys={"datastore", "dataset_settings"},
         name=f"extract_single_{name}_year",
     )
@@ -306,7 +387,9 @@ def year_extractor_factory(
             A dictionary of DataFrames extracted from Excel, keyed by page name.
         """
         ds = context.resources.datastore
-        return extractor_cls(ds).extract(year=[year])
+        return extractor_cls(ds, workers=context.op_config["workers"]).extract(
+            year=[year]
+        )
 
     return extract_single_year
 
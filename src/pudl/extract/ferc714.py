@@ -1,9 +1,10 @@
 """Routines used for extracting the raw FERC 714 data."""
 
 from collections import OrderedDict
+from typing import IO
 
 import pandas as pd
-from dagster import AssetsDefinition, asset
+from dagster import AssetsDefinition, Output, asset
 
 import pudl
 
@@ -63,6 +64,76 @@ FERC714_FILES: OrderedDict[str, dict[str, str]] = OrderedDict(
 )
 """Dictionary mapping PUDL tables to FERC-714 filenames and character encodings."""
 
+FERC714_UNUSED_COLUMNS: set[str] = {"report_prd", "spplmnt_num", "row_num"}
+"""Columns which every FERC-714 transform drops, along with footnotes ending in ``_f``.
+
+These columns aren't read out of the CSVs at all.
+"""
+
+
+FERC714_DTYPES: dict[str, str] = {
+    "respondent_id": "Int64",
+    "respondent_name": "object",
+    "eia_code": "Int64",
+    "report_yr": "Int64",
+    "plan_date": "object",
+    "timezone": "object",
+} | {f"hour{hour:02}": "float64" for hour in range(1, 26)}
+"""Types of the FERC-714 CSV columns which are used in the transforms.
+
+The CSVs are parsed in chunks, so the types of these columns are given explicitly
+rather than being inferred separately from the values in each chunk.
+"""
+
+
+def _is_used_column(col: str) -> bool:
+    return not col.endswith("_f") and col not in FERC714_UNUSED_COLUMNS
+
+
+def read_ferc714_csv(
+    csv_file: IO[bytes],
+    encoding: str,
+    years: list[int] | None = None,
+    chunksize: int = 100_000,
+) -> tuple[pd.DataFrame, int]:
+    """Read the used columns and requested years of a FERC-714 CSV.
+
+    The CSV is parsed in chunks, and the records from other years are discarded as soon
+    as each chunk has been parsed, so the whole CSV never needs to be held in memory.
+
+    Args:
+        csv_file: The CSV file to read.
+        encoding: Character encoding of the CSV file.
+        years: Report years to keep. If None, all records are kept.
+        chunksize: Number of rows to parse at a time.
+
+    Returns:
+        The records from the requested years, and the total number of records which
+        were scanned to find them. If there are no such records, the dataframe is
+        empty but still has all of the used columns.
+    """
+    chunks = []
+    empty = pd.DataFrame()
+    rows_scanned = 0
+    with pd.read_csv(
+        csv_file,
+        encoding=encoding,
+        usecols=_is_used_column,
+        dtype=FERC714_DTYPES,
+        chunksize=chunksize,
+    ) as reader:
+        for chunk in reader:
+            rows_scanned += len(chunk)
+            if years is not None:
+                chunk = chunk[chunk.report_yr.isin(years)]
+            if chunk.empty:
+                empty = chunk
+            else:
+                chunks.append(chunk)
+    if not chunks:
+        return empty, rows_scanned
+    return pd.concat(chunks), rows_scanned
+
 
 def generate_raw_ferc714_asset(table_name: str) -> AssetsDefinition:
     """Generates an asset for building the raw FERC 714 dataframe."""
@@ -89,13 +160,16 @@ def generate_raw_ferc714_asset(table_name: str) -> AssetsDefinition:
             ds.get_zipfile_resource("ferc714", name="ferc714.zip") as zf,
             zf.open(FERC714_FILES[table_name]["name"]) as csv_file,
         ):
-            df = pd.read_csv(
+            df, rows_scanned = read_ferc714_csv(
                 csv_file,
                 encoding=FERC714_FILES[table_name]["encoding"],
+                years=(
+                    None if table_name == "respondent_id" else ferc714_settings.years
+                ),
             )
-        if table_name != "respondent_id":
-            df = df.query("report_yr in @ferc714_settings.years")
-        return df
+        return Output(
+            value=df, metadata={"rows_scanned": rows_scanned, "rows_kept": len(df)}
+        )
 
     return _extract_raw_ferc714
 
@@ -1,7 +1,13 @@
 """Generic extractor for all FERC XBRL data."""
 
+import contextlib
 import io
+import json
+import shutil
+import sqlite3
+import tempfile
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import date
 from pathlib import Path
 
@@ -38,13 +44,19 @@ class FercXbrlDatastore:
 
         return io.BytesIO(raw_archive), taxonomy_entry_point
 
-    def get_filings(self, year: int, form: XbrlFormNumber) -> io.BytesIO:
-        """Return the corresponding archive full of XBRL filings."""
-        return io.BytesIO(
-            self.datastore.get_unique_resource(
-                f"ferc{form.value}", year=year, data_format="xbrl"
-            )
+    def get_filings(self, year: int, form: XbrlFormNumber) -> Path | io.BytesIO:
+        """Return the corresponding archive full of XBRL filings.
+
+        If the archive is in the local file cache its path is returned, so that the
+        filings can be read from disk one at a time.
+        """
+        filings = self.datastore.get_unique_resource_file(
+            f"ferc{form.value}", year=year, data_format="xbrl"
         )
+        # The XBRL extractor only treats paths ending in .zip as archives.
+        if isinstance(filings, Path) and filings.suffix != ".zip":
+            return io.BytesIO(filings.read_bytes())
+        return filings
 
 
 def xbrl2sqlite_op_factory(form: XbrlFormNumber) -> Callable:
@@ -91,6 +103,7 @@ def xbrl2sqlite_op_factory(form: XbrlFormNumber) -> Callable:
             sql_path=sql_path,
             batch_size=rs.xbrl_batch_size,
             workers=rs.xbrl_num_workers,
+            year_workers=rs.xbrl_year_workers,
         )
 
     return inner_op
@@ -104,9 +117,15 @@ def convert_form(
     sql_path: Path,
     batch_size: int | None = None,
     workers: int | None = None,
+    year_workers: int = 1,
 ) -> None:
     """Clone a single FERC XBRL form to SQLite.
 
+    If more than one year is converted concurrently, each year is converted into its
+    own staging database by a separate process, and the staging databases are then
+    merged into ``sql_path`` in order of year. The result is the same as converting the
+    years one after another.
+
     Args:
         form_settings: Validated settings for converting the desired XBRL form to SQLite.
         form: FERC form number.
@@ -115,12 +134,27 @@ def convert_form(
         sql_path: path to the SQLite DB we'd like to write to.
         batch_size: Number of XBRL filings to process in a single CPU process.
         workers: Number of CPU processes to create for processing XBRL filings.
+        year_workers: Number of years to convert concurrently.
 
     Returns:
         None
     """
     datapackage_path = str(output_path / f"ferc{form.value}_xbrl_datapackage.json")
     metadata_path = str(output_path / f"ferc{form.value}_xbrl_taxonomy_metadata.json")
+    if year_workers > 1 and len(form_settings.years) > 1:
+        _convert_years_concurrently(
+            form_settings,
+            form,
+            datastore,
+            output_path=output_path,
+            sql_path=sql_path,
+            metadata_path=metadata_path,
+            datapackage_path=datapackage_path,
+            batch_size=batch_size,
+            workers=workers,
+            year_workers=year_workers,
+        )
+        return
     # Process XBRL filings for each year requested
     for year in form_settings.years:
         taxonomy_archive, taxonomy_entry_point = datastore.get_taxonomy(year, form)
@@ -141,3 +175,129 @@ def convert_form(
             loglevel="INFO",
             logfile=None,
         )
+
+
+def _convert_years_concurrently(
+    form_settings: FercGenericXbrlToSqliteSettings,
+    form: XbrlFormNumber,
+    datastore: FercXbrlDatastore,
+    output_path: Path,
+    sql_path: Path,
+    metadata_path: str,
+    datapackage_path: str,
+    batch_size: int | None,
+    workers: int | None,
+    year_workers: int,
+) -> None:
+    """Convert each year of a form into a staging database, then merge them."""
+    with tempfile.TemporaryDirectory(dir=output_path) as tmp_dir:
+        staging = {
+            year: Path(tmp_dir) / f"ferc{form.value}_xbrl_{year}"
+            for year in form_settings.years
+        }
+        logger.info(
+            f"Converting {len(staging)} years of ferc{form.value} XBRL data "
+            f"using {year_workers} processes."
+        )
+        with ProcessPoolExecutor(max_workers=year_workers) as executor:
+            # The filings of each year are only fetched once a process is free to
+            # convert them, so no more than year_workers archives are held in memory.
+            pending = set()
+            for year, path in staging.items():
+                if len(pending) >= year_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                taxonomy_archive, taxonomy_entry_point = datastore.get_taxonomy(
+                    year, form
+                )
+                pending.add(
+                    executor.submit(
+                        run_main,
+                        instance_path=datastore.get_filings(year, form),
+                        sql_path=path.with_suffix(".sqlite"),
+                        clobber=False,
+                        taxonomy=taxonomy_archive,
+                        entry_point=taxonomy_entry_point,
+                        form_number=form.value,
+                        metadata_path=str(path.with_suffix(".metadata.json")),
+                        datapackage_path=str(path.with_suffix(".datapackage.json")),
+                        workers=workers,
+                        batch_size=batch_size,
+                        loglevel="INFO",
+                        logfile=None,
+                    )
+                )
+            for future in pending:
+                future.result()
+
+        merge_sqlite_dbs(
+            sql_path, [path.with_suffix(".sqlite") for path in staging.values()]
+        )
+        # Converting the years one after another leaves the JSON outputs of the last
+        # year, which refer to the final database rather than a staging database.
+        last = staging[form_settings.years[-1]]
+        shutil.copyfile(last.with_suffix(".metadata.json"), metadata_path)
+        datapackage = json.loads(last.with_suffix(".datapackage.json").read_text())
+        for resource in datapackage["resources"]:
+            resource["path"] = f"sqlite:///{sql_path}"
+        Path(datapackage_path).write_text(
+            json.dumps(datapackage, separators=(",", ":"), ensure_ascii=False)
+        )
+
+
+def merge_sqlite_dbs(sql_path: Path, staging_paths: list[Path]) -> None:
+    """Append the contents of several SQLite databases to another one.
+
+    The staging databases are attached to the output database one at a time, and each
+    of their tables is copied with a single ``INSERT INTO ... SELECT`` statement.
+    Tables which don't exist in the output database yet are created using the schema
+    of the staging database, along with their indexes once they have been filled.
+
+    Args:
+        sql_path: the database to append to. It is created if it doesn't exist.
+        staging_paths: the databases to copy, in the order they should be appended.
+    """
+    with contextlib.closing(sqlite3.connect(sql_path, isolation_level=None)) as conn:
+        for staging_path in staging_paths:
+            if not staging_path.exists():
+                continue
+            logger.info(f"Merging {staging_path.name} into {sql_path.name}.")
+            conn.execute("ATTACH DATABASE ? AS staging", (str(staging_path),))
+            conn.execute("BEGIN")
+            existing = {
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM main.sqlite_master WHERE type = 'table'"
+                )
+            }
+            tables = conn.execute(
+                "SELECT name, sql FROM staging.sqlite_master WHERE type = 'table'"
+            ).fetchall()
+            new_indexes = []
+            for table, create_sql in tables:
+                if table not in existing:
+                    conn.execute(create_sql)
+                    new_indexes += [
+                        index_sql
+                        for (index_sql,) in conn.execute(
+                            "SELECT sql FROM staging.sqlite_master "
+                            "WHERE type = 'index' AND tbl_name = ? "
+                            "AND sql IS NOT NULL",
+                            (table,),
+                        )
+                    ]
+                columns = ", ".join(
+                    f'"{column}"'
+                    for (column,) in conn.execute(
+                        "SELECT name FROM pragma_table_info(?, 'staging')", (table,)
+                    )
+                )
+                conn.execute(
+                    f'INSERT INTO main."{table}" ({columns}) '  # noqa: S608
+                    f'SELECT {columns} FROM staging."{table}"'
+                )
+            for index_sql in new_indexes:
+                conn.execute(index_sql)
+            conn.execute("COMMIT")
+            conn.execute("DETACH DATABASE staging")
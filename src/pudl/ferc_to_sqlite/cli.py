@@ -92,6 +92,24 @@ def ferc_to_sqlite_job_factory(
         "Defaults to using the number of CPUs."
     ),
 )
+@click.option(
+    "--xbrl-year-workers",
+    type=int,
+    default=1,
+    help=(
+        "Number of years of XBRL filings to convert concurrently, each in its own "
+        "process with its own staging database."
+    ),
+)
+@click.option(
+    "--dbf-workers",
+    type=int,
+    default=1,
+    help=(
+        "Number of worker processes to use when parsing FERC DBF tables. "
+        "Defaults to parsing them serially in the main process."
+    ),
+)
 @click.option(
     "--dagster-workers",
     type=int,
@@ -147,6 +165,8 @@ def main(
     etl_settings_yml: pathlib.Path,
     batch_size: int,
     workers: int | None,
+    xbrl_year_workers: int,
+    dbf_workers: int,
     dagster_workers: int,
     clobber: bool,
     gcs_cache_path: str,
@@ -187,6 +207,8 @@ def main(
             "runtime_settings": {
                 "config": {
                     "xbrl_num_workers": workers,
+                    "xbrl_year_workers": xbrl_year_workers,
+                    "dbf_num_workers": dbf_workers,
                     "xbrl_batch_size": batch_size,
                     "clobber": clobber,
                 },
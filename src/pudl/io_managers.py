@@ -2,13 +2,16 @@
 
 import json
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from sqlite3 import sqlite_version
 from typing import Any
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import sqlalchemy as sa
 from alembic.autogenerate.api import compare_metadata
@@ -27,6 +30,11 @@ from upath import UPath
 
 import pudl
 from pudl.metadata.classes import Package, Resource
+from pudl.metadata.registry import (
+    get_pandas_dtypes,
+    get_pyarrow_schema,
+    get_resource,
+)
 from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -42,6 +50,213 @@ def get_table_name_from_context(context: OutputContext) -> str:
     return context.get_identifier()
 
 
+PARQUET_PANDAS_TYPES: dict[pa.DataType, Any] = {
+    pa.bool_(): pd.BooleanDtype(),
+    pa.int32(): pd.Int64Dtype(),
+    pa.string(): pd.StringDtype(),
+}
+"""Pandas dtypes to use when converting PUDL Parquet columns to pandas.
+
+Arrow types which are not listed here are left to :meth:`pyarrow.Table.to_pandas`
+and then cast to the PUDL dtypes, which is cheap for floats and datetimes.
+"""
+
+EPACEMS_PARTITIONING = ds.partitioning(
+    pa.schema([("year", pa.int32()), ("state", pa.string())]), flavor="hive"
+)
+"""Hive-style ``year=YYYY/state=XX`` partitioning of the EPA CEMS Parquet dataset."""
+
+
+def get_input_selection(
+    context: InputContext,
+) -> tuple[list[str] | None, list | None]:
+    """Get the columns and row filters an input has asked for.
+
+    Assets which only need part of a table can declare it in the metadata of their
+    inputs, e.g.:
+
+    .. code-block:: python
+
+        @asset(
+            ins={
+                "gens": AssetIn(
+                    key="out_eia__yearly_generators",
+                    metadata={
+                        "columns": ["plant_id_eia", "generator_id", "report_date"],
+                        "filters": [("report_date", ">=", pd.Timestamp("2020-01-01"))],
+                    },
+                )
+            }
+        )
+
+    ``filters`` use the disjunctive normal form understood by
+    :func:`pyarrow.parquet.read_table`: a list of ``(column, op, value)`` tuples which
+    must all be true, or a list of such lists, any one of which must be true. As in
+    SQL, rows with nulls never match ``!=`` or ``not in``.
+
+    Returns:
+        The requested columns and filters, or None for each one that isn't specified.
+    """
+    metadata = context.metadata or {}
+    columns = metadata.get("columns")
+    filters = metadata.get("filters")
+    return (list(columns) if columns is not None else None), filters
+
+
+def _filters_to_expression(filters: list) -> ds.Expression:
+    """Convert DNF ``filters`` to a PyArrow expression which drops nulls like SQL.
+
+    PyArrow keeps rows with nulls for ``not in``, so they are excluded explicitly.
+    """
+    if filters and not isinstance(filters[0], list):
+        filters = [filters]
+    expression = None
+    for conjunction in filters:
+        conj_expression = None
+        for col, op, val in conjunction:
+            term = pq.filters_to_expression([(col, op, val)])
+            if op == "not in":
+                term &= ds.field(col).is_valid()
+            conj_expression = (
+                term if conj_expression is None else conj_expression & term
+            )
+        expression = (
+            conj_expression if expression is None else expression | conj_expression
+        )
+    return expression
+
+
+def _filter_df(df: pd.DataFrame, filters: list) -> pd.DataFrame:
+    """Apply Parquet style DNF ``filters`` to a dataframe that is already in memory."""
+    ops = {
+        "=": lambda col, val: col == val,
+        "==": lambda col, val: col == val,
+        # As in SQL, rows with nulls never match != or not in.
+        "!=": lambda col, val: (col != val) & col.notna(),
+        "<": lambda col, val: col < val,
+        "<=": lambda col, val: col <= val,
+        ">": lambda col, val: col > val,
+        ">=": lambda col, val: col >= val,
+        "in": lambda col, val: col.isin(val),
+        "not in": lambda col, val: ~col.isin(val) & col.notna(),
+    }
+    if filters and not isinstance(filters[0], list):
+        filters = [filters]
+    mask = np.zeros(len(df), dtype=bool)
+    for conjunction in filters:
+        conj_mask = np.ones(len(df), dtype=bool)
+        for col, op, val in conjunction:
+            conj_mask &= ops[op](df[col], val).fillna(False).to_numpy(dtype=bool)
+        mask |= conj_mask
+    return df.loc[mask].reset_index(drop=True)
+
+
+def _set_sqlite_pragmas(
+    con: sa.Connection, pragmas: dict[str, str | int]
+) -> dict[str, str | int]:
+    """Set connection level SQLite PRAGMAs, returning their previous values."""
+    previous = {}
+    for pragma, value in pragmas.items():
+        previous[pragma] = con.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+        con.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+    return previous
+
+
+_SQLITE_DATE_FORMAT = "%(year)04d-%(month)02d-%(day)02d"
+_SQLITE_DATETIME_FORMAT = f"{_SQLITE_DATE_FORMAT} %(hour)02d:%(minute)02d:%(second)02d"
+
+
+def _arrow_to_pylist(values: pa.Array) -> list:
+    """Convert an Arrow array to a list of Python objects, with nulls as ``None``.
+
+    This gives the same result as :meth:`pyarrow.Array.to_pylist`, but strings and
+    numbers are converted through NumPy, which is much faster than creating an Arrow
+    scalar for every value.
+    """
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        return values.to_numpy(zero_copy_only=False).tolist()
+    if (
+        pa.types.is_integer(values.type)
+        or pa.types.is_floating(values.type)
+        or pa.types.is_boolean(values.type)
+    ):
+        filled = values.fill_null(pa.scalar(0, type=values.type))
+        pylist = filled.to_numpy(zero_copy_only=False).tolist()
+        if values.null_count:
+            for idx in np.flatnonzero(values.is_null().to_numpy(zero_copy_only=False)):
+                pylist[idx] = None
+        return pylist
+    return values.to_pylist()
+
+
+def _to_sqlite_values(
+    values: pa.Array, sa_type: sa.types.TypeEngine, dialect: sa.Dialect
+) -> list:
+    """Convert an Arrow array into a list of values SQLite can store.
+
+    Values are stored exactly as SQLAlchemy would store them (booleans as integers,
+    dates and datetimes using the column's storage format, etc.), which is what
+    :meth:`pandas.DataFrame.to_sql` does. The common cases are converted by Arrow, and
+    anything else is passed through the bind processor of the SQLAlchemy column type
+    one value at a time. Nulls, including ``NaN``, become ``None``.
+    """
+    impl = sa_type.dialect_impl(dialect)
+    storage_format = getattr(impl, "_storage_format", None)
+    is_timestamp = pa.types.is_timestamp(values.type) and values.type.tz is None
+    if is_timestamp and storage_format == _SQLITE_DATETIME_FORMAT:
+        values = values.cast(pa.timestamp("s"), safe=False).cast(pa.string())
+        return _arrow_to_pylist(values)
+    if (
+        is_timestamp or pa.types.is_date(values.type)
+    ) and storage_format == _SQLITE_DATE_FORMAT:
+        values = values.cast(pa.date32(), safe=False).cast(pa.string())
+        return _arrow_to_pylist(values)
+    if pa.types.is_boolean(values.type) and isinstance(impl, sa.Boolean):
+        return _arrow_to_pylist(values.cast(pa.int64()))
+    if pa.types.is_floating(values.type) and isinstance(impl, sa.Float):
+        return _arrow_to_pylist(values)
+    is_string = pa.types.is_dictionary(values.type) or pa.types.is_string(values.type)
+    if (
+        is_string
+        and isinstance(impl, sa.Enum)
+        and impl.enum_class is None
+        and not impl.validate_strings
+    ):
+        # Without validation, SQLAlchemy stores any string as it is.
+        return _arrow_to_pylist(values)
+    processor = impl.bind_processor(dialect)
+    values = _arrow_to_pylist(values)
+    if processor is not None:
+        values = [None if v is None else processor(v) for v in values]
+    return values
+
+
+def _iter_sqlite_rows(
+    df: pd.DataFrame, sa_table: sa.Table, dialect: sa.Dialect, chunksize: int
+) -> Iterator[list[tuple]]:
+    """Convert a dataframe into batches of rows ready for ``executemany``.
+
+    The dataframe is converted to Arrow record batches, and each column of a batch is
+    converted with :func:`_to_sqlite_values`. Columns which don't appear in the table
+    are passed through as they are, and SQLite will refuse to insert them.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for batch in table.to_batches(max_chunksize=chunksize):
+        if batch.num_rows == 0:
+            continue
+        columns = []
+        for name, values in zip(batch.schema.names, batch.columns, strict=True):
+            if name in sa_table.columns:
+                columns.append(
+                    _to_sqlite_values(values, sa_table.columns[name].type, dialect)
+                )
+            else:
+                columns.append(_arrow_to_pylist(values))
+        yield list(zip(*columns, strict=True))
+
+
 class PudlMixedFormatIOManager(IOManager):
     """Format switching IOManager that supports sqlite and parquet.
 
@@ -117,6 +332,22 @@ class PudlMixedFormatIOManager(IOManager):
 class SQLiteIOManager(IOManager):
     """IO Manager that writes and retrieves dataframes from a SQLite database."""
 
+    bulk_load_pragmas: dict[str, str | int] = {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -262_144,
+    }
+    """Connection level PRAGMAs used while bulk loading a table.
+
+    The rollback journal is kept in memory, writes are not synced to disk until the
+    OS decides to flush them and the page cache is raised to 256 MiB. The previous
+    values are restored once the load has finished. The journal mode is left alone
+    if the database uses write-ahead logging.
+    """
+
+    bulk_load_chunksize: int = 100_000
+    """Number of rows handed to SQLite in each ``executemany`` call."""
+
     def __init__(
         self,
         base_dir: str,
@@ -205,6 +436,50 @@ class SQLiteIOManager(IOManager):
             )
         return sa_table
 
+    def _bulk_load(self, sa_table: sa.Table, df: pd.DataFrame) -> None:
+        """Replace the contents of a database table with a dataframe.
+
+        :meth:`pandas.DataFrame.to_sql` binds every row through SQLAlchemy, which
+        dominates the time it takes to write our larger tables. Instead, the dataframe
+        is streamed to the sqlite3 driver's ``executemany`` as batches of row tuples
+        (see :func:`_iter_sqlite_rows`). The old records are deleted and the new ones
+        inserted in a single transaction, with any secondary indexes on the table
+        dropped before the insert and recreated afterwards. The
+        :attr:`bulk_load_pragmas` are applied for the duration of the load.
+
+        Args:
+            sa_table: the table to load the data into.
+            df: dataframe to write to the database.
+        """
+        dialect = self.engine.dialect
+        preparer = dialect.identifier_preparer
+        insert_stmt = (
+            f"INSERT INTO {preparer.format_table(sa_table)} "  # noqa: S608
+            f"({', '.join(preparer.quote(col) for col in df.columns)}) "
+            f"VALUES ({', '.join('?' * len(df.columns))})"
+        )
+        with self.engine.connect() as con:
+            pragmas = self.bulk_load_pragmas
+            if con.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal":
+                pragmas = {k: v for k, v in pragmas.items() if k != "journal_mode"}
+            previous_pragmas = _set_sqlite_pragmas(con, pragmas)
+            con.commit()
+            try:
+                with con.begin():
+                    # Remove old table records before loading to db
+                    con.execute(sa_table.delete())
+                    for index in sa_table.indexes:
+                        index.drop(con, checkfirst=True)
+                    for rows in _iter_sqlite_rows(
+                        df, sa_table, dialect, self.bulk_load_chunksize
+                    ):
+                        con.exec_driver_sql(insert_stmt, rows)
+                    for index in sa_table.indexes:
+                        index.create(con)
+            finally:
+                _set_sqlite_pragmas(con, previous_pragmas)
+                con.commit()
+
     def _handle_pandas_output(self, context: OutputContext, df: pd.DataFrame):
         """Write dataframe to the database.
 
@@ -226,21 +501,7 @@ class SQLiteIOManager(IOManager):
             raise ValueError(
                 f"{table_name} dataframe is missing columns: {column_difference}"
             )
-
-        engine = self.engine
-        with engine.begin() as con:
-            # Remove old table records before loading to db
-            con.execute(sa_table.delete())
-
-        with engine.begin() as con:
-            df.to_sql(
-                table_name,
-                con,
-                if_exists="append",
-                index=False,
-                chunksize=100_000,
-                dtype={c.name: c.type for c in sa_table.columns},
-            )
+        self._bulk_load(sa_table, df)
 
     # TODO (bendnorman): Create a SQLQuery type so it's clearer what this method expects
     def _handle_str_output(self, context: OutputContext, query: str):
@@ -319,6 +580,22 @@ class SQLiteIOManager(IOManager):
             return df
 
 
+def _select_fields(res: Resource, columns: list[str]) -> Resource:
+    """Returns a copy of a resource with only the given fields.
+
+    The primary key is kept only if all of its fields are selected. The shared resource
+    itself is left untouched.
+    """
+    fields = [field for field in res.schema.fields if field.name in columns]
+    primary_key = res.schema.primary_key
+    if primary_key and not set(primary_key).issubset(columns):
+        primary_key = []
+    schema = res.schema.model_copy(
+        update={"fields": fields, "primary_key": primary_key, "foreign_keys": []}
+    )
+    return res.model_copy(update={"schema": schema})
+
+
 class PudlParquetIOManager(IOManager):
     """IOManager that writes pudl tables to pyarrow parquet files."""
 
@@ -328,10 +605,10 @@ class PudlParquetIOManager(IOManager):
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
         parquet_path.parent.mkdir(parents=True, exist_ok=True)
-        res = Resource.from_id(table_name)
+        res = get_resource(table_name)
 
         df = res.enforce_schema(df)
-        schema = res.to_pyarrow()
+        schema = get_pyarrow_schema(table_name)
         with pq.ParquetWriter(
             where=parquet_path,
             schema=schema,
@@ -343,12 +620,50 @@ class PudlParquetIOManager(IOManager):
             )
 
     def load_input(self, context: InputContext) -> pd.DataFrame:
-        """Loads pudl table from parquet file."""
+        """Loads pudl table from parquet file.
+
+        Inputs can ask for only part of a table using the ``columns`` and ``filters``
+        keys of their metadata (see :func:`get_input_selection`), which are pushed down
+        into the Parquet reader so that only the required columns and row groups are
+        read.
+
+        If the schema of the file matches the schema of the resource, as it does for
+        any file written by :meth:`handle_output`, the data has already been validated
+        and only needs to be converted to the PUDL pandas dtypes. Otherwise
+        :meth:`Resource.enforce_schema` is applied to the selected columns, checking the
+        primary key only if all of its columns were selected. If the input metadata sets
+        ``dtype_backend`` to ``"pyarrow"``, the data is returned using
+        :class:`pandas.ArrowDtype` columns with no conversion at all.
+        """
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
-        res = Resource.from_id(table_name)
-        df = pq.read_table(source=parquet_path, schema=res.to_pyarrow()).to_pandas()
-        return res.enforce_schema(df)
+        res = get_resource(table_name)
+        columns, filters = get_input_selection(context)
+        schema = get_pyarrow_schema(table_name)
+        table = pq.read_table(
+            source=parquet_path,
+            schema=schema,
+            columns=columns,
+            filters=_filters_to_expression(filters) if filters else None,
+        )
+        if (context.metadata or {}).get("dtype_backend") == "pyarrow":
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+        file_schema = pq.read_schema(parquet_path)
+        if not file_schema.equals(schema, check_metadata=False):
+            logger.info(
+                f"{table_name}: Parquet file schema does not match the metadata, "
+                "enforcing the resource schema."
+            )
+            df = table.to_pandas()
+            if columns is None:
+                return res.enforce_schema(df)
+            return _select_fields(res, columns).enforce_schema(df).loc[:, columns]
+        df = table.to_pandas(
+            types_mapper=PARQUET_PANDAS_TYPES.get, date_as_object=False
+        )
+        dtypes = get_pandas_dtypes(table_name)
+        return df.astype({col: dtypes[col] for col in df.columns}, copy=False)
 
 
 class PudlSQLiteIOManager(SQLiteIOManager):
@@ -452,18 +767,7 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         res = self.package.get_resource(table_name)
 
         df = res.enforce_schema(df)
-        with self.engine.begin() as con:
-            # Remove old table records before loading to db
-            con.execute(sa_table.delete())
-
-            df.to_sql(
-                table_name,
-                con,
-                if_exists="append",
-                index=False,
-                chunksize=100_000,
-                dtype={c.name: c.type for c in sa_table.columns},
-            )
+        self._bulk_load(sa_table, df)
 
     def load_input(self, context: InputContext) -> pd.DataFrame:
         """Load a dataframe from a sqlite database.
@@ -507,6 +811,12 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                     f"The {table_name} table is empty. Materialize the {table_name} "
                     "asset so it is available in the database."
                 )
+        # Give inputs the same selection they would get from PudlParquetIOManager.
+        columns, filters = get_input_selection(context)
+        if filters:
+            df = _filter_df(df, filters)
+        if columns is not None:
+            df = df.loc[:, columns]
         return df
 
 
@@ -855,13 +1165,22 @@ class EpaCemsIOManager(UPathIOManager):
         raise NotImplementedError("This IO Manager doesn't support writing data.")
 
     def load_from_path(self, context: InputContext, path: UPath) -> dd.DataFrame:
-        """Load a directory of parquet files to a dask dataframe."""
+        """Load a parquet file or hive-partitioned directory to a dask dataframe.
+
+        The ``year`` and ``state`` partition keys are also stored in the files, where
+        ``state`` is dictionary encoded, so the partitioning and schema are given
+        explicitly rather than inferred from the directory names.
+        """
         logger.info(f"Reading parquet file from {path}")
         return dd.read_parquet(
             path,
             engine="pyarrow",
             index=False,
             split_row_groups=True,
+            dataset={
+                "partitioning": EPACEMS_PARTITIONING if path.is_dir() else None,
+                "schema": self.schema,
+            },
         )
 
 
@@ -870,5 +1189,5 @@ def epacems_io_manager(
     init_context: InitResourceContext,
 ) -> EpaCemsIOManager:
     """IO Manager that writes EPA CEMS partitions to individual parquet files."""
-    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    schema = get_pyarrow_schema("core_epacems__hourly_emissions")
     return EpaCemsIOManager(base_path=UPath(PudlPaths().parquet_path()), schema=schema)
@@ -9,6 +9,7 @@ from . import (
     fields,
     helpers,
     labels,
+    registry,
     resources,
     sources,
 )
@@ -7,14 +7,16 @@ import re
 import sys
 import warnings
 from collections.abc import Callable, Iterable
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Literal, Self, TypeVar
 
 import jinja2
+import numpy as np
 import pandas as pd
 import pandera as pr
 import pyarrow as pa
+import pyarrow.compute as pc
 import pydantic
 import sqlalchemy as sa
 from pandas._libs.missing import NAType
@@ -54,6 +56,7 @@ from pudl.metadata.helpers import (
     expand_periodic_column_names,
     format_errors,
     groupby_aggregate,
+    has_duplicate_rows,
     most_and_more_frequent,
     split_period,
 )
@@ -464,7 +467,7 @@ class Encoder(PudlMeta):
             raise ValueError(format_errors(*errors, pydantic=True))
         return code_fixes
 
-    @property
+    @cached_property
     def code_map(self) -> dict[str, str | NAType]:
         """A mapping of all known codes to their standardized values, or NA."""
         code_map = {code: code for code in self.df["code"]}
@@ -472,26 +475,121 @@ class Encoder(PudlMeta):
         code_map.update({code: pd.NA for code in self.ignored_codes})
         return code_map
 
+    @cached_property
+    def _code_lookup(self) -> pd.Series:
+        """The code map as a Series of standardized values indexed by known code.
+
+        This is the lookup table :meth:`pandas.Series.map` would build from the code
+        map every time it was applied.
+        """
+        return pd.Series(self.code_map, dtype=None if self.code_map else object)
+
+    def _lookup(self, codes: pd.Index, col_name: str | None) -> np.ndarray:
+        """Find the position of each of the codes in the lookup table.
+
+        Raises:
+            ValueError: if any of the codes are unknown.
+        """
+        positions = self._code_lookup.index.get_indexer(codes)
+        # Every value in the Series should appear in the map. If that's not the
+        # case we want to hear about it so we don't wipe out data unknowingly.
+        if (positions < 0).any():
+            unknown_codes = set(codes[positions < 0])
+            raise ValueError(
+                f"Found unknown codes while encoding {col_name}: {unknown_codes=}"
+            )
+        return positions
+
     def encode(
         self,
         col: pd.Series,
         dtype: type | None = None,
     ) -> pd.Series:
-        """Apply the stored code mapping to an input Series."""
-        # Every value in the Series should appear in the map. If that's not the
-        # case we want to hear about it so we don't wipe out data unknowingly.
+        """Apply the stored code mapping to an input Series.
+
+        Each distinct value is only looked up once: the column is factorized, the
+        distinct values are recoded, and the result is taken from them.
+        """
         logger.info(f"Encoding {col.name}")
-        unknown_codes = set(col.dropna()).difference(self.code_map)
-        if unknown_codes:
-            raise ValueError(
-                f"Found unknown codes while encoding {col.name}: {unknown_codes=}"
-            )
-        col = col.map(self.code_map)
-        if dtype:
+        codes, uniques = pd.factorize(col)
+        recoded = self._code_lookup.to_numpy().take(
+            self._lookup(pd.Index(uniques), col.name)
+        )
+        # Numeric codes are upcast when taking nulls, so only convert the distinct
+        # values first if they're objects, like strings.
+        convert_first = (
+            dtype is not None
+            and recoded.dtype == object
+            and pd.api.types.is_extension_array_dtype(dtype)
+        )
+        if convert_first:
+            recoded = pd.Series(recoded).astype(dtype).array
+        col = pd.Series(
+            pd.api.extensions.take(recoded, codes, allow_fill=True),
+            index=col.index,
+            name=col.name,
+        )
+        if dtype and not convert_first:
             col = col.astype(dtype)
 
         return col
 
+    def encode_arrow(
+        self, array: pa.Array | pa.ChunkedArray, name: str | None = None
+    ) -> pa.DictionaryArray | pa.ChunkedArray:
+        """Apply the stored code mapping to an Arrow array.
+
+        Only the dictionary of a dictionary encoded array needs to be recoded, so this
+        is much faster than recoding the values one by one. Other arrays are
+        dictionary encoded first.
+
+        Args:
+            array: the codes to standardize.
+            name: the name of the coded column, used in error messages.
+
+        Returns:
+            A dictionary encoded array of the standardized codes, which are null where
+            the codes were ignored.
+
+        Raises:
+            ValueError: if any of the codes are unknown.
+        """
+        if isinstance(array, pa.ChunkedArray):
+            return pa.chunked_array(
+                [self.encode_arrow(chunk, name=name) for chunk in array.chunks],
+                type=self._arrow_type(array.type),
+            )
+        if not pa.types.is_dictionary(array.type):
+            array = array.dictionary_encode()
+        # Unused and null dictionary entries don't have to be known codes.
+        used = pc.unique(array.indices).drop_null().to_numpy()
+        used = used[array.dictionary.is_valid().to_numpy(zero_copy_only=False)[used]]
+        positions = np.full(len(array.dictionary), -1)
+        positions[used] = self._lookup(
+            pd.Index(array.dictionary.to_pandas().to_numpy()[used]), name
+        )
+        recoded = pd.api.extensions.take(
+            self._code_lookup.to_numpy(), positions, allow_fill=True
+        )
+        new_indices, new_dictionary = pd.factorize(recoded)
+        remap = pa.array(new_indices, mask=new_indices < 0, type=array.type.index_type)
+        return pa.DictionaryArray.from_arrays(
+            pc.take(remap, array.indices),
+            pa.array(new_dictionary, type=self._arrow_value_type),
+        )
+
+    @cached_property
+    def _arrow_value_type(self) -> pa.DataType:
+        """The Arrow type of the standardized codes."""
+        return pa.array(self.df["code"].tolist()).type if len(self.df) else pa.string()
+
+    def _arrow_type(self, input_type: pa.DataType) -> pa.DictionaryType:
+        """The type of the arrays produced by :meth:`encode_arrow`."""
+        index_type = (
+            input_type.index_type if pa.types.is_dictionary(input_type) else pa.int32()
+        )
+        return pa.dictionary(index_type, self._arrow_value_type)
+
     @staticmethod
     def dict_from_id(x: str) -> dict:
         """Look up the encoder by coding table name in the metadata."""
@@ -718,6 +816,22 @@ class Field(PudlMeta):
         )
 
 
+def _has_dtype(col: pd.Series, dtype: str | pd.CategoricalDtype) -> bool:
+    """Check whether casting a column to a data type would leave it unchanged.
+
+    Unordered categorical data types compare equal regardless of the order of their
+    categories, but casting reorders the categories, so they must match exactly.
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return (
+            isinstance(col.dtype, pd.CategoricalDtype)
+            and col.dtype.ordered == dtype.ordered
+            and col.dtype.categories.dtype == dtype.categories.dtype
+            and col.dtype.categories.equals(dtype.categories)
+        )
+    return col.dtype == dtype
+
+
 # ---- Classes: Resource ---- #
 
 
@@ -1414,7 +1528,12 @@ class Resource(PudlMeta):
 
     @classmethod
     def from_id(cls, x: str) -> "Resource":
-        """Construct from PUDL identifier (`resource.name`)."""
+        """Construct from PUDL identifier (`resource.name`).
+
+        Every call builds and validates a new resource, which the caller is free to
+        modify. Callers which only read the metadata can use the shared resource cached
+        by :func:`pudl.metadata.registry.get_resource` instead.
+        """
         return cls(**cls.dict_from_id(x))
 
     def get_field(self, name: str) -> Field:
@@ -1567,8 +1686,8 @@ class Resource(PudlMeta):
         if matches is None:
             # Primary key present but no matches were found
             return self.format_df()
-        df = df.copy()
-        # Rename periodic key columns (if any) to the requested period
+        # Rename periodic key columns (if any) to the requested period. This also
+        # makes sure we never modify the original dataframe.
         df = df.rename(columns=matches)
         # Cast integer year fields to datetime
         for field in self.schema.fields:
@@ -1578,24 +1697,30 @@ class Resource(PudlMeta):
                 and pd.api.types.is_integer_dtype(df[field.name])
             ):
                 df[field.name] = pd.to_datetime(df[field.name], format="%Y")
-            if isinstance(dtypes[field.name], pd.CategoricalDtype):
-                uncategorized = [
-                    value
-                    for value in df[field.name].dropna().unique()
-                    if value not in dtypes[field.name].categories
-                ]
+            dtype = dtypes[field.name]
+            # Columns which are already categorical with the right categories can't
+            # have any uncategorized values.
+            if isinstance(dtype, pd.CategoricalDtype) and not _has_dtype(
+                df[field.name], dtype
+            ):
+                values = pd.Series(df[field.name].dropna().unique())
+                uncategorized = values[~values.isin(dtype.categories)].tolist()
                 if uncategorized:
                     logger.warning(
                         f"Values in {field.name} column are not included in "
                         "categorical values in field enum constraint "
                         f"and will be converted to nulls ({uncategorized})."
                     )
-        df = (
-            # Reorder columns and insert missing columns
-            df.reindex(columns=dtypes.keys(), copy=False)
-            # Coerce columns to correct data type
-            .astype(dtypes, copy=False)
-        )
+        # Reorder columns and insert missing columns
+        df = df.reindex(columns=dtypes.keys(), copy=False)
+        # Coerce the columns which don't already have it to the correct data type
+        mismatched = {
+            name: dtype
+            for name, dtype in dtypes.items()
+            if not _has_dtype(df[name], dtype)
+        }
+        if mismatched:
+            df = df.astype(mismatched, copy=False)
         # Convert periodic key columns to the requested period
         for df_key, key in matches.items():
             _, period = split_period(key)
@@ -1615,7 +1740,7 @@ class Resource(PudlMeta):
 
         df = self.format_df(df)
         pk = self.schema.primary_key
-        if pk and not df[df.duplicated(subset=pk)].empty:
+        if pk and has_duplicate_rows(df[pk]):
             raise ValueError(
                 f"{self.name} Duplicate primary keys when enforcing schema."
             )
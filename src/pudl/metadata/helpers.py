@@ -275,6 +275,38 @@ def expand_periodic_column_names(names: Iterable[str]) -> list[str]:
     return results
 
 
+# ---- Dataframe checks ---- #
+
+
+def hash_rows(df: pd.DataFrame) -> np.ndarray:
+    """Hash each row of a dataframe to a 64-bit integer.
+
+    Each column is hashed with :func:`pandas.util.hash_pandas_object`, and the column
+    hashes are combined in order, so equal rows always have equal hashes. Null values
+    all hash to the same value, regardless of their type.
+    """
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for _, col in df.items():
+        hashes *= np.uint64(1_000_003)
+        hashes ^= pd.util.hash_pandas_object(col, index=False).to_numpy()
+    return hashes
+
+
+def has_duplicate_rows(df: pd.DataFrame) -> bool:
+    """Check whether any rows of a dataframe are duplicated.
+
+    This gives the same answer as ``df.duplicated().any()``, but only has to sort the
+    row hashes from :func:`hash_rows`. Rows with the same hash are compared exactly, in
+    case their hashes collide.
+    """
+    hashes = hash_rows(df)
+    sorted_hashes = np.sort(hashes)
+    repeated = sorted_hashes[1:][sorted_hashes[1:] == sorted_hashes[:-1]]
+    if len(repeated) == 0:
+        return False
+    return bool(df[np.isin(hashes, repeated)].duplicated().any())
+
+
 # ---- Aggregation: Column ---- #
 
 """Aggregation functions.
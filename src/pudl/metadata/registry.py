@@ -0,0 +1,72 @@
+"""Process-wide registry of the schemas derived from PUDL resource metadata.
+
+The functions in this module cache the PUDL resources and the PyArrow schemas,
+SQLAlchemy tables and pandas data types derived from them, so that each of them is only
+built once per process no matter how many times the IO managers read and write a table.
+Everything returned from here is shared, and must not be modified. Use
+:meth:`pudl.metadata.classes.Resource.from_id` to build a private resource instead.
+
+The registry can be filled ahead of time with :func:`preload`. It is called when the
+PUDL Dagster definitions are loaded if the ``PUDL_PRELOAD_METADATA`` environment
+variable is set, which pays off when step processes are forked from a process which
+has already loaded the definitions, e.g. by the ``forkserver`` start method of the
+multiprocess executor.
+"""
+
+from collections.abc import Iterable
+from functools import cache
+from types import MappingProxyType
+
+import pandas as pd
+import pyarrow as pa
+import sqlalchemy as sa
+
+import pudl.logging_helpers
+from pudl.metadata.classes import Resource
+from pudl.metadata.resources import RESOURCE_METADATA
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+@cache
+def get_resource(resource_id: str) -> Resource:
+    """Returns the shared :class:`Resource` with the given PUDL identifier."""
+    return Resource.from_id(resource_id)
+
+
+@cache
+def get_pyarrow_schema(resource_id: str) -> pa.Schema:
+    """Returns the PyArrow schema of a resource."""
+    return get_resource(resource_id).to_pyarrow()
+
+
+@cache
+def get_sql_table(resource_id: str) -> sa.Table:
+    """Returns the SQLAlchemy table of a resource, in its own metadata collection."""
+    return get_resource(resource_id).to_sql()
+
+
+@cache
+def get_pandas_dtypes(
+    resource_id: str,
+) -> MappingProxyType[str, str | pd.CategoricalDtype]:
+    """Returns the pandas data type of each field of a resource by field name."""
+    return MappingProxyType(get_resource(resource_id).to_pandas_dtypes())
+
+
+def preload(resource_ids: Iterable[str] | None = None) -> None:
+    """Build and cache the metadata of the given resources ahead of time.
+
+    Args:
+        resource_ids: PUDL identifiers of the resources to load. Defaults to all of
+            them.
+    """
+    if resource_ids is None:
+        resource_ids = RESOURCE_METADATA
+    resource_ids = list(resource_ids)
+    logger.info(f"Preloading the metadata of {len(resource_ids)} resources.")
+    for resource_id in resource_ids:
+        get_resource(resource_id)
+        get_pyarrow_schema(resource_id)
+        get_pandas_dtypes(resource_id)
+        get_sql_table(resource_id)
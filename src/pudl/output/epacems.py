@@ -3,9 +3,16 @@
 from collections.abc import Iterable, Sequence
 from itertools import product
 from pathlib import Path
+from typing import Literal
 
 import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 
+from pudl.io_managers import EPACEMS_PARTITIONING, PARQUET_PANDAS_TYPES
+from pudl.metadata.registry import get_pyarrow_schema
 from pudl.workspace.setup import PudlPaths
 
 
@@ -107,42 +114,177 @@ def get_plant_years(plant_ids, pudl_out):
     )
 
 
+def _epacems_expression(
+    states: Sequence[str] | None,
+    years: Sequence[int] | None,
+    plant_ids: Sequence[int] | None,
+) -> ds.Expression | None:
+    """Combine the requested states, years and plants into a single filter."""
+    expressions = []
+    if states is not None:
+        expressions.append(ds.field("state").isin([state.upper() for state in states]))
+    if years is not None:
+        expressions.append(ds.field("year").isin(list(years)))
+    if plant_ids is not None:
+        expressions.append(ds.field("plant_id_eia").isin(list(plant_ids)))
+    if not expressions:
+        return None
+    expression = expressions[0]
+    for other in expressions[1:]:
+        expression &= other
+    return expression
+
+
+def _may_contain(row_group: ds.RowGroupInfo, column: str, values: np.ndarray) -> bool:
+    """Check whether any of the sorted values lie within a row group's min/max range."""
+    stats = row_group.statistics.get(column)
+    if not stats:
+        return True
+    first = np.searchsorted(values, stats["min"])
+    return first < len(values) and values[first] <= stats["max"]
+
+
+def epacems_row_groups(
+    states: Sequence[str] | None = None,
+    years: Sequence[int] | None = None,
+    plant_ids: Sequence[int] | None = None,
+    epacems_path: Path | None = None,
+) -> ds.FileSystemDataset:
+    """Select the row groups of the EPA CEMS dataset that may hold the requested data.
+
+    Whole ``year=YYYY/state=XX`` partitions are skipped based on the directory
+    structure alone. Within the remaining files, row groups are skipped if their
+    statistics show they can't contain any of the requested years and states, or if
+    none of the ``plant_ids`` fall between their minimum and maximum ``plant_id_eia``.
+    The monolithic ``core_epacems__hourly_emissions.parquet`` file can also be read,
+    in which case only the row group statistics are used.
+
+    Args:
+        states: subset by state abbreviation. Defaults to None (which gets all states).
+        years: subset by year. Defaults to None (which gets all years).
+        plant_ids: subset by ``plant_id_eia``. Defaults to None (which gets all plants).
+        epacems_path: path to the hive-partitioned parquet directory or the monolithic
+            parquet file. By default it uses the partitioned directory in the
+            :mod:`pudl.workspace` output directory.
+
+    Returns:
+        A dataset made up of one fragment per selected row group. Note that the
+        fragments may still contain records outside of the requested subset.
+    """
+    if epacems_path is None:
+        epacems_path = PudlPaths().parquet_path() / "core_epacems__hourly_emissions"
+    epacems_path = Path(epacems_path)
+    dataset = ds.dataset(
+        epacems_path,
+        schema=get_pyarrow_schema("core_epacems__hourly_emissions"),
+        format="parquet",
+        partitioning=EPACEMS_PARTITIONING if epacems_path.is_dir() else None,
+    )
+    wanted = {
+        column: np.unique(list(values))
+        for column, values in [
+            ("year", years),
+            ("state", None if states is None else [s.upper() for s in states]),
+            ("plant_id_eia", plant_ids),
+        ]
+        if values is not None
+    }
+    row_groups = [
+        row_group
+        for fragment in dataset.get_fragments(
+            filter=_epacems_expression(states=states, years=years, plant_ids=None)
+        )
+        for row_group in fragment.split_by_row_group()
+        if all(
+            _may_contain(row_group.row_groups[0], column, values)
+            for column, values in wanted.items()
+        )
+    ]
+    return ds.FileSystemDataset(
+        row_groups,
+        schema=dataset.schema,
+        format=dataset.format,
+        filesystem=dataset.filesystem,
+    )
+
+
+def _read_row_group(
+    row_group: ds.ParquetFileFragment,
+    columns: list[str] | None,
+    expression: ds.Expression | None,
+) -> pd.DataFrame:
+    """Read the requested records from one row group of EPA CEMS into pandas."""
+    return row_group.to_table(columns=columns, filter=expression).to_pandas(
+        types_mapper=PARQUET_PANDAS_TYPES.get
+    )
+
+
 def epacems(
     states: Sequence[str] | None = None,
     years: Sequence[int] | None = None,
     columns: Sequence[str] | None = None,
     epacems_path: Path | None = None,
-) -> dd.DataFrame:
+    plant_ids: Sequence[int] | None = None,
+    output: Literal["dask", "pandas", "arrow"] = "dask",
+) -> dd.DataFrame | pd.DataFrame | pa.Table:
     """Load EPA CEMS data from PUDL with optional subsetting.
 
+    Only the partitions and row groups which may contain the requested data are read,
+    as determined by :func:`epacems_row_groups`.
+
     Args:
         states: subset by state abbreviation.  Defaults to None (which gets all states).
         years: subset by year. Defaults to None (which gets all years).
         columns: subset by column. Defaults to None (which gets all columns).
-        epacems_path: path to parquet dir. By default it automatically loads the path
-            from :mod:`pudl.workspace`
+        epacems_path: path to the hive-partitioned parquet directory or the monolithic
+            parquet file. By default it automatically loads the path from
+            :mod:`pudl.workspace`
+        plant_ids: subset by ``plant_id_eia``. Defaults to None (which gets all plants).
+        output: Return a lazy :class:`dask.dataframe.DataFrame` with one partition per
+            row group (``dask``), or read the data immediately into a
+            :class:`pandas.DataFrame` (``pandas``) or :class:`pyarrow.Table`
+            (``arrow``).
 
     Returns:
         The requested epacems data. If requested states or years are not available, no
         error will be raised.
+
+    Raises:
+        ValueError: if ``output`` isn't one of the supported types, or any of the
+            requested columns don't exist.
     """
-    # columns=None is handled by dd.read_parquet; gives all columns
+    if output not in ("dask", "pandas", "arrow"):
+        raise ValueError(f"Unsupported EPA CEMS output type: {output}")
+    row_groups = epacems_row_groups(
+        states=states, years=years, plant_ids=plant_ids, epacems_path=epacems_path
+    )
+    # columns=None gives all columns
     if columns is not None:
-        # nonexistent columns are handled by dd.read_parquet; raises ValueError
         columns = list(columns)
+        missing = set(columns).difference(row_groups.schema.names)
+        if missing:
+            raise ValueError(f"EPA CEMS has no columns named {sorted(missing)}")
+    expression = _epacems_expression(states=states, years=years, plant_ids=plant_ids)
 
-    if epacems_path is None:
-        epacems_path = PudlPaths().output_dir / "epacems"
+    if output == "arrow":
+        return row_groups.to_table(columns=columns, filter=expression)
+    if output == "pandas":
+        return row_groups.to_table(columns=columns, filter=expression).to_pandas(
+            types_mapper=PARQUET_PANDAS_TYPES.get
+        )
 
-    epacems = dd.read_parquet(
-        epacems_path,
+    empty = row_groups.schema.empty_table()
+    if columns is not None:
+        empty = empty.select(columns)
+    meta = empty.to_pandas(types_mapper=PARQUET_PANDAS_TYPES.get)
+    fragments = list(row_groups.get_fragments())
+    if not fragments:
+        return dd.from_pandas(meta, npartitions=1)
+    return dd.from_map(
+        _read_row_group,
+        fragments,
         columns=columns,
-        engine="pyarrow",
-        index=False,
-        split_row_groups=True,
-        filters=year_state_filter(
-            states=states,
-            years=years,
-        ),
+        expression=expression,
+        meta=meta,
+        enforce_metadata=False,
     )
-    return epacems
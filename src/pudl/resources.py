@@ -13,6 +13,8 @@ class RuntimeSettings(ConfigurableResource):
     clobber: bool = False
     xbrl_num_workers: None | int = None
     xbrl_batch_size: int = 50
+    xbrl_year_workers: int = 1
+    dbf_num_workers: int = 1
 
 
 @resource(config_schema=create_dagster_config(DatasetsSettings()))
@@ -19,7 +19,7 @@ from pydantic_settings import BaseSettings
 
 import pudl
 from pudl.metadata.classes import DataSource
-from pudl.workspace.datastore import Datastore, ZenodoDoi
+from pudl.workspace.datastore import Datastore, ZenodoDoi, ZenodoDoiSettings
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -726,6 +726,50 @@ class EtlSettings(BaseSettings):
             yaml_file = yaml.safe_load(f)
         return cls.model_validate(yaml_file)
 
+    def get_datastore_partitions(self: Self) -> dict[str, list[dict[str, Any]]]:
+        """Find the raw datastore partitions needed to run the ETL with these settings.
+
+        The EIA datasets are nested within the ETL settings, while the FERC DBF and XBRL
+        to SQLite settings each select years from the same raw datastore dataset.
+        Datasets with no partitions of their own are selected in their entirety.
+
+        Returns:
+            A mapping of raw dataset names to a list of partition filters, suitable for
+            use with :meth:`pudl.workspace.datastore.Datastore.prefetch`.
+        """
+        known_datasets = set(ZenodoDoiSettings.model_fields)
+        dataset_settings: list[tuple[str, GenericDatasetSettings]] = []
+        if self.datasets is not None:
+            for name, settings in self.datasets.get_datasets().items():
+                if isinstance(settings, EiaSettings):
+                    dataset_settings += list(vars(settings).items())
+                else:
+                    dataset_settings.append((name, settings))
+        if self.ferc_to_sqlite_settings is not None:
+            dataset_settings += [
+                (settings.data_source.name, settings)
+                for settings in vars(self.ferc_to_sqlite_settings).values()
+                if settings is not None
+            ]
+
+        partitions: dict[str, list[dict[str, Any]]] = {}
+        for name, settings in dataset_settings:
+            if (
+                name not in known_datasets
+                or not isinstance(
+                    settings, GenericDatasetSettings | FercGenericXbrlToSqliteSettings
+                )
+                or settings.disabled
+            ):
+                continue
+            if isinstance(settings, FercGenericXbrlToSqliteSettings):
+                selected = [{"year": year} for year in settings.years]
+            else:
+                selected = settings.partitions or [{}]
+            partitions.setdefault(name, [])
+            partitions[name] += [p for p in selected if p not in partitions[name]]
+        return partitions
+
 
 def _convert_settings_to_dagster_config(settings_dict: dict[str, Any]) -> None:
     """Recursively convert a dictionary of dataset settings to dagster config in place.
@@ -72,4 +72,5 @@ from . import (
     ferc1,
     ferc714,
     params,
+    timezones,
 )
@@ -24,7 +24,6 @@ from typing import Literal
 import networkx as nx
 import numpy as np
 import pandas as pd
-import timezonefinder
 from dagster import (
     AssetIn,
     AssetOut,
@@ -42,12 +41,11 @@ from pudl.metadata.enums import APPROXIMATE_TIMEZONES
 from pudl.metadata.fields import apply_pudl_dtypes, get_pudl_dtypes
 from pudl.metadata.resources import ENTITIES
 from pudl.settings import EiaSettings
+from pudl.transform.timezones import TZ_FINDER, find_timezones
+from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
-TZ_FINDER = timezonefinder.TimezoneFinder()
-"""A global TimezoneFinder to cache geographies in memory for faster access."""
-
 
 class EiaEntity(StrEnum):
     """Enum for the different types of EIA entities."""
@@ -179,6 +177,109 @@ def occurrence_consistency(
     return col_df
 
 
+def consistent_values(
+    compiled_df: pd.DataFrame,
+    entity_idx: list[str],
+    cols: list[str],
+    cols_to_consit: list[str],
+    strictness: dict[str, float],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Find the consistently reported value of several columns in a single pass.
+
+    This gives the same answers as running :func:`occurrence_consistency` on each of the
+    columns separately, but counts the occurrences of every value of every column
+    together: the values of each column are factorized, and the (column, entity, value)
+    combinations of all the columns are counted with a single sort, instead of with a
+    groupby and two merges of the full compiled dataframe per column.
+
+    Each strictness must be at least 0.5, so that at most one value of each column can
+    be consistent for each entity.
+
+    Args:
+        compiled_df: a dataframe with every instance of the columns we are trying to
+            harvest.
+        entity_idx: a list of the id(s) for the entity.
+        cols: the names of the columns we are trying to harvest.
+        cols_to_consit: a list of the columns to determine consistency, either the
+            entity_idx or the entity_idx and ``report_date``.
+        strictness: How consistent the records of each column need to be.
+
+    Returns:
+        A dataframe with one row for each unique combination of ``cols_to_consit``
+        and the consistent value of each column, or NA if there isn't one, and a
+        dataframe indexed by column with the number of entities which reported a value
+        (``total``) and the number of those with a consistent value (``consistent``).
+    """
+    if any(strictness[col] < 0.5 for col in cols):
+        raise ValueError("Only strictness values of 0.5 or more have unique answers.")
+    valid = compiled_df[entity_idx + ["report_date"]].notna().all(axis=1).to_numpy()
+    df = compiled_df.loc[valid]
+    group = df.groupby(cols_to_consit, sort=False, observed=True).ngroup().to_numpy()
+    _, first_rows = np.unique(group, return_index=True)
+    n_groups = len(first_rows)
+    key_df = df[cols_to_consit].iloc[first_rows].reset_index(drop=True)
+
+    string_cols = {
+        col for col, dtype in get_pudl_dtypes(group="eia").items() if dtype == "string"
+    }
+    col_codes, col_rows = [], []
+    n_values = 1
+    for i, col in enumerate(cols):
+        values = df[col]
+        if col in string_cols:
+            values = values.mask((values == "nan").fillna(False))
+        codes, uniques = pd.factorize(values)
+        (rows,) = np.nonzero(codes >= 0)
+        col_codes.append((i * n_groups + group[rows], codes[rows]))
+        col_rows.append(rows)
+        n_values = max(n_values, len(uniques))
+    entity_keys = np.concatenate([np.empty(0, np.int64)] + [k for k, _ in col_codes])
+    value_codes = np.concatenate([np.empty(0, np.int64)] + [c for _, c in col_codes])
+    rows = np.concatenate([np.empty(0, np.int64)] + col_rows)
+
+    # Count the occurrences of each value of each column for each entity, and of each
+    # column for each entity.
+    records, first, record_counts = np.unique(
+        entity_keys.astype(np.int64) * n_values + value_codes.astype(np.int64),
+        return_index=True,
+        return_counts=True,
+    )
+    record_entities = records // n_values
+    entity_starts = np.flatnonzero(
+        np.diff(record_entities, prepend=record_entities[:1] - 1)
+    )
+    entity_counts = (
+        np.add.reduceat(record_counts, entity_starts)
+        if len(records)
+        else np.empty(0, np.int64)
+    )
+    consistent_rate = record_counts / np.repeat(
+        entity_counts, np.diff(np.append(entity_starts, len(records)))
+    )
+    record_cols = record_entities // max(n_groups, 1)
+    is_consistent = (
+        consistent_rate
+        > np.array([strictness[col] for col in cols], dtype=float)[record_cols]
+    )
+
+    stats = pd.DataFrame(
+        {
+            "total": np.bincount(record_cols[entity_starts], minlength=len(cols)),
+            "consistent": np.bincount(record_cols[is_consistent], minlength=len(cols)),
+        },
+        index=pd.Index(cols, name="column"),
+    )
+    consistent_rows = rows[first[is_consistent]]
+    consistent_groups = record_entities[is_consistent] % max(n_groups, 1)
+    consistent_cols = record_cols[is_consistent]
+    for i, col in enumerate(cols):
+        take = np.full(n_groups, -1)
+        in_col = consistent_cols == i
+        take[consistent_groups[in_col]] = consistent_rows[in_col]
+        key_df[col] = pd.api.extensions.take(df[col].array, take, allow_fill=True)
+    return key_df, stats
+
+
 def _lat_long(
     dirty_df: pd.DataFrame,
     clean_df: pd.DataFrame,
@@ -307,11 +408,13 @@ def _add_timezone(plants_entity: pd.DataFrame) -> pd.DataFrame:
         A DataFrame containing the same table, with a "timezone" column added.
         Timezone may be missing if lat / lon is missing or invalid.
     """
-    plants_entity["timezone"] = plants_entity.apply(
-        lambda row: find_timezone(
-            lng=row["longitude"], lat=row["latitude"], state=row["state"], strict=False
-        ),
-        axis=1,
+    cache_dir = PudlPaths().cache_dir
+    plants_entity["timezone"] = find_timezones(
+        lng=plants_entity["longitude"],
+        lat=plants_entity["latitude"],
+        state=plants_entity["state"],
+        strict=False,
+        cache_dir=None if cache_dir is None else cache_dir / "timezones",
     )
     return plants_entity
 
@@ -543,13 +646,46 @@ def harvest_entity_tables(  # noqa: C901
         subset=id_cols
     )
 
-    entity_df = entity_id_df.copy()
-    annual_df = annual_id_df.copy()
+    # The harvested columns are added positionally, so they need a fresh index, just
+    # like the ones which are merged in.
+    entity_df = entity_id_df.reset_index(drop=True)
+    annual_df = annual_id_df.reset_index(drop=True)
     special_case_cols = {
         "latitude": [_lat_long, 1],
         "longitude": [_lat_long, 1],
         "generator_operating_date": [_round_operating_date, "Y"],
     }
+    strictness = {
+        col: _manage_strictness(col, eia_settings.eia860.eia860m)
+        for col in static_cols + annual_cols
+    }
+    # Most columns can be harvested all at once. The special cases need the dirty
+    # records, debugging needs the consistency of every record, and with a strictness
+    # below 0.5 several values can be consistent, which only the per column method
+    # chooses between.
+    harvested = {}
+    stats = []
+    for cols, id_df, cols_to_consit in [
+        (static_cols, entity_id_df, id_cols),
+        (annual_cols, annual_id_df, id_cols + ["report_date"]),
+    ]:
+        fast_cols = [
+            col
+            for col in cols
+            if not debug
+            and col not in special_case_cols
+            and col not in set(static_cols) & set(annual_cols)
+            and strictness[col] >= 0.5
+        ]
+        if fast_cols:
+            values_df, col_stats = consistent_values(
+                compiled_df, id_cols, fast_cols, cols_to_consit, strictness
+            )
+            values_df = id_df.merge(values_df, on=cols_to_consit, how="left")
+            harvested |= {col: values_df[col].array for col in fast_cols}
+            stats.append(col_stats)
+    stats = pd.concat(stats) if stats else None
+
     consistency = pd.DataFrame(
         columns=["column", "consistent_ratio", "wrongos", "total"]
     )
@@ -561,74 +697,80 @@ def harvest_entity_tables(  # noqa: C901
         if col in static_cols:
             cols_to_consit = id_cols
 
-        strictness = _manage_strictness(col, eia_settings.eia860.eia860m)
-        col_df = occurrence_consistency(
-            id_cols, compiled_df, col, cols_to_consit, strictness=strictness
-        )
-
-        # pull the correct values out of the df and merge w/ the plant ids
-        col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
-            subset=(cols_to_consit + [f"{col}_is_consistent"])
-        )
+        if col in harvested:
+            if col in static_cols:
+                entity_df[col] = harvested[col]
+            else:
+                annual_df[col] = harvested[col]
+            total, consistent = stats.loc[col, ["total", "consistent"]]
+        else:
+            col_df = occurrence_consistency(
+                id_cols, compiled_df, col, cols_to_consit, strictness=strictness[col]
+            )
 
-        # we need this to be an empty df w/ columns bc we are going to use it
-        if col_correct_df.empty:
-            col_correct_df = pd.DataFrame(columns=col_df.columns)
+            # pull the correct values out of the df and merge w/ the plant ids
+            col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+                subset=(cols_to_consit + [f"{col}_is_consistent"])
+            )
 
-        if col in static_cols:
-            clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
-            clean_df = clean_df[id_cols + [col]]
-            entity_df = entity_df.merge(clean_df, on=id_cols)
+            # we need this to be an empty df w/ columns bc we are going to use it
+            if col_correct_df.empty:
+                col_correct_df = pd.DataFrame(columns=col_df.columns)
 
-        if col in annual_cols:
-            clean_df = annual_id_df.merge(
-                col_correct_df, on=(id_cols + ["report_date"]), how="left"
-            )
-            clean_df = clean_df[id_cols + ["report_date", col]]
-            annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
-
-        # get the still dirty records by using the cleaned ids w/null values
-        # we need the plants that have no 'correct' value so
-        # we can't just use the col_df records when the consistency is not True
-        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
-
-        if col in special_case_cols:
-            clean_df = special_case_cols[col][0](
-                dirty_df,
-                clean_df,
-                entity_id_df,
-                id_cols,
-                col,
-                cols_to_consit,
-                special_case_cols[col][1],
-            )
             if col in static_cols:
+                clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
                 clean_df = clean_df[id_cols + [col]]
-                entity_df = entity_df.drop(columns=[col]).merge(clean_df, on=id_cols)
-            elif col in annual_cols:
-                raise AssertionError(
-                    "Method currenty not configured to work with annual values."
+                entity_df = entity_df.merge(clean_df, on=id_cols)
+
+            if col in annual_cols:
+                clean_df = annual_id_df.merge(
+                    col_correct_df, on=(id_cols + ["report_date"]), how="left"
                 )
+                clean_df = clean_df[id_cols + ["report_date", col]]
+                annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
+
+            # get the still dirty records by using the cleaned ids w/null values
+            # we need the plants that have no 'correct' value so
+            # we can't just use the col_df records when the consistency is not True
+            dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
+
+            if col in special_case_cols:
+                clean_df = special_case_cols[col][0](
+                    dirty_df,
+                    clean_df,
+                    entity_id_df,
+                    id_cols,
+                    col,
+                    cols_to_consit,
+                    special_case_cols[col][1],
+                )
+                if col in static_cols:
+                    clean_df = clean_df[id_cols + [col]]
+                    entity_df = entity_df.drop(columns=[col]).merge(
+                        clean_df, on=id_cols
+                    )
+                elif col in annual_cols:
+                    raise AssertionError(
+                        "Method currenty not configured to work with annual values."
+                    )
 
-        if debug:
-            col_dfs[col] = col_df
+            if debug:
+                col_dfs[col] = col_df
+            total = len(col_df.drop_duplicates(subset=cols_to_consit))
+            consistent = len(
+                col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
+                    subset=cols_to_consit
+                )
+            )
         # this next section is used to print and test whether the harvested
         # records are consistent enough
-        total = len(col_df.drop_duplicates(subset=cols_to_consit))
         # if the total is 0, the ratio will error, so assign null values.
         if total == 0:
             ratio = np.nan
             wrongos = np.nan
             logger.debug(f"       Zero records found for {col}")
         if total > 0:
-            ratio = (
-                len(
-                    col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
-                        subset=cols_to_consit
-                    )
-                )
-                / total
-            )
+            ratio = consistent / total
             wrongos = (1 - ratio) * total
             logger.debug(
                 f"       Ratio: {ratio:.3}  "
@@ -1,13 +1,14 @@
 """Module to perform data cleaning functions on EPA CEMS data tables."""
 
 import datetime
+from collections.abc import Iterable, Iterator
 
 import pandas as pd
-import pytz
 
 import pudl.logging_helpers
 from pudl.helpers import remove_leading_zeros_from_numeric_strings
 from pudl.metadata.fields import apply_pudl_dtypes
+from pudl.transform.timezones import utc_offsets
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -50,12 +51,12 @@ def harmonize_eia_epa_orispl(
     """
     # Make sure the crosswalk does not have multiple plant_id_eia values for each
     # plant_id_epa and emissions_unit_id_epa value before reassigning IDs.
-    one_to_many = crosswalk_df.groupby(
-        ["plant_id_epa", "emissions_unit_id_epa"]
-    ).filter(
-        lambda x: x.plant_id_eia.nunique() > 1  # noqa: PD101
+    one_to_many = (
+        crosswalk_df.groupby(["plant_id_epa", "emissions_unit_id_epa"])
+        .plant_id_eia.nunique()
+        .gt(1)
     )
-    if not one_to_many.empty:
+    if one_to_many.any():
         raise AssertionError(
             "The core_epa__assn_eia_epacamd crosswalk has more than one plant_id_eia value per "
             "plant_id_epa and emissions_unit_id_epa group"
@@ -144,9 +145,7 @@ def _load_plant_utc_offset(core_eia__entity_plants: pd.DataFrame) -> pd.DataFram
     """
     timezones = core_eia__entity_plants[["plant_id_eia", "timezone"]].copy().dropna()
     jan1 = datetime.datetime(2011, 1, 1)  # year doesn't matter
-    timezones["utc_offset"] = timezones["timezone"].apply(
-        lambda tz: pytz.timezone(tz).localize(jan1).utcoffset()
-    )
+    timezones["utc_offset"] = utc_offsets(timezones["timezone"], when=jan1)
     del timezones["timezone"]
     return timezones
 
@@ -172,6 +171,22 @@ def correct_gross_load_mw(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _transform(
+    raw_df: pd.DataFrame,
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    plant_utc_offset: pd.DataFrame,
+) -> pd.DataFrame:
+    """Transform EPA CEMS hourly data given precomputed plant UTC offsets."""
+    return (
+        raw_df.pipe(apply_pudl_dtypes, group="epacems")
+        .pipe(remove_leading_zeros_from_numeric_strings, "emissions_unit_id_epa")
+        .pipe(harmonize_eia_epa_orispl, core_epa__assn_eia_epacamd)
+        .pipe(convert_to_utc, plant_utc_offset=plant_utc_offset)
+        .pipe(correct_gross_load_mw)
+        .pipe(apply_pudl_dtypes, group="epacems")
+    )
+
+
 def transform(
     raw_df: pd.DataFrame,
     core_epa__assn_eia_epacamd: pd.DataFrame,
@@ -186,16 +201,32 @@ def transform(
     Returns:
         A single year_quarter of EPA CEMS data
     """
-    # Create all the table inputs used for the subtransform functions below
-
-    return (
-        raw_df.pipe(apply_pudl_dtypes, group="epacems")
-        .pipe(remove_leading_zeros_from_numeric_strings, "emissions_unit_id_epa")
-        .pipe(harmonize_eia_epa_orispl, core_epa__assn_eia_epacamd)
-        .pipe(
-            convert_to_utc,
-            plant_utc_offset=_load_plant_utc_offset(core_eia__entity_plants),
-        )
-        .pipe(correct_gross_load_mw)
-        .pipe(apply_pudl_dtypes, group="epacems")
+    return _transform(
+        raw_df,
+        core_epa__assn_eia_epacamd,
+        plant_utc_offset=_load_plant_utc_offset(core_eia__entity_plants),
     )
+
+
+def transform_batches(
+    raw_dfs: Iterable[pd.DataFrame],
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    core_eia__entity_plants: pd.DataFrame,
+) -> Iterator[pd.DataFrame]:
+    """Transform a stream of EPA CEMS hourly data chunks.
+
+    Every transformation applied by :func:`transform` works record by record, so the
+    chunks produced by :func:`pudl.extract.epacems.extract_batches` can be transformed
+    independently. The plant UTC offsets are only computed once.
+
+    Args:
+        raw_dfs: Extracted but not yet transformed chunks of EPA CEMS data.
+        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table.
+        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+
+    Yields:
+        Transformed chunks of EPA CEMS data.
+    """
+    plant_utc_offset = _load_plant_utc_offset(core_eia__entity_plants)
+    for raw_df in raw_dfs:
+        yield _transform(raw_df, core_epa__assn_eia_epacamd, plant_utc_offset)
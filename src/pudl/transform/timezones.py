@@ -0,0 +1,182 @@
+"""Look up the timezones and UTC offsets of many locations at once.
+
+Finding the timezone of a point means searching the timezone polygons distributed with
+:mod:`timezonefinder`, which is by far the slowest part of adding timezones to the
+plants entity table. Plants are often reported at exactly the same coordinates, and
+the coordinates of most plants don't change between ETL runs, so
+:func:`find_timezones` looks up each distinct location only once, and can keep the
+results in a cache on disk which is reused as long as the timezone polygons don't
+change.
+"""
+
+import datetime
+import importlib.metadata
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytz
+import timezonefinder
+
+import pudl
+from pudl.metadata.enums import APPROXIMATE_TIMEZONES
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+TZ_FINDER = timezonefinder.TimezoneFinder()
+"""A global TimezoneFinder to cache geographies in memory for faster access."""
+
+TZ_DATA_VERSION = importlib.metadata.version("timezonefinder")
+"""Version of the timezone polygons used to look up timezones.
+
+The polygons are distributed with :mod:`timezonefinder`, so a new release of it may
+change the timezone of some locations, and invalidates any cached lookups.
+"""
+
+COORDINATE_DECIMALS = 6
+"""Number of decimal places coordinates are rounded to before looking them up.
+
+Six decimal places of a degree are about 10 cm, far more precise than any reported
+plant location, so rounding only merges coordinates which differ by floating point
+noise.
+"""
+
+_TIMEZONE_CACHE: dict[tuple[float, float], str | None] = {}
+"""Timezones which have already been looked up in this process, by (lng, lat)."""
+
+
+def _timezone_at(lng: float, lat: float) -> str | None:
+    """Find the timezone of a single location, or None if it's out of bounds."""
+    try:
+        return TZ_FINDER.timezone_at(lng=lng, lat=lat)
+    except ValueError:
+        return None
+
+
+def _cache_file(cache_dir: Path) -> Path:
+    return cache_dir / f"timezones-{TZ_DATA_VERSION}.parquet"
+
+
+def _read_cache(cache_dir: Path) -> dict[tuple[float, float], str | None]:
+    """Read the timezones cached on disk for the current timezone polygons."""
+    path = _cache_file(cache_dir)
+    if not path.exists():
+        return {}
+    df = pd.read_parquet(path)
+    return dict(
+        zip(
+            zip(df.longitude, df.latitude, strict=True),
+            df.timezone.replace({np.nan: None}),
+            strict=True,
+        )
+    )
+
+
+def _write_cache(cache_dir: Path, cache: dict[tuple[float, float], str | None]):
+    """Atomically replace the timezones cached on disk."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    df = pd.DataFrame(
+        [(lng, lat, tz) for (lng, lat), tz in cache.items()],
+        columns=["longitude", "latitude", "timezone"],
+    ).astype({"longitude": float, "latitude": float, "timezone": "string"})
+    # Write to a temporary file first, so concurrent ETL processes never read a
+    # partially written cache.
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".parquet")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp, index=False)
+        Path(tmp).replace(_cache_file(cache_dir))
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def find_timezones(
+    lng: pd.Series,
+    lat: pd.Series,
+    state: pd.Series | None = None,
+    strict: bool = True,
+    cache_dir: Path | None = None,
+) -> pd.Series:
+    """Find the timezones of many locations.
+
+    This is a vectorized version of :func:`pudl.transform.eia.find_timezone`. The
+    coordinates are rounded to :data:`COORDINATE_DECIMALS` decimal places, and each
+    distinct location is only looked up once per process, or once per version of the
+    timezone polygons if ``cache_dir`` is given.
+
+    Args:
+        lng: Longitudes, in decimal degrees.
+        lat: Latitudes, in decimal degrees, with the same index as ``lng``.
+        state: Abbreviations for US states or Canadian provinces, used to approximate
+            the timezone of locations whose coordinates are missing or out of bounds,
+            unless ``strict`` is True.
+        strict: Raise an error if any location with coordinates can't be found?
+        cache_dir: Directory to keep the timezones which have been looked up in, so
+            they can be reused by later ETL runs.
+
+    Returns:
+        The IANA timezone of each location, with the same index as ``lng``. Timezones
+        are missing if they couldn't be found.
+
+    Raises:
+        ValueError: if ``strict`` is True and the timezone of any location can't be
+            found.
+    """
+    coords = pd.DataFrame(
+        {
+            "lng": pd.to_numeric(lng).astype(float).round(COORDINATE_DECIMALS),
+            "lat": pd.to_numeric(lat).astype(float).round(COORDINATE_DECIMALS),
+        },
+        index=lng.index,
+    )
+    unique = coords.dropna().drop_duplicates()
+    locations = list(zip(unique.lng, unique.lat, strict=True))
+    missing = [loc for loc in locations if loc not in _TIMEZONE_CACHE]
+    if missing and cache_dir is not None:
+        _TIMEZONE_CACHE.update(_read_cache(cache_dir))
+        missing = [loc for loc in missing if loc not in _TIMEZONE_CACHE]
+    if missing:
+        logger.info(f"Looking up the timezones of {len(missing)} locations.")
+        _TIMEZONE_CACHE.update({loc: _timezone_at(*loc) for loc in missing})
+        if cache_dir is not None:
+            _write_cache(cache_dir, _TIMEZONE_CACHE)
+
+    timezones = pd.Series(
+        [_TIMEZONE_CACHE[loc] for loc in locations],
+        index=pd.MultiIndex.from_frame(unique),
+        dtype="string",
+    )
+    tz = pd.Series(
+        timezones.reindex(pd.MultiIndex.from_frame(coords)).array,
+        index=lng.index,
+        dtype="string",
+    )
+    if strict and tz.isna().any():
+        bad = coords[tz.isna()].head()
+        raise ValueError(f"Can't find timezone for:\n{bad}")
+    if state is not None:
+        tz = tz.fillna(state.map(APPROXIMATE_TIMEZONES).astype("string"))
+    return tz
+
+
+def utc_offsets(
+    timezones: pd.Series, when: datetime.datetime = datetime.datetime(2011, 1, 1)
+) -> pd.Series:
+    """Find the UTC offsets of many IANA timezones at the same local time.
+
+    Each distinct timezone is only localized once.
+
+    Args:
+        timezones: IANA timezone names. They may not be missing.
+        when: The naive local time at which to find the offsets.
+
+    Returns:
+        The UTC offset of each timezone, with the same index as ``timezones``.
+    """
+    offsets = {
+        tz: pytz.timezone(tz).localize(when).utcoffset() for tz in timezones.unique()
+    }
+    return timezones.map(offsets).astype("timedelta64[ns]")
@@ -9,6 +9,7 @@ import sys
 import zipfile
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Annotated, Any, Self
 from urllib.parse import ParseResult, urlparse
@@ -19,7 +20,7 @@ import requests
 from google.auth.exceptions import DefaultCredentialsError
 from pydantic import HttpUrl, StringConstraints
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util.retry import Retry
 
 import pudl
@@ -37,6 +38,10 @@ ZenodoDoi = Annotated[
 ]
 
 
+DEFAULT_PREFETCH_WORKERS: int = 8
+"""Default number of resources to download concurrently when prefetching."""
+
+
 class ChecksumMismatchError(ValueError):
     """Resource checksum (md5) does not match."""
 
@@ -91,13 +96,21 @@ class DatapackageDescriptor:
 
     def validate_checksum(self, name: str, content: str) -> bool:
         """Returns True if content matches checksum for given named resource."""
-        expected_checksum = self._get_resource_metadata(name)["hash"]
         m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
         m.update(content)
-        if m.hexdigest() != expected_checksum:
+        self.validate_md5(name, m.hexdigest())
+
+    def validate_md5(self, name: str, hexdigest: str) -> None:
+        """Raises ChecksumMismatchError if an md5 digest doesn't match given resource.
+
+        This allows the checksum to be computed incrementally, e.g. while the resource
+        is being downloaded, rather than from its full contents.
+        """
+        expected_checksum = self._get_resource_metadata(name)["hash"]
+        if hexdigest != expected_checksum:
             raise ChecksumMismatchError(
                 f"Checksum for resource {name} does not match."
-                f"Expected {expected_checksum}, got {m.hexdigest()}"
+                f"Expected {expected_checksum}, got {hexdigest}"
             )
 
     def _matches(self, res: dict, **filters: Any):
@@ -227,14 +240,22 @@ class ZenodoFetcher:
 
         self.timeout = timeout
 
+        self.http = requests.Session()
+        self.set_pool_size(DEFAULT_POOLSIZE)
+        self._descriptor_cache = {}
+
+    def set_pool_size(self: Self, pool_size: int) -> None:
+        """Keep up to the given number of connections to each host open for reuse.
+
+        This should be at least the number of threads downloading concurrently, so
+        that none of them have to open a new connection for every request.
+        """
         retries = Retry(
             backoff_factor=2, total=3, status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retries)
-        self.http = requests.Session()
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=pool_size)
         self.http.mount("http://", adapter)
         self.http.mount("https://", adapter)
-        self._descriptor_cache = {}
 
     def get_doi(self: Self, dataset: str) -> ZenodoDoi:
         """Returns DOI for given dataset."""
@@ -299,6 +320,71 @@ class ZenodoFetcher:
         desc.validate_checksum(res.name, content)
         return content
 
+    def download_resource(
+        self: Self, res: PudlResourceKey, path: Path, chunk_size: int = 2**20
+    ) -> None:
+        """Stream a resource from zenodo into a local file, verifying its checksum.
+
+        The content is written to a ``.partial`` file alongside ``path`` as it arrives,
+        and the checksum is computed at the same time, so the resource never has to be
+        held in memory. If a ``.partial`` file was left behind by an interrupted
+        download, only the remaining bytes are requested. The file is only moved to
+        ``path`` once its checksum has been verified.
+
+        Args:
+            res: The resource to download.
+            path: Where the downloaded resource should be stored.
+            chunk_size: Number of bytes to read from the response at a time.
+
+        Raises:
+            ChecksumMismatchError: if the downloaded content is corrupted. The partial
+                download is removed so the next attempt will start from scratch.
+        """
+        desc = self.get_descriptor(res.dataset)
+        url = desc.get_resource_path(res.name)
+        partial = path.with_name(f"{path.name}.partial")
+        partial.parent.mkdir(parents=True, exist_ok=True)
+
+        md5 = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
+        offset = 0
+        if partial.exists():
+            with partial.open("rb") as f:
+                for block in iter(lambda: f.read(chunk_size), b""):
+                    md5.update(block)
+                    offset += len(block)
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with self.http.get(
+            url, headers=headers, stream=True, timeout=self.timeout
+        ) as response:
+            if response.status_code == requests.codes.partial_content:
+                logger.info(f"Resuming download of {url} from byte {offset}")
+                mode = "ab"
+            elif response.status_code == requests.codes.ok:
+                logger.info(f"Downloading {url} from zenodo")
+                mode = "wb"
+                md5 = hashlib.md5()  # noqa: S324
+            elif (
+                response.status_code == requests.codes.requested_range_not_satisfiable
+                and offset
+            ):
+                # The previous download finished, but wasn't moved into place.
+                mode = None
+            else:
+                raise ValueError(f"Could not download {url}: {response.text}")
+            if mode:
+                with partial.open(mode) as f:
+                    for chunk in response.iter_content(chunk_size):
+                        md5.update(chunk)
+                        f.write(chunk)
+
+        try:
+            desc.validate_md5(res.name, md5.hexdigest())
+        except ChecksumMismatchError:
+            partial.unlink()
+            raise
+        partial.replace(path)
+
 
 class Datastore:
     """Handle connections and downloading of Zenodo Source archives."""
@@ -321,12 +407,14 @@ class Datastore:
             timeout: connection timeouts (in seconds) to use when connecting
                 to Zenodo servers.
         """
-        self._cache = resource_cache.LayeredCache()
+        self._cache = resource_cache.LayeredCache(use_index=True)
+        self._local_cache: resource_cache.LocalFileCache | None = None
         self._datapackage_descriptors: dict[str, DatapackageDescriptor] = {}
 
         if local_cache_path:
             logger.info(f"Adding local cache layer at {local_cache_path}")
-            self._cache.add_cache_layer(resource_cache.LocalFileCache(local_cache_path))
+            self._local_cache = resource_cache.LocalFileCache(local_cache_path)
+            self._cache.add_cache_layer(self._local_cache)
         if gcs_cache_path:
             try:
                 logger.info(f"Adding GCS cache layer at {gcs_cache_path}")
@@ -400,10 +488,97 @@ class Datastore:
                 self._cache.add(res, contents)
                 yield (res, contents)
 
+    def prefetch(
+        self,
+        partitions: dict[str, list[dict[str, Any]]],
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+    ) -> list[PudlResourceKey]:
+        """Concurrently download the selected partitions into the local cache.
+
+        Resources which are already in the local cache are skipped. Resources found in
+        another cache layer are copied from there, and the rest are streamed straight
+        to disk from zenodo using :meth:`ZenodoFetcher.download_resource`, which can
+        resume interrupted downloads. All downloads share one HTTP session.
+
+        Args:
+            partitions: For each dataset, a list of partition filters selecting the
+                resources to download. Filter keys which aren't partitions of the
+                dataset are ignored, and an empty filter selects every resource.
+            max_workers: Maximum number of resources to download concurrently.
+
+        Returns:
+            The resources which were downloaded.
+
+        Raises:
+            ValueError: if this datastore has no local cache to download into.
+            RuntimeError: if any of the resources could not be downloaded. Successful
+                downloads are kept, so prefetching again will only retry the failures.
+        """
+        if self._local_cache is None or self._local_cache.is_read_only():
+            raise ValueError("Prefetching requires a writable local cache.")
+
+        resources: dict[PudlResourceKey, None] = {}
+        for dataset, dataset_partitions in partitions.items():
+            desc = self.get_datapackage_descriptor(dataset)
+            known_parts = desc.get_partitions()
+            for filters in dataset_partitions:
+                filters = {k: v for k, v in filters.items() if k in known_parts}
+                resources |= dict.fromkeys(desc.get_resources(**filters))
+        missing = [res for res in resources if not self._local_cache.contains(res)]
+        logger.info(
+            f"Prefetching {len(missing)} of {len(resources)} resources "
+            f"using {max_workers} workers."
+        )
+        # Look up descriptors up front so the workers don't all request them at once.
+        for dataset in {res.dataset for res in missing}:
+            self._zenodo_fetcher.get_descriptor(dataset)
+        # Allow one pooled connection per concurrent download.
+        self._zenodo_fetcher.set_pool_size(max_workers)
+
+        def fetch(res: PudlResourceKey) -> None:
+            if self._cache.contains(res):
+                self._local_cache.add(res, self._cache.get(res))
+            else:
+                self._zenodo_fetcher.download_resource(
+                    res, self._local_cache.get_path(res)
+                )
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch, res): res for res in missing}
+            for future in as_completed(futures):
+                res = futures[future]
+                if future.exception() is None:
+                    logger.info(f"Prefetched {res}.")
+                else:
+                    logger.error(f"Failed to prefetch {res}: {future.exception()}")
+                    failed.append(res)
+        # The local cache was written to directly, bypassing the layered cache index.
+        self._cache.invalidate_index()
+        if failed:
+            raise RuntimeError(f"Failed to prefetch {len(failed)} resources: {failed}")
+        return missing
+
     def remove_from_cache(self, res: PudlResourceKey) -> None:
         """Remove given resource from the associated cache."""
         self._cache.delete(res)
 
+    def get_unique_resource_file(
+        self, dataset: str, **filters: Any
+    ) -> Path | io.BytesIO:
+        """Returns a unique resource as a local file path if possible.
+
+        Resources found in the local file cache can be opened directly from disk by the
+        caller, so large archives don't need to be read into memory all at once.
+        Otherwise the resource is retrieved (and cached) with
+        :meth:`get_unique_resource` and its content is returned in memory.
+        """
+        desc = self.get_datapackage_descriptor(dataset)
+        resources = list(desc.get_resources(**filters))
+        if len(resources) == 1 and (path := self._cache.get_local_path(resources[0])):
+            return path
+        return io.BytesIO(self.get_unique_resource(dataset, **filters))
+
     def get_unique_resource(self, dataset: str, **filters: Any) -> bytes:
         """Returns content of a resource assuming there is exactly one that matches."""
         res = self.get_resources(dataset, **filters)
@@ -418,8 +593,12 @@ class Datastore:
         raise KeyError(f"Multiple resources found for {dataset}: {filters}")
 
     def get_zipfile_resource(self, dataset: str, **filters: Any) -> zipfile.ZipFile:
-        """Retrieves unique resource and opens it as a ZipFile."""
-        return zipfile.ZipFile(io.BytesIO(self.get_unique_resource(dataset, **filters)))
+        """Retrieves unique resource and opens it as a ZipFile.
+
+        Archives in the local file cache are opened directly from disk, so their
+        members are read on demand rather than loading the whole archive into memory.
+        """
+        return zipfile.ZipFile(self.get_unique_resource_file(dataset, **filters))
 
     def get_zipfile_resources(
         self, dataset: str, **filters: Any
@@ -498,6 +677,19 @@ def fetch_resources(
                 dstore._cache.add(res, contents)
 
 
+def prefetch_resources(
+    dstore: Datastore, settings_file: pathlib.Path, max_workers: int
+) -> None:
+    """Concurrently download all the partitions needed by an ETL settings file."""
+    # pudl.settings depends on this module, so it can't be imported at the top level.
+    from pudl.settings import EtlSettings
+
+    partitions = EtlSettings.from_yaml(str(settings_file)).get_datastore_partitions()
+    for dataset, dataset_partitions in partitions.items():
+        logger.info(f"Prefetching {dataset}: {dataset_partitions}")
+    dstore.prefetch(partitions, max_workers=max_workers)
+
+
 def _parse_key_values(
     ctx: click.core.Context,
     param: click.Option,
@@ -561,6 +753,26 @@ def _parse_key_values(
     ),
     callback=_parse_key_values,
 )
+@click.option(
+    "--prefetch",
+    type=click.Path(
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+        path_type=pathlib.Path,
+    ),
+    help=(
+        "Concurrently download all of the partitions selected by this ETL settings "
+        "file into the local cache. Interrupted downloads are resumed."
+    ),
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=DEFAULT_PREFETCH_WORKERS,
+    show_default=True,
+    help="Number of resources to download concurrently when using --prefetch.",
+)
 @click.option(
     "--bypass-local-cache",
     is_flag=True,
@@ -603,6 +815,8 @@ def pudl_datastore(
     validate: bool,
     list_partitions: bool,
     partition: dict[str, int | str],
+    prefetch: pathlib.Path | None,
+    workers: int,
     gcs_cache_path: str,
     bypass_local_cache: bool,
     logfile: pathlib.Path,
@@ -629,6 +843,10 @@ def pudl_datastore(
     List the available partitions in the EIA-860 and EIA-923 datasets:
 
     pudl_datastore --dataset eia860 --dataset eia923 --list-partitions
+
+    Download everything needed to run the fast ETL, 16 resources at a time:
+
+    pudl_datastore --prefetch src/pudl/package_data/settings/etl_fast.yml --workers 16
     """
     pudl.logging_helpers.configure_root_logger(logfile=logfile, loglevel=loglevel)
 
@@ -648,6 +866,8 @@ def pudl_datastore(
         print_partitions(dstore, dataset)
     elif validate:
         validate_cache(dstore, dataset, partition)
+    elif prefetch:
+        prefetch_resources(dstore, prefetch, max_workers=workers)
     else:
         fetch_resources(
             dstore=dstore,
@@ -1,5 +1,8 @@
 """Implementations of datastore resource caches."""
 
+import os
+import tempfile
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -80,6 +83,22 @@ class AbstractCache(ABC):
     def contains(self, resource: PudlResourceKey) -> bool:
         """Returns True if the resource is present in the cache."""
 
+    def get_local_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns the path of a local file holding the resource, if there is one.
+
+        Caches which don't store their contents in the local filesystem return None.
+        """
+        return None
+
+    def list_resource_paths(self) -> set[str] | None:
+        """Returns the relative paths of all the resources held by the cache.
+
+        Paths are POSIX strings in the form produced by
+        :meth:`PudlResourceKey.get_local_path`. Caches which can't list their contents
+        in bulk return None.
+        """
+        return None
+
 
 class LocalFileCache(AbstractCache):
     """Simple key-value store mapping PudlResourceKeys to ByteIO contents."""
@@ -92,6 +111,10 @@ class LocalFileCache(AbstractCache):
     def _resource_path(self, resource: PudlResourceKey) -> Path:
         return self.cache_root_dir / resource.get_local_path()
 
+    def get_path(self, resource: PudlResourceKey) -> Path:
+        """Returns the path where the given resource is (or would be) stored."""
+        return self._resource_path(resource)
+
     def get(self, resource: PudlResourceKey) -> bytes:
         """Retrieves value associated with a given resource."""
         with self._resource_path(resource).open("rb") as res:
@@ -106,8 +129,17 @@ class LocalFileCache(AbstractCache):
             return
         path = self._resource_path(resource)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as file:
-            file.write(content)
+        # Write to a temporary file and move it into place, so that other threads or
+        # processes never read a partially written resource.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
@@ -120,6 +152,20 @@ class LocalFileCache(AbstractCache):
         """Returns True if resource is present in the cache."""
         return self._resource_path(resource).exists()
 
+    def get_local_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns the path of the cached resource, or None if it isn't cached."""
+        path = self._resource_path(resource)
+        return path if path.exists() else None
+
+    def list_resource_paths(self) -> set[str]:
+        """Returns the relative paths of all the files in the cache directory."""
+        root = Path(self.cache_root_dir)
+        return {
+            path.relative_to(root).as_posix()
+            for path in root.glob("*/*/*")
+            if path.is_file()
+        }
+
 
 class GoogleCloudStorageCache(AbstractCache):
     """Implements file cache backed by Google Cloud Storage bucket."""
@@ -166,6 +212,15 @@ class GoogleCloudStorageCache(AbstractCache):
         """Returns True if resource is present in the cache."""
         return self._blob(resource).exists(retry=gcs_retry)
 
+    def list_resource_paths(self) -> set[str]:
+        """Returns the relative paths of all the blobs under the path prefix."""
+        prefix = self._path_prefix.as_posix().strip("/")
+        prefix = f"{prefix}/" if prefix else ""
+        return {
+            blob.name.removeprefix(prefix)
+            for blob in self._bucket.list_blobs(prefix=prefix, retry=gcs_retry)
+        }
+
 
 class LayeredCache(AbstractCache):
     """Implements multi-layered system of caches.
@@ -176,17 +231,32 @@ class LayeredCache(AbstractCache):
 
     Only the closest layer is being written to (set, delete), while all remaining layers
     are read-only (get).
+
+    If ``use_index`` is set, the cache remembers which resources each layer holds. The
+    index is built from a single bulk listing of each layer the first time a resource
+    is looked up, so subsequent lookups of resources which are present don't need to
+    touch the filesystem or make network requests. Resources missing from the index are
+    still looked up in the layer, in case another process has added them since it was
+    listed. Changes made through this cache keep the index up to date, but if resources
+    are deleted from the layers directly, :meth:`invalidate_index` must be called.
     """
 
-    def __init__(self, *caches: list[AbstractCache], **kwargs: Any):
+    def __init__(
+        self, *caches: list[AbstractCache], use_index: bool = False, **kwargs: Any
+    ):
         """Creates layered cache consisting of given cache layers.
 
         Args:
             caches: List of caching layers to uses. These are given in the order
               of decreasing priority.
+            use_index: if True, keep an index of the resources held by each layer
+              instead of checking the layers for every lookup.
         """
         super().__init__(**kwargs)
         self._caches: list[AbstractCache] = list(caches)
+        self._use_index = use_index
+        self._index: list[set[str] | None] | None = None
+        self._index_lock = threading.Lock()
 
     def add_cache_layer(self, cache: AbstractCache):
         """Adds caching layer.
@@ -194,6 +264,49 @@ class LayeredCache(AbstractCache):
         The priority is below all other.
         """
         self._caches.append(cache)
+        self.invalidate_index()
+
+    def invalidate_index(self):
+        """Forget the indexed layer contents, which will be listed again when needed."""
+        with self._index_lock:
+            self._index = None
+
+    def _layer_index(self, layer: int) -> set[str] | None:
+        """Returns the index of the given layer, listing all layers if necessary.
+
+        Returns None if the index is disabled or the layer can't be listed.
+        """
+        if not self._use_index:
+            return None
+        with self._index_lock:
+            if self._index is None:
+                logger.debug("Indexing the contents of the cache layers.")
+                self._index = [cache.list_resource_paths() for cache in self._caches]
+            return self._index[layer]
+
+    def _layer_contains(self, layer: int, resource: PudlResourceKey) -> bool:
+        """Returns True if the given layer contains the resource.
+
+        Resources which aren't in the index are looked up in the layer itself, since
+        they may have been added by another process after it was indexed.
+        """
+        index = self._layer_index(layer)
+        if index is not None and resource.get_local_path().as_posix() in index:
+            return True
+        if not self._caches[layer].contains(resource):
+            return False
+        self._update_index(layer, resource, present=True)
+        return True
+
+    def _update_index(self, layer: int, resource: PudlResourceKey, present: bool):
+        """Records that a resource was added to or deleted from the given layer."""
+        with self._index_lock:
+            if self._index is None or self._index[layer] is None:
+                return
+            if present:
+                self._index[layer].add(resource.get_local_path().as_posix())
+            else:
+                self._index[layer].discard(resource.get_local_path().as_posix())
 
     def num_layers(self):
         """Returns number of caching layers that are in this LayeredCache."""
@@ -202,7 +315,7 @@ class LayeredCache(AbstractCache):
     def get(self, resource: PudlResourceKey) -> bytes:
         """Returns content of a given resource."""
         for i, cache in enumerate(self._caches):
-            if cache.contains(resource):
+            if self._layer_contains(i, resource):
                 logger.debug(
                     f"get:{resource} found in {i}-th layer ({cache.__class__.__name__})."
                 )
@@ -215,11 +328,12 @@ class LayeredCache(AbstractCache):
         if self.is_read_only():
             logger.debug(f"Read only cache: ignoring set({resource})")
             return
-        for cache_layer in self._caches:
+        for i, cache_layer in enumerate(self._caches):
             if cache_layer.is_read_only():
                 continue
             logger.debug(f"Adding {resource} to cache {cache_layer.__class__.__name__}")
             cache_layer.add(resource, value)
+            self._update_index(i, resource, present=True)
             logger.debug(
                 f"Added {resource} to cache layer {cache_layer.__class__.__name__})"
             )
@@ -230,16 +344,17 @@ class LayeredCache(AbstractCache):
         if self.is_read_only():
             logger.debug(f"Readonly cache: not removing {resource}")
             return
-        for cache_layer in self._caches:
+        for i, cache_layer in enumerate(self._caches):
             if cache_layer.is_read_only():
                 continue
             cache_layer.delete(resource)
+            self._update_index(i, resource, present=False)
             break
 
     def contains(self, resource: PudlResourceKey) -> bool:
         """Returns True if resource is present in the cache."""
         for i, cache in enumerate(self._caches):
-            if cache.contains(resource):
+            if self._layer_contains(i, resource):
                 logger.debug(
                     f"contains: {resource} found in {i}-th layer ({cache.__class__.__name__})."
                 )
@@ -247,13 +362,24 @@ class LayeredCache(AbstractCache):
         logger.debug(f"contains: {resource} not found in layered cache.")
         return False
 
+    def get_local_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns the local path of a resource from the first layer that contains it.
+
+        If the first layer containing the resource isn't stored in the local
+        filesystem, returns None even if a lower priority layer is.
+        """
+        for i, cache in enumerate(self._caches):
+            if self._layer_contains(i, resource):
+                return cache.get_local_path(resource)
+        return None
+
     def is_optimally_cached(self, resource: PudlResourceKey) -> bool:
         """Return True if resource is contained in the closest write-enabled layer."""
-        for cache_layer in self._caches:
+        for i, cache_layer in enumerate(self._caches):
             if cache_layer.is_read_only():
                 continue
             logger.debug(
                 f"{resource} optimally cached in {cache_layer.__class__.__name__}"
             )
-            return cache_layer.contains(resource)
+            return self._layer_contains(i, resource)
         return False
@@ -18,11 +18,14 @@ class PudlPaths(BaseSettings):
     """These settings provide access to various PUDL directories.
 
     It is primarily configured via PUDL_INPUT and PUDL_OUTPUT environment
-    variables. Other paths of relevance are derived from these.
+    variables. Other paths of relevance are derived from these. Intermediate results
+    which can be reused by later ETL runs are only kept if the optional PUDL_CACHE
+    environment variable is also set.
     """
 
     pudl_input: PotentialDirectoryPath
     pudl_output: PotentialDirectoryPath
+    pudl_cache: PotentialDirectoryPath | None = None
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
     @model_validator(mode="after")
@@ -41,6 +44,13 @@ class PudlPaths(BaseSettings):
         """Path to PUDL output directory."""
         return Path(self.pudl_output).absolute()
 
+    @property
+    def cache_dir(self) -> Path | None:
+        """Path to PUDL cache directory, or None if caching is disabled."""
+        if self.pudl_cache is None:
+            return None
+        return Path(self.pudl_cache).absolute()
+
     @property
     def settings_dir(self) -> Path:
         """Path to directory containing settings files."""
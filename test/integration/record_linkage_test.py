@@ -1,6 +1,7 @@
 """Test core record linkage functionality."""
 # ruff: noqa: S311
 
+import copy
 import random
 import string
 
@@ -229,8 +230,10 @@ def _score_model(
     return ratio_correct
 
 
-def test_classify_plants_ferc1(mock_ferc1_plants_df):
-    """Test the FERC inter-year plant linking model."""
+def _run_ferc_to_ferc(
+    mock_ferc1_plants_df: pd.DataFrame, distance_config: dict | None = None
+) -> pd.DataFrame:
+    """Run the FERC inter-year plant linking model on the mock plants."""
     steam_plants = mock_ferc1_plants_df[
         [
             "plant_name_ferc1",
@@ -246,11 +249,18 @@ def test_classify_plants_ferc1(mock_ferc1_plants_df):
         ["plant_name_ferc1", "utility_id_ferc1", "report_year"] + _FUEL_COLS
     ]
 
-    config = get_ml_models_config()["ops"][
-        "_out_ferc1__yearly_steam_plants_sched402_with_plant_ids"
-    ]
+    # The default configuration is shared, so modify a copy of it.
+    config = copy.deepcopy(
+        get_ml_models_config()["ops"][
+            "_out_ferc1__yearly_steam_plants_sched402_with_plant_ids"
+        ]
+    )
     config["ops"]["ferc_to_ferc_tracker"]["config"]["run_context"] = "testing"
-    label_df = (
+    if distance_config:
+        config["ops"]["ferc_to_ferc"]["ops"]["link_ids_cross_year"]["ops"][
+            "compute_distance_with_year_penalty"
+        ]["config"].update(distance_config)
+    return (
         ferc_to_ferc.node_def.to_job()
         .execute_in_process(
             run_config=config,
@@ -261,7 +271,24 @@ def test_classify_plants_ferc1(mock_ferc1_plants_df):
         )
         .output_value()
     )
+
+
+def test_classify_plants_ferc1(mock_ferc1_plants_df):
+    """Test the FERC inter-year plant linking model."""
+    label_df = _run_ferc_to_ferc(mock_ferc1_plants_df)
     ratio_correct = _score_model(mock_ferc1_plants_df, label_df)
 
     logger.info(f"Percent correctly matched: {ratio_correct:.2%}")
     assert ratio_correct > 0.82, "Percent of correctly matched FERC records below 85%."
+
+
+def test_classify_plants_ferc1_sparse(mock_ferc1_plants_df):
+    """The sparse distance backend finds the same plants as the dense one."""
+    dense = _run_ferc_to_ferc(mock_ferc1_plants_df)
+    sparse = _run_ferc_to_ferc(
+        mock_ferc1_plants_df, {"backend": "sparse", "radius": 1.0}
+    )
+    np.testing.assert_array_equal(
+        pd.factorize(sparse["plant_id_ferc1"])[0],
+        pd.factorize(dense["plant_id_ferc1"])[0],
+    )
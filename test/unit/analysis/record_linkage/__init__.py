@@ -0,0 +1 @@
+"""Unit tests for the pudl.analysis.record_linkage subpackage."""
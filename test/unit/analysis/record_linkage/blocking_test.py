@@ -0,0 +1,153 @@
+"""Unit tests for the pudl.analysis.record_linkage.blocking module."""
+
+import itertools
+
+import duckdb
+import jellyfish
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis.record_linkage.blocking import (
+    BlockingKey,
+    BlockingRule,
+    candidate_pairs,
+)
+
+
+def _random_plants(size: int, rng: np.random.Generator) -> pd.DataFrame:
+    names = ["barry", "bartow", "bowen", "brown", "hammond", "harris", None]
+    return pd.DataFrame(
+        {
+            "report_year": pd.array(rng.integers(2000, 2006, size=size), dtype="Int64"),
+            "plant_name": rng.choice(np.array(names, dtype=object), size=size),
+            "capacity_mw": rng.choice([10.0, 20.0, np.nan], size=size),
+        }
+    )
+
+
+def _brute_force_pairs(
+    left: pd.DataFrame, right: pd.DataFrame, rules: list[BlockingRule], dedupe: bool
+) -> set[tuple[int, int]]:
+    """Find the pairs which agree on any rule by comparing every pair of records."""
+
+    def agree(key: BlockingKey, x, y) -> bool:
+        if pd.isna(x) or pd.isna(y):
+            return False
+        if key.method == "prefix":
+            return x[: key.size] == y[: key.size]
+        if key.method == "metaphone":
+            return jellyfish.metaphone(x) == jellyfish.metaphone(y)
+        if key.method == "ngram":
+            ngrams = [
+                {v[i : i + key.size] for i in range(len(v) - key.size + 1)}
+                for v in (x, y)
+            ]
+            return bool(ngrams[0] & ngrams[1])
+        if key.method == "window":
+            return abs(x - y) <= key.size
+        return x == y
+
+    return {
+        (i, j)
+        for i, j in itertools.product(range(len(left)), range(len(right)))
+        if (i < j or not dedupe)
+        and any(
+            all(
+                agree(key, left[key.column].iloc[i], right[key.column].iloc[j])
+                for key in rule.keys
+            )
+            for rule in rules
+        )
+    }
+
+
+RULES = [
+    BlockingRule(
+        keys=[
+            BlockingKey(column="report_year"),
+            BlockingKey(column="plant_name", method="prefix", size=2),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            BlockingKey(column="report_year", method="window", size=1),
+            BlockingKey(column="capacity_mw"),
+        ]
+    ),
+    BlockingRule(
+        keys=[
+            BlockingKey(column="report_year"),
+            BlockingKey(column="plant_name", method="ngram", size=3),
+        ]
+    ),
+    BlockingRule(keys=[BlockingKey(column="plant_name", method="metaphone")]),
+]
+
+
+@pytest.mark.parametrize("dedupe", [True, False])
+def test_candidate_pairs(dedupe):
+    """Blocking finds the same pairs as comparing every pair of records."""
+    rng = np.random.default_rng(2024)
+    left = _random_plants(40, rng)
+    right = None if dedupe else _random_plants(30, rng)
+    candidates = candidate_pairs(left, RULES, right=right)
+    right = left if dedupe else right
+
+    expected = _brute_force_pairs(left, right, RULES, dedupe)
+    assert set(candidates.pairs.itertuples(index=False, name=None)) == expected
+    assert len(candidates.pairs) == len(expected)
+    assert candidates.total_pairs == (780 if dedupe else 1200)
+    assert candidates.reduction_ratio == 1 - len(expected) / candidates.total_pairs
+    assert list(candidates.rule_pairs) == [str(rule) for rule in RULES]
+    assert max(candidates.rule_pairs.values()) <= len(expected)
+
+
+def test_to_sql_matches_candidate_pairs():
+    """The SQL version of the rules finds the same pairs in DuckDB."""
+    rng = np.random.default_rng(2025)
+    left = _random_plants(50, rng).assign(record=range(50))
+    right = _random_plants(50, rng).assign(record=range(50))
+    rules = RULES[:2]
+    assert rules[1].to_sql() == (
+        "l.report_year between r.report_year - 1 and r.report_year + 1 "
+        "and l.capacity_mw = r.capacity_mw"
+    )
+    condition = " or ".join(f"({rule.to_sql()})" for rule in rules)
+    con = duckdb.connect()
+    con.register("eia", left)
+    con.register("ferc", right)
+    expected = (
+        con.execute(
+            'SELECT l.record AS "left", r.record AS "right" FROM eia AS l, ferc AS r '  # noqa: S608
+            f"WHERE {condition} ORDER BY 1, 2"
+        )
+        .df()
+        .astype(int)
+    )
+    actual = candidate_pairs(left, rules, right=right).pairs
+    pd.testing.assert_frame_equal(actual.astype(int), expected)
+    with pytest.raises(ValueError):
+        RULES[2].to_sql()
+
+
+def test_max_block_pairs():
+    """Blocks with too many pairs are skipped."""
+    df = pd.DataFrame({"state": ["CO"] * 4 + ["NM"] * 2 + [None]})
+    rule = BlockingRule(keys=[BlockingKey(column="state")])
+    assert len(candidate_pairs(df, [rule]).pairs) == 7
+    rule = BlockingRule(keys=[BlockingKey(column="state")], max_block_pairs=10)
+    assert candidate_pairs(df, [rule]).pairs.to_dict("list") == {
+        "left": [4],
+        "right": [5],
+    }
+
+
+def test_window_needs_integers():
+    """Window keys can't be derived from non-integer columns."""
+    df = pd.DataFrame({"capacity_mw": [10.5, 11.0]})
+    rule = BlockingRule(
+        keys=[BlockingKey(column="capacity_mw", method="window", size=1)]
+    )
+    with pytest.raises(ValueError, match="integer"):
+        candidate_pairs(df, [rule])
@@ -0,0 +1,47 @@
+"""Unit tests for the pudl.analysis.record_linkage.eia_ferc1_record_linkage module."""
+
+import jellyfish
+import pandas as pd
+
+from pudl.analysis.record_linkage import eia_ferc1_record_linkage
+from pudl.analysis.record_linkage.eia_ferc1_record_linkage import get_name_features
+
+
+def test_get_name_features(mocker, tmp_path):
+    """Features are computed once per name, and cached in a Parquet table."""
+    metaphone = mocker.Mock(wraps=jellyfish.metaphone)
+    mocker.patch.dict(eia_ferc1_record_linkage.NAME_FEATURES, {"mphone": metaphone})
+    names = pd.Series(["barry", "bowen", None, "barry", "hammond", pd.NA])
+
+    features = get_name_features(names, cache_dir=tmp_path)
+    assert features.index.tolist() == ["barry", "bowen", "hammond"]
+    assert features.mphone.tolist() == [
+        jellyfish.metaphone(name) for name in features.index
+    ]
+    assert metaphone.call_count == 3
+
+    features = get_name_features(pd.Series(["bartow", "barry"]), cache_dir=tmp_path)
+    assert features.mphone.to_dict() == {
+        "bartow": jellyfish.metaphone("bartow"),
+        "barry": jellyfish.metaphone("barry"),
+    }
+    assert metaphone.call_count == 4
+    (cache_path,) = tmp_path.glob("*.parquet")
+    assert eia_ferc1_record_linkage.JELLYFISH_VERSION in cache_path.name
+    assert len(pd.read_parquet(cache_path)) == 4
+
+    # Without the cache every name is computed again
+    get_name_features(pd.Series(["bartow", "barry"]))
+    assert metaphone.call_count == 6
+
+    # The table is rebuilt if the features have changed
+    mocker.patch.dict(eia_ferc1_record_linkage.NAME_FEATURES, {"nysiis": metaphone})
+    features = get_name_features(names, cache_dir=tmp_path)
+    assert list(features.columns) == ["mphone", "nysiis"]
+    assert metaphone.call_count == 12
+
+    # Features computed by another version of jellyfish aren't reused
+    mocker.patch.object(eia_ferc1_record_linkage, "JELLYFISH_VERSION", "0.0.0")
+    get_name_features(names, cache_dir=tmp_path)
+    assert metaphone.call_count == 18
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
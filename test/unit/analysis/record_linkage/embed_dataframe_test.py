@@ -0,0 +1,87 @@
+"""Unit tests for the pudl.analysis.record_linkage.embed_dataframe module."""
+
+import jellyfish
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis.record_linkage import embed_dataframe
+from pudl.analysis.record_linkage.embed_dataframe import (
+    StringSimilarityScorer,
+    jaro_winkler_similarities,
+)
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    """Start with an empty cache of string similarities."""
+    monkeypatch.setattr(
+        embed_dataframe,
+        "_JARO_WINKLER_CACHE",
+        embed_dataframe._JARO_WINKLER_CACHE.iloc[:0],
+    )
+
+
+def _random_strings(size: int, rng: np.random.Generator) -> pd.Series:
+    # Includes characters which jellyfish treats as single graphemes
+    chars = np.array(list("abcde fghé") + ["🇺", "\r", "\n"])
+    return pd.Series(
+        [
+            "".join(rng.choice(chars, size=length))
+            for length in rng.choice([0, 1, 4, 8, 12], size=size)
+        ]
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_jaro_winkler_similarities(workers, empty_cache):
+    """Similarities are identical to those computed by jellyfish."""
+    rng = np.random.default_rng(2024)
+    left = _random_strings(2000, rng)
+    right = pd.concat([_random_strings(1000, rng), left.iloc[:1000]], ignore_index=True)
+    expected = pd.Series(
+        [
+            jellyfish.jaro_winkler_similarity(s1, s2)
+            for s1, s2 in zip(left, right, strict=True)
+        ]
+    )
+    actual = jaro_winkler_similarities(left, right, workers=workers)
+    pd.testing.assert_series_equal(actual, expected, check_exact=True)
+
+
+def test_jaro_winkler_similarities_cache(mocker, empty_cache):
+    """Distinct pairs are scored once, and cached scores aren't computed again."""
+    score = mocker.spy(embed_dataframe, "_score_jaro_winkler")
+    left = pd.Series(
+        ["barry", "bowen", "barry", None, "hammond"], index=[5, 4, 3, 2, 1]
+    )
+    right = pd.Series(["bary", "bowen", "bary", "bowen", np.nan], index=[5, 4, 3, 2, 1])
+    actual = jaro_winkler_similarities(left, right)
+    assert actual.index.equals(left.index)
+    assert actual.iloc[:3].tolist() == [
+        jellyfish.jaro_winkler_similarity("barry", "bary"),
+        1.0,
+        jellyfish.jaro_winkler_similarity("barry", "bary"),
+    ]
+    assert actual.iloc[3:].isna().all()
+    assert len(score.call_args.args[0]) == 2
+
+    jaro_winkler_similarities(pd.Series(["bowen", "brown"]), pd.Series(["bowen"] * 2))
+    assert score.call_args.args[0].tolist() == ["brown"]
+    jaro_winkler_similarities(left, right)
+    assert score.call_count == 2
+    jaro_winkler_similarities(left, right, cache=False)
+    assert score.call_count == 3
+
+
+def test_string_similarity_scorer(empty_cache):
+    """The scorer returns the similarity of two columns as a frame."""
+    df = pd.DataFrame({"eia": ["barry", "bowen"], "ferc": ["bary", "brown"]})
+    transformer = StringSimilarityScorer(
+        metric="jaro_winkler", col1="eia", col2="ferc", workers=2
+    ).as_transformer()
+    actual = transformer.fit_transform(df)
+    expected = pd.DataFrame(
+        {0: [jellyfish.jaro_winkler_similarity(*pair) for pair in df.itertuples(False)]}
+    )
+    pd.testing.assert_frame_equal(actual, expected)
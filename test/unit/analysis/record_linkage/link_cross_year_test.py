@@ -0,0 +1,105 @@
+"""Unit tests for the pudl.analysis.record_linkage.link_cross_year module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy
+
+from pudl.analysis.record_linkage.link_cross_year import (
+    DistanceMatrix,
+    PenalizeReportYearDistanceConfig,
+    SparseDistanceMatrix,
+)
+
+
+@pytest.fixture
+def plants():
+    """Noisy features of plants reported in several years, in a random order."""
+    rng = np.random.default_rng(2024)
+    centers = rng.uniform(0, 4, size=(40, 3))
+    years = rng.integers(2000, 2010, size=(40, 5))
+    df = pd.DataFrame(
+        {
+            "plant": np.repeat(np.arange(40), 5),
+            "report_year": years.ravel(),
+        }
+    ).sample(frac=1, random_state=0, ignore_index=True)
+    features = centers[df.plant] + rng.normal(scale=0.1, size=(len(df), 3))
+    return df, features
+
+
+@pytest.fixture
+def distance_matrices(plants):
+    """The dense and sparse distance matrices of the plants."""
+    df, features = plants
+    config = PenalizeReportYearDistanceConfig(radius=1.0)
+    return (
+        DistanceMatrix(features, df, config),
+        SparseDistanceMatrix(features, df, config),
+    )
+
+
+def test_radius_neighbors_graph(distance_matrices):
+    """The sparse backend finds the same neighbors as the dense one."""
+    dense, sparse = distance_matrices
+    expected = dense.radius_neighbors_graph(0.5)
+    actual = sparse.radius_neighbors_graph(0.5)
+    assert (expected != 0).sum() == (actual != 0).sum()
+    np.testing.assert_allclose(actual.toarray(), expected.toarray(), rtol=1e-5)
+    with pytest.raises(ValueError):
+        sparse.radius_neighbors_graph(2.0)
+
+
+def test_cluster_distances(plants, distance_matrices):
+    """Distances within a cluster, including same year penalties, are the same."""
+    df, _ = plants
+    dense, sparse = distance_matrices
+    cluster_inds = np.flatnonzero(df.plant.isin([0, 1]))
+    np.testing.assert_allclose(
+        sparse.cluster_distances(cluster_inds),
+        dense.cluster_distances(cluster_inds),
+        rtol=1e-5,
+    )
+
+
+def test_average_cluster_distances(plants, distance_matrices):
+    """Average distances are the same, for clusters which are close enough to match."""
+    df, _ = plants
+    dense, sparse = distance_matrices
+    # Some records are left on their own, like records DBSCAN couldn't cluster.
+    orphans = np.flatnonzero(df.plant < 5)
+    cluster_groups = [np.array([ind]) for ind in orphans] + [
+        inds for plant, inds in df.groupby("plant").indices.items() if plant >= 5
+    ]
+    [(clusters, expected)] = dense.average_cluster_distances(cluster_groups, 0.5)
+    np.testing.assert_array_equal(clusters, np.arange(len(cluster_groups)))
+
+    components = list(sparse.average_cluster_distances(cluster_groups, 0.5))
+    assert 1 < len(components) < len(cluster_groups)
+    component_of = np.empty(len(cluster_groups), dtype=int)
+    for component, (clusters, actual) in enumerate(components):
+        component_of[clusters] = component
+        # Only the distances between clusters with nearby records are computed.
+        expected_component = expected[np.ix_(clusters, clusters)]
+        linked = actual != sparse.distance_penalty
+        assert linked.sum() > len(clusters) or len(clusters) == 1
+        np.testing.assert_allclose(
+            actual[linked], expected_component[linked], rtol=1e-5
+        )
+        assert (expected_component[~linked] > 0.5).all()
+    different = component_of[:, None] != component_of[None, :]
+    assert (expected[different] > 0.5).all()
+    with pytest.raises(ValueError):
+        next(sparse.average_cluster_distances(cluster_groups, 0.6))
+
+
+def test_sparse_storage(plants, distance_matrices):
+    """Only the distances between nearby records from different years are stored."""
+    df, _ = plants
+    _, sparse = distance_matrices
+    assert scipy.sparse.issparse(sparse.distance_matrix)
+    graph = sparse.distance_matrix.tocoo()
+    assert (graph.data <= 1.0).all()
+    years = df.report_year.to_numpy()
+    assert (years[graph.row] != years[graph.col]).all()
+    assert graph.nnz < len(df) ** 2 / 10
@@ -0,0 +1,110 @@
+"""Unit tests for the pudl.analysis.record_linkage.name_cleaner module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis.record_linkage import name_cleaner
+from pudl.analysis.record_linkage.name_cleaner import CompanyNameCleaner
+
+NAMES = [
+    "The Barry Power Co.",
+    "  Smith-Jones & Sons, L.L.C.",
+    "bowen (unit 1) inc",
+    "Hammond Corp. Plant",
+    "Southern Co. Services Inc",
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_memo(monkeypatch):
+    """Start each test without any memoized names."""
+    monkeypatch.setattr(name_cleaner, "_CLEAN_NAMES_MEMO", {})
+
+
+@pytest.mark.parametrize(
+    "legal_term_location,expected",
+    [
+        (
+            1,
+            [
+                "barry power company",
+                "smith jones and sons l l c",
+                "bowen unit incorporated",
+                "hammond corp plant",
+                "southern co services incorporated",
+            ],
+        ),
+        (
+            2,
+            [
+                "barry power company",
+                "smith jones and sons l l c",
+                "bowen unit incorporated",
+                "hammond corporation plant",
+                "southern company services incorporated",
+            ],
+        ),
+    ],
+)
+def test_clean_names(legal_term_location, expected):
+    """Names are cleaned the same way one at a time and all together."""
+    cleaner = CompanyNameCleaner(legal_term_location=legal_term_location)
+    assert [cleaner.get_clean_data(name) for name in NAMES] == expected
+    names = pd.Series(NAMES + [None, 3, NAMES[0]], index=np.arange(8)[::-1])
+    actual = cleaner.clean_names(names)
+    assert actual.index.equals(names.index)
+    assert actual.iloc[:5].tolist() == expected
+    assert actual.iloc[5:7].isna().all()
+    assert actual.iloc[7] == expected[0]
+
+
+def test_clean_names_memo(mocker, tmp_path):
+    """Distinct names are cleaned once, and remembered across runs."""
+    clean_string = mocker.spy(CompanyNameCleaner, "_clean_string")
+    cleaner = CompanyNameCleaner(memo_dir=tmp_path)
+    expected = cleaner.clean_names(pd.Series(NAMES * 3))
+    assert clean_string.call_count == len(NAMES)
+
+    cleaner.clean_names(pd.Series(NAMES[:2] + ["Bartow Generating Plant"]))
+    assert clean_string.call_args.args[1] == "Bartow Generating Plant"
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+    # A new run only has the memo on disk
+    name_cleaner._CLEAN_NAMES_MEMO.clear()
+    pd.testing.assert_series_equal(
+        CompanyNameCleaner(memo_dir=tmp_path).clean_names(pd.Series(NAMES * 3)),
+        expected,
+    )
+    assert clean_string.call_count == len(NAMES) + 1
+    # Cleaners with other rules don't share the memo
+    CompanyNameCleaner(memo_dir=tmp_path, normalize_legal_terms=False).clean_names(
+        pd.Series(NAMES)
+    )
+    assert clean_string.call_count == 2 * len(NAMES) + 1
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
+
+
+def test_apply_name_cleaning():
+    """Each column of a dataframe is cleaned."""
+    cleaner = CompanyNameCleaner()
+    df = pd.DataFrame({"plant_name": NAMES[:2], "utility_name": NAMES[3:]})
+    pd.testing.assert_frame_equal(
+        cleaner.apply_name_cleaning(df),
+        pd.DataFrame(
+            {
+                "plant_name": ["barry power company", "smith jones and sons l l c"],
+                "utility_name": [
+                    "hammond corp plant",
+                    "southern co services incorporated",
+                ],
+            },
+            dtype=object,
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        cleaner.apply_name_cleaning(df[["plant_name"]], return_as_dframe=True),
+        df[["plant_name"]].assign(
+            plant_name=["barry power company", "smith jones and sons l l c"]
+        ),
+    )
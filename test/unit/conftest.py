@@ -1,9 +1,14 @@
 import logging
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pydantic
 import pytest
 
+from pudl.metadata.classes import Resource
 from pudl.workspace.setup import PudlPaths
 
 logger = logging.getLogger(__name__)
@@ -51,3 +56,46 @@ def configure_paths_for_tests(tmp_path_factory, request):
         pytest.exit(
             f"Set PUDL_INPUT, PUDL_OUTPUT env variables, or use --tmp-path, --live-dbs flags. Error: {err}."
         )
+
+
+@pytest.fixture
+def epacems_resource() -> Resource:
+    """The EPA CEMS hourly emissions table metadata."""
+    return Resource.from_id("core_epacems__hourly_emissions")
+
+
+@pytest.fixture
+def fake_epacems_quarter(epacems_resource) -> Callable[..., pa.Table]:
+    """A factory for quarters of fake EPA CEMS data with a few plants in each state."""
+
+    def _fake_epacems_quarter(
+        year: int, quarter: int, states: list[str], seed: int
+    ) -> pa.Table:
+        rng = np.random.default_rng(seed)
+        hours = pd.date_range(
+            pd.Timestamp(year=year, month=3 * quarter - 2, day=1), periods=48, freq="h"
+        )
+        records = []
+        for plant_id, state in enumerate(states * 2, start=1):
+            records.append(
+                pd.DataFrame(
+                    {
+                        "plant_id_eia": plant_id,
+                        "plant_id_epa": plant_id,
+                        "emissions_unit_id_epa": "1",
+                        "operating_datetime_utc": hours,
+                        "year": year,
+                        "state": state,
+                        "gross_load_mw": rng.random(len(hours)),
+                    }
+                )
+            )
+        df = pd.concat(records).sample(frac=1, random_state=seed)
+        df = epacems_resource.format_df(
+            df.reindex(columns=epacems_resource.get_field_names())
+        )
+        return pa.Table.from_pandas(
+            df, schema=epacems_resource.to_pyarrow(), preserve_index=False
+        )
+
+    return _fake_epacems_quarter
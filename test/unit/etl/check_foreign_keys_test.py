@@ -0,0 +1,163 @@
+"""Unit tests for the pudl.etl.check_foreign_keys module."""
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from pudl.etl.check_foreign_keys import (
+    ForeignKeyViolations,
+    find_foreign_key_violations,
+    parquet_views,
+)
+from pudl.metadata.classes import Package, Resource
+
+SONG_FIELDS = [
+    {"name": "artist_id", "type": "integer", "description": "Artist."},
+    {"name": "album_id", "type": "integer", "description": "Album."},
+    {"name": "song_id", "type": "integer", "description": "Song."},
+]
+
+TABLES = {
+    "artist": pd.DataFrame({"artist_id": [1, 2]}),
+    "album": pd.DataFrame({"artist_id": [1, 1, 2], "album_id": [1, 2, 1]}),
+    "song": pd.DataFrame(
+        {
+            "artist_id": [1, 1, 2, 3, 3, 3, None],
+            "album_id": [1, 3, 1, 1, 1, 2, 9],
+            "song_id": [1, 2, 3, 4, 5, 6, 7],
+        },
+        dtype="Int64",
+    ),
+}
+
+
+@pytest.fixture
+def music_pkg() -> Package:
+    """Create a package with simple and composite foreign keys."""
+    return Package(
+        name="music",
+        resources=[
+            Resource(
+                name="artist",
+                description="Artists.",
+                schema={"fields": SONG_FIELDS[:1], "primary_key": ["artist_id"]},
+            ),
+            Resource(
+                name="album",
+                description="Albums.",
+                schema={
+                    "fields": SONG_FIELDS[:2],
+                    "primary_key": ["artist_id", "album_id"],
+                    "foreign_keys": [
+                        {
+                            "fields": ["artist_id"],
+                            "reference": {
+                                "resource": "artist",
+                                "fields": ["artist_id"],
+                            },
+                        }
+                    ],
+                },
+            ),
+            Resource(
+                name="song",
+                description="Songs.",
+                schema={
+                    "fields": SONG_FIELDS,
+                    "primary_key": ["song_id"],
+                    "foreign_keys": [
+                        {
+                            "fields": ["artist_id"],
+                            "reference": {
+                                "resource": "artist",
+                                "fields": ["artist_id"],
+                            },
+                        },
+                        {
+                            "fields": ["artist_id", "album_id"],
+                            "reference": {
+                                "resource": "album",
+                                "fields": ["artist_id", "album_id"],
+                            },
+                        },
+                    ],
+                },
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, music_pkg) -> sa.Engine:
+    """Load the tables into a SQLite database without enforcing foreign keys."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'music.sqlite'}")
+    music_pkg.to_sql().create_all(engine)
+    with engine.begin() as con:
+        for name, df in TABLES.items():
+            df.to_sql(name, con, if_exists="append", index=False)
+    return engine
+
+
+@pytest.fixture
+def duckdb_con(tmp_path):
+    """Write the tables to Parquet and view them with DuckDB."""
+    for name, df in TABLES.items():
+        df.to_parquet(tmp_path / f"{name}.parquet", index=False)
+    return parquet_views(tmp_path)
+
+
+EXPECTED = [
+    {
+        "child_table": "album",
+        "child_fields": ["artist_id"],
+        "parent_table": "artist",
+        "parent_fields": ["artist_id"],
+        "violations": 0,
+        "distinct_keys": 0,
+        "sample_keys": [],
+    },
+    {
+        "child_table": "song",
+        "child_fields": ["artist_id"],
+        "parent_table": "artist",
+        "parent_fields": ["artist_id"],
+        "violations": 3,
+        "distinct_keys": 1,
+        "sample_keys": [{"artist_id": 3, "row_count": 3}],
+    },
+    {
+        "child_table": "song",
+        "child_fields": ["artist_id", "album_id"],
+        "parent_table": "album",
+        "parent_fields": ["artist_id", "album_id"],
+        "violations": 4,
+        "distinct_keys": 3,
+        "sample_keys": [
+            {"artist_id": 3, "album_id": 1, "row_count": 2},
+            {"artist_id": 1, "album_id": 3, "row_count": 1},
+        ],
+    },
+]
+
+
+@pytest.mark.parametrize("backend", ["sqlite_engine", "duckdb_con"])
+def test_find_foreign_key_violations(backend, music_pkg, request):
+    """Violations are counted, and the most common missing keys sampled."""
+    con = request.getfixturevalue(backend)
+    actual = find_foreign_key_violations(
+        con, package=music_pkg, sample_size=2, max_workers=2
+    )
+    assert actual == EXPECTED
+    assert "song -- album (artist_id, album_id) -- on 4 rows" in str(
+        ForeignKeyViolations(actual)
+    )
+
+
+def test_find_foreign_key_violations_missing_tables(tmp_path, music_pkg):
+    """Relationships between tables which weren't written are skipped."""
+    TABLES["album"].to_parquet(tmp_path / "album.parquet", index=False)
+    TABLES["song"].to_parquet(tmp_path / "song.parquet", index=False)
+    actual = find_foreign_key_violations(parquet_views(tmp_path), package=music_pkg)
+    assert [(v["child_table"], v["parent_table"]) for v in actual] == [
+        ("song", "album")
+    ]
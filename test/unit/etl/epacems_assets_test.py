@@ -0,0 +1,74 @@
+"""Tests for the EPA CEMS consolidation helpers."""
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from pudl.etl.epacems_assets import (
+    EPACEMS_SORT_KEYS,
+    write_state_partitions,
+    write_year_state_row_groups,
+)
+
+
+def test_write_year_state_row_groups(tmp_path, epacems_resource, fake_epacems_quarter):
+    """Each row group should hold one sorted state, and no records should be lost."""
+    states = ["CO", "ID", "TX"]
+    sources = []
+    for quarter in (1, 2):
+        source = tmp_path / f"epacems-2020q{quarter}.parquet"
+        pq.write_table(
+            fake_epacems_quarter(2020, quarter, states, seed=quarter),
+            source,
+        )
+        sources.append(source)
+
+    schema = epacems_resource.to_pyarrow()
+    output = tmp_path / "monolithic.parquet"
+    with pq.ParquetWriter(output, schema=schema) as writer:
+        # A tiny buffer forces some states to be written before all sources are read.
+        write_year_state_row_groups(
+            writer, sources, max_buffered_rows=300, row_group_size=100
+        )
+
+    sort_cols = [col for col, _ in EPACEMS_SORT_KEYS]
+    expected = (
+        pq.read_table(sources)
+        .cast(schema)
+        .to_pandas()
+        .sort_values(sort_cols, ignore_index=True)
+    )
+    observed = pq.read_table(output).cast(schema).to_pandas()
+    pd.testing.assert_frame_equal(
+        observed.sort_values(sort_cols, ignore_index=True), expected
+    )
+
+    parquet_file = pq.ParquetFile(output)
+    assert parquet_file.num_row_groups > len(states)
+    for i in range(parquet_file.num_row_groups):
+        row_group = parquet_file.read_row_group(i).to_pandas()
+        assert len(set(row_group.state)) == 1
+        assert row_group[sort_cols].equals(row_group[sort_cols].sort_values(sort_cols))
+
+
+def test_write_state_partitions(tmp_path, epacems_resource, fake_epacems_quarter):
+    """Each state should get its own sorted file in a year=/state= directory."""
+    table = fake_epacems_quarter(2020, 1, ["CO", "ID"], seed=1)
+    # A stale partition for a state that no longer has any data should be removed.
+    stale = tmp_path / "year=2020" / "state=TX" / "epacems-2020q1.parquet"
+    stale.parent.mkdir(parents=True)
+    stale.touch()
+
+    paths = write_state_partitions(table, tmp_path, 2020, "2020q1", row_group_size=50)
+
+    assert not stale.exists()
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in paths) == [
+        "year=2020/state=CO/epacems-2020q1.parquet",
+        "year=2020/state=ID/epacems-2020q1.parquet",
+    ]
+    sort_cols = [col for col, _ in EPACEMS_SORT_KEYS]
+    for path in paths:
+        parquet_file = pq.ParquetFile(path)
+        assert parquet_file.num_row_groups == 2
+        df = parquet_file.read().to_pandas()
+        assert set(df.state) == {path.parent.name.removeprefix("state=")}
+        assert df[sort_cols].equals(df[sort_cols].sort_values(sort_cols))
@@ -0,0 +1,201 @@
+"""Unit tests for the generic FERC DBF extractor."""
+
+import io
+import os
+import struct
+
+import hypothesis
+import pandas as pd
+import pytest
+from dbfread import DBF
+
+from pudl.extract.dbf import (
+    FercDbfExtractor,
+    FercFieldParser,
+    PartitionedDataFrame,
+    dbf_to_dataframe,
+)
+
+
+def make_dbf(
+    fields: list[tuple[str, str, int]],
+    records: list[list[bytes]],
+    deleted: tuple[int, ...] = (),
+    trailer: bytes = b"\x1a",
+) -> DBF:
+    """Builds a FoxPro DBF table with the given fields and raw field values.
+
+    Args:
+        fields: name, type and width of each field.
+        records: raw values of each field in each record.
+        deleted: indices of the records which should be marked as deleted.
+        trailer: bytes to append after the records.
+    """
+    header_len = 32 + 32 * len(fields) + 1
+    record_len = 1 + sum(width for _, _, width in fields)
+    dbf = io.BytesIO()
+    dbf.write(
+        struct.pack("<BBBBLHH20x", 0x30, 99, 1, 1, len(records), header_len, record_len)
+    )
+    for name, field_type, width in fields:
+        dbf.write(
+            struct.pack("<11scLBB14x", name.encode(), field_type.encode(), 0, width, 0)
+        )
+    dbf.write(b"\r")
+    for i, record in enumerate(records):
+        dbf.write(b"*" if i in deleted else b" ")
+        for (_, _, width), value in zip(fields, record, strict=True):
+            dbf.write(value.ljust(width)[:width])
+    dbf.write(trailer)
+    dbf.seek(0)
+    return DBF("test.dbf", encoding="latin1", parserclass=FercFieldParser, filedata=dbf)
+
+
+def read_dbf_records(dbf: DBF) -> pd.DataFrame | type[ValueError]:
+    """Reads a DBF table one record at a time, as FercDbfArchive used to."""
+    try:
+        return pd.DataFrame(iter(dbf))
+    except ValueError:
+        return ValueError
+
+
+def test_dbf_to_dataframe():
+    """Each type of field is decoded the same way as by dbfread."""
+    fields = [
+        ("NAME", "C", 8),
+        ("AMOUNT", "N", 8),
+        ("COUNT", "N", 4),
+        ("RATE", "F", 6),
+        ("REPORTED", "D", 8),
+        ("FLAG", "L", 1),
+        ("_NullFlags", "0", 1),
+    ]
+    records = [
+        [b"Utility", b"  -12.50", b"  12", b" 1.5", b"20200131", b"T", b"\x00"],
+        [b"", b"      0.", b"   0", b"", b"        ", b"?", b"\x01"],
+        [b"A\x00B", b"*******", b"0012", b"-0", b"19991231", b"F", b"\x00"],
+        [b"deleted", b"1", b"1", b"1", b"20000101", b"T", b"\x00"],
+        [b"\xe9t\xe9  ", b" 1,5", b"  .", b"   .25", b"00000000", b"N", b"\x00"],
+    ]
+    dbf = make_dbf(fields, records, deleted=(3,))
+    expected = read_dbf_records(dbf)
+    pd.testing.assert_frame_equal(dbf_to_dataframe(dbf), expected)
+    pd.testing.assert_frame_equal(
+        dbf_to_dataframe(dbf, skip_fields=("_NullFlags",)),
+        expected.drop(columns="_NullFlags"),
+    )
+
+
+def test_dbf_to_dataframe_stops_at_eof_marker():
+    """Records after the end of file marker are ignored, and so are deleted records."""
+    fields = [("ID", "N", 4)]
+    dbf = make_dbf(fields, [[b"1"], [b"2"]], trailer=b"\x1a 3   ")
+    assert dbf_to_dataframe(dbf).ID.tolist() == [1, 2]
+    dbf = make_dbf(fields, [[b"1"], [b"2"]], deleted=(0, 1))
+    pd.testing.assert_frame_equal(dbf_to_dataframe(dbf), read_dbf_records(dbf))
+
+
+numeric_values = hypothesis.strategies.one_of(
+    hypothesis.strategies.text(alphabet=" -.0123456789", max_size=8),
+    hypothesis.strategies.text(alphabet=" -.0123456789*,\x00", max_size=8),
+    hypothesis.strategies.integers(-9999999, 99999999).map(str),
+    hypothesis.strategies.decimals(
+        -999999, 9999999, places=2, allow_nan=False, allow_infinity=False
+    ).map(str),
+).map(lambda value: value.rjust(8).encode())
+
+
+@hypothesis.settings(deadline=None)
+@hypothesis.given(
+    hypothesis.strategies.lists(
+        hypothesis.strategies.tuples(numeric_values, numeric_values),
+        min_size=1,
+        max_size=20,
+    ),
+    hypothesis.strategies.integers(1, 3),
+)
+def test_dbf_to_dataframe_numeric_parity(values, repeats):
+    """Numeric and float fields are parsed exactly like FercFieldParser would.
+
+    Repeating the records makes the decoder parse each distinct value only once.
+    """
+    dbf = make_dbf([("N", "N", 8), ("F", "F", 8)], [list(v) for v in values] * repeats)
+    expected = read_dbf_records(dbf)
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            dbf_to_dataframe(dbf)
+    else:
+        pd.testing.assert_frame_equal(dbf_to_dataframe(dbf), expected)
+
+
+class FakeDbfReader:
+    """Reader which makes up a one row table for each table and partition."""
+
+    def __init__(self):
+        """Starts without having fetched any archives."""
+        self.archives = []
+
+    def get_archive(self, **filters) -> None:
+        """Records the partitions whose archives have been fetched."""
+        self.archives.append(filters)
+
+    def get_dataset(self) -> str:
+        """Returns the name of the fake dataset."""
+        return "ferc1"
+
+    def get_table_names(self) -> list[str]:
+        """Returns the names of the fake tables."""
+        return [f"table_{i}" for i in range(5)]
+
+    def load_table_dfs(self, table_name, partitions) -> list[PartitionedDataFrame]:
+        """Returns a frame recording the table, year and process that read it."""
+        return [
+            PartitionedDataFrame(
+                pd.DataFrame(
+                    {"table": [table_name], "year": [p["year"]], "pid": [os.getpid()]}
+                ),
+                p,
+            )
+            for p in partitions
+            if p["year"] != 2001 or table_name != "table_3"
+        ]
+
+
+class FakeDbfExtractor(FercDbfExtractor):
+    """Extractor which reads its tables from the fake reader."""
+
+    DATASET = "ferc1"
+    DATABASE_NAME = "fake_dbf.sqlite"
+
+    def get_settings(self, global_settings):
+        """The fake extractor has no settings."""
+
+    def get_dbf_reader(self, datastore):
+        """Returns the fake reader."""
+        return FakeDbfReader()
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_iter_table_dfs(tmp_path, workers):
+    """Tables are read in order, whether they're read in parallel or not."""
+    partitions = [{"year": year} for year in range(2000, 2004)]
+    extractor = FakeDbfExtractor(
+        datastore=None, settings=None, output_path=tmp_path, workers=workers
+    )
+    tables = []
+    pids = set()
+    for table, dfs in extractor.iter_table_dfs(partitions):
+        tables.append(table)
+        expected_years = [
+            year for year in range(2000, 2004) if year != 2001 or table != "table_3"
+        ]
+        assert [pdf.partition["year"] for pdf in dfs] == expected_years
+        assert all((pdf.df.table == table).all() for pdf in dfs)
+        pids |= {pid for pdf in dfs for pid in pdf.df.pid}
+    assert tables == FakeDbfReader().get_table_names()
+    if workers == 1:
+        assert pids == {os.getpid()}
+    else:
+        assert os.getpid() not in pids
+        # Archives are fetched once, before the workers are forked
+        assert extractor.dbf_reader.archives == partitions
@@ -0,0 +1,99 @@
+"""Unit tests for the pudl.extract.epacems module."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from pudl.extract.epacems import (
+    API_ARROW_TYPES,
+    API_DTYPE_DICT,
+    API_IGNORE_COLS,
+    API_PANDAS_TYPES,
+    API_RENAME_DICT,
+    EpaCemsDatastore,
+    extract_batches,
+)
+
+CSV_HEADER = (
+    "State,Facility Name,Facility ID,Unit ID,Associated Stacks,Date,Hour,"
+    "Operating Time,Gross Load (MW),Steam Load (1000 lb/hr),SO2 Mass (lbs),"
+    "SO2 Mass Measure Indicator,SO2 Rate (lbs/mmBtu),CO2 Mass (short tons),"
+    "CO2 Mass Measure Indicator,NOx Mass (lbs),NOx Mass Measure Indicator,"
+    "Heat Input (mmBtu),Heat Input Measure Indicator,Primary Fuel Type\n"
+)
+CSV_RECORDS = [
+    'AL,"Barry, Plant",3,1,CS0AAN,2022-01-01,{hour},1.00,153,,12.5,Measured,0.2,'
+    "120.1,Measured,,Measured,1200.5,Measured,Coal\n",
+    'CO,"Comanche, Plant",470,2,,2022-01-01,{hour},0.50,,,,,,,,,,,,Coal\n',
+]
+
+
+@pytest.fixture
+def epacems_csv() -> bytes:
+    """A small EPA CEMS CSV with a mix of ignored, missing and quoted values."""
+    return (
+        CSV_HEADER
+        + "".join(
+            record.format(hour=hour) for hour in range(24) for record in CSV_RECORDS
+        )
+    ).encode()
+
+
+@pytest.mark.parametrize("block_size", [256, 2**20])
+def test_csv_to_record_batches(epacems_csv, block_size):
+    """The Arrow CSV reader should produce the same data as the pandas reader."""
+    ds = EpaCemsDatastore(datastore=None)
+    expected = ds._csv_to_dataframe(
+        io.BytesIO(epacems_csv),
+        ignore_cols=API_IGNORE_COLS,
+        rename_dict=API_RENAME_DICT,
+        dtype_dict=API_DTYPE_DICT,
+    )
+    batches = list(
+        ds._csv_to_record_batches(
+            io.BytesIO(epacems_csv),
+            ignore_cols=API_IGNORE_COLS,
+            rename_dict=API_RENAME_DICT,
+            arrow_types=API_ARROW_TYPES,
+            block_size=block_size,
+        )
+    )
+    if block_size < len(epacems_csv):
+        assert len(batches) > 1
+    observed = pd.concat(
+        [batch.to_pandas(types_mapper=API_PANDAS_TYPES.get) for batch in batches],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(observed, expected, check_categorical=False)
+
+
+def test_extract_batches_missing_quarter(mocker):
+    """Quarters missing from the datastore yield nothing."""
+
+    def get_record_batches(self, partition, block_size):
+        raise KeyError(partition.year_quarter)
+        yield
+
+    mocker.patch.object(EpaCemsDatastore, "get_record_batches", get_record_batches)
+    assert list(extract_batches("2022q1", ds=None)) == []
+
+
+def test_extract_batches_propagates_errors(mocker, epacems_csv):
+    """Errors after the first batch aren't mistaken for a missing quarter."""
+
+    def get_record_batches(self, partition, block_size):
+        yield from self._csv_to_record_batches(
+            io.BytesIO(epacems_csv),
+            ignore_cols=API_IGNORE_COLS,
+            rename_dict=API_RENAME_DICT,
+            arrow_types=API_ARROW_TYPES,
+            block_size=256,
+        )
+        raise KeyError("Unmapped column")
+
+    mocker.patch.object(EpaCemsDatastore, "get_record_batches", get_record_batches)
+    batches = extract_batches("2022q1", ds=None)
+    assert (next(batches).year == 2022).all()
+    with pytest.raises(KeyError, match="Unmapped column"):
+        list(batches)
@@ -1,11 +1,19 @@
 """Unit tests for pudl.extract.excel module."""
 
+import datetime
+import io
 import unittest
+import zipfile
+from contextlib import contextmanager
 from unittest import mock as mock
 
+import hypothesis
+import numpy as np
 import pandas as pd
+import pytest
 
 from pudl.extract import excel
+from pudl.helpers import convert_df_to_excel_file
 
 
 class TestMetadata(unittest.TestCase):
@@ -120,3 +128,211 @@ class TestExtractor(unittest.TestCase):
 
     # TODO(rousik@gmail.com): need to figure out how to test process_$x methods.
     # TODO(rousik@gmail.com): we should test that empty columns are properly added.
+
+
+def read_excel_round_trip(df, **kwargs):
+    """Parses a DataFrame by writing it to an Excel file and reading it back."""
+    return pd.read_excel(
+        convert_df_to_excel_file(df, index=False), sheet_name=0, **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"dtype": {"Plant ID": pd.Int64Dtype()}},
+        {"skiprows": 1, "skipfooter": 1},
+        {"skipfooter": 3},
+    ],
+)
+def test_read_dataframe_sheet(kwargs):
+    """Parsing a DataFrame directly matches parsing it via an Excel file."""
+    df = pd.DataFrame(
+        {
+            "Plant ID": [1, 2, None, 4, None, None],
+            "count": [1, 2, 3, 4, 5, 6],
+            "rate": [1.0, 2.5, np.nan, -0.0, np.inf, np.nan],
+            "name": ["a", "", "12", None, "x", None],
+            "code": ["1", "2", "3.5", "", None, None],
+            "date": [
+                datetime.date(2001, 1, 1),
+                None,
+                datetime.date(2002, 3, 4),
+                None,
+                None,
+                None,
+            ],
+            "flag": [True, False, None, True, None, None],
+            "empty": [None] * 6,
+        }
+    ).astype({"count": object})
+    # Make the last row entirely empty.
+    df.loc[5, "count"] = None
+    pd.testing.assert_frame_equal(
+        excel.read_dataframe_sheet(df, **kwargs), read_excel_round_trip(df, **kwargs)
+    )
+
+
+cell_values = hypothesis.strategies.one_of(
+    hypothesis.strategies.none(),
+    hypothesis.strategies.booleans(),
+    hypothesis.strategies.integers(-(2**40), 2**40),
+    hypothesis.strategies.sampled_from([np.nan, np.inf, -np.inf]),
+    # Excel only keeps 15 significant digits, far more than DBF numeric fields hold.
+    hypothesis.strategies.decimals(-1e9, 1e9, places=4).map(float),
+    hypothesis.strategies.text(alphabet="ab .-019", max_size=5),
+    hypothesis.strategies.dates(datetime.date(1990, 1, 1), datetime.date(2030, 1, 1)),
+)
+
+
+@hypothesis.settings(deadline=None, max_examples=50)
+@hypothesis.given(
+    hypothesis.strategies.lists(
+        hypothesis.strategies.tuples(cell_values, cell_values, cell_values),
+        max_size=6,
+    ),
+    hypothesis.strategies.integers(0, 2),
+    hypothesis.strategies.integers(0, 2),
+)
+def test_read_dataframe_sheet_parity(rows, skiprows, skipfooter):
+    """Any mix of DBF field values is parsed just like it would be from Excel."""
+    df = pd.DataFrame(rows, columns=["A", "B", "C"], dtype=object)
+    kwargs = {"skiprows": skiprows, "skipfooter": skipfooter}
+    try:
+        expected = read_excel_round_trip(df, **kwargs)
+    except ValueError:
+        with pytest.raises(ValueError):
+            excel.read_dataframe_sheet(df, **kwargs)
+    else:
+        pd.testing.assert_frame_equal(
+            excel.read_dataframe_sheet(df, **kwargs), expected
+        )
+
+
+def test_workbook_cache_evicts_least_recently_used():
+    """Workbooks are evicted in LRU order once the cache exceeds its size."""
+    cache = excel.WorkbookCache(max_bytes=10)
+    loads = []
+
+    def loader(name, nbytes):
+        def load():
+            loads.append(name)
+            return name, nbytes
+
+        return load
+
+    assert cache.get("a", loader("a", 4)) == "a"
+    assert cache.get("b", loader("b", 4)) == "b"
+    assert cache.get("a", loader("a", 4)) == "a"
+    assert cache.get("c", loader("c", 4)) == "c"
+    assert loads == ["a", "b", "c"]
+    assert len(cache) == 2
+    assert cache.nbytes == 8
+    # b was the least recently used, so it was evicted.
+    cache.get("b", loader("b", 4))
+    assert loads == ["a", "b", "c", "b"]
+    # Workbooks which don't fit in the cache at all aren't cached.
+    assert cache.get("huge", loader("huge", 11)) == "huge"
+    assert "huge" not in cache._workbooks
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def _workbook_bytes(sheets: list[pd.DataFrame]) -> bytes:
+    bio = io.BytesIO()
+    with pd.ExcelWriter(bio, engine="xlsxwriter") as writer:
+        for i, df in enumerate(sheets):
+            df.to_excel(writer, sheet_name=f"Sheet{i}", index=False)
+    return bio.getvalue()
+
+
+class FakeDatastore:
+    """Datastore which serves a zip archive of Excel workbooks for each year."""
+
+    def __init__(self):
+        """Creates workbooks holding the books and boxes of 2010 and 2011."""
+        self.archives = {}
+        for year in (2010, 2011):
+            bio = io.BytesIO()
+            with zipfile.ZipFile(bio, "w") as zf:
+                zf.writestr(
+                    "b-file.xlsx",
+                    _workbook_bytes(
+                        [_fake_data_frames(f"books-{year}")]
+                        + [_fake_data_frames(f"boxes-{year}")]
+                    ),
+                )
+            self.archives[year] = bio.getvalue()
+        self.requests = []
+
+    @contextmanager
+    def get_zipfile_resource(self, dataset, **filters):
+        """Opens the archive of a year."""
+        self.requests.append(filters)
+        with zipfile.ZipFile(io.BytesIO(self.archives[filters["year"]])) as zf:
+            yield zf
+
+
+class FakeWorkbookExtractor(excel.ExcelExtractor):
+    """Extractor which reads the books and boxes pages from real workbooks."""
+
+    def __init__(self, *args, **kwargs):
+        """Uses the test metadata, with no header or footer rows to skip."""
+        self.METADATA = excel.ExcelMetadata("test")
+        self.METADATA.get_skiprows = lambda page, **partition: 0
+        self.METADATA.get_skipfooter = lambda page, **partition: 0
+        self.BLACKLISTED_PAGES = ["shoes"]
+        super().__init__(*args, **kwargs)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_extract_workbooks(workers):
+    """Each workbook is opened once and shared with other extractors."""
+    excel.WORKBOOK_CACHE.clear()
+    ds = FakeDatastore()
+    expected = FakeExtractor().extract(year=[2010, 2011])
+    res = FakeWorkbookExtractor(ds, workers=workers).extract(year=[2010, 2011])
+    for page in ("books", "boxes"):
+        pd.testing.assert_frame_equal(res[page], expected[page])
+    assert sorted(r["year"] for r in ds.requests) == [2010, 2011]
+    FakeWorkbookExtractor(ds).extract(year=[2010])
+    assert sorted(r["year"] for r in ds.requests) == [2010, 2011]
+    excel.WORKBOOK_CACHE.clear()
+
+
+def test_cols_added_per_page():
+    """Each page is validated against only the columns added to it."""
+    excel.WORKBOOK_CACHE.clear()
+    extractor = FakeWorkbookExtractor(FakeDatastore(), workers=2)
+    validated = []
+    validate = extractor.validate
+
+    def record_cols_added(df, page, **partition):
+        validated.append(list(extractor.cols_added))
+        return validate(df, page, **partition)
+
+    with mock.patch.object(extractor, "validate", side_effect=record_cols_added):
+        extractor.extract(year=[2010, 2011])
+    assert validated == [["data_maturity"]] * 4
+    excel.WORKBOOK_CACHE.clear()
+
+
+def test_extract_parses_each_sheet_once():
+    """Pages which are read from the same sheet share one parsed copy of it."""
+    excel.WORKBOOK_CACHE.clear()
+    extractor = FakeWorkbookExtractor(FakeDatastore())
+    extractor.METADATA.get_sheet_name = lambda page, **partition: 0
+    with mock.patch.object(excel.pd, "read_excel", wraps=pd.read_excel) as read_excel:
+        res = extractor.extract(year=[2010])
+    assert read_excel.call_count == 1
+    assert res["books"].title.tolist() == ["Tao Te Ching"]
+    # Renaming the columns of the books didn't rename those of the boxes.
+    assert res["boxes"].dropna(axis="columns").columns.tolist() == [
+        "book_title",
+        "data_maturity",
+        "name",
+        "pages",
+    ]
+    excel.WORKBOOK_CACHE.clear()
@@ -0,0 +1,78 @@
+"""Unit tests for the FERC-714 CSV extractor."""
+
+import io
+import zipfile
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+from dagster import build_asset_context
+
+from pudl.extract.ferc714 import (
+    FERC714_FILES,
+    generate_raw_ferc714_asset,
+    read_ferc714_csv,
+)
+from pudl.settings import DatasetsSettings, Ferc714Settings
+
+HOURLY_DEMAND_CSV = b"""respondent_id,report_yr,plan_date,spplmnt_num,row_num,timezone,hour01,hour01_f,hour02
+101,2019,01/01/2019,1,1,CST,10.5,,11
+101,2020,01/01/2020,1,1,CST,,x,12
+102,2020,01/01/2020,1,2,EST,13.0,,14
+102,2021,01/01/2021,1,3,EST,15.5,,16
+"""
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 100])
+@pytest.mark.parametrize("years", [None, [2020], [2019, 2021], [2022]])
+def test_read_ferc714_csv(chunksize, years):
+    """Only the used columns of the requested years are read, however it's chunked."""
+    expected = pd.read_csv(io.BytesIO(HOURLY_DEMAND_CSV)).drop(
+        columns=["spplmnt_num", "row_num", "hour01_f"]
+    )
+    if years is not None:
+        expected = expected[expected.report_yr.isin(years)]
+    df, rows_scanned = read_ferc714_csv(
+        io.BytesIO(HOURLY_DEMAND_CSV), "utf-8", years=years, chunksize=chunksize
+    )
+    assert rows_scanned == 4
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    # The types don't depend on the values in each chunk, or whether any are kept
+    assert df.dtypes.to_dict() == {
+        "respondent_id": "Int64",
+        "report_yr": "Int64",
+        "plan_date": "object",
+        "timezone": "object",
+        "hour01": "float64",
+        "hour02": "float64",
+    }
+
+
+class FakeDatastore:
+    """Datastore which serves a FERC-714 archive with only hourly demand in it."""
+
+    @contextmanager
+    def get_zipfile_resource(self, dataset, **filters):
+        """Opens the fake archive."""
+        bio = io.BytesIO()
+        with zipfile.ZipFile(bio, "w") as zf:
+            zf.writestr(
+                FERC714_FILES["hourly_planning_area_demand"]["name"], HOURLY_DEMAND_CSV
+            )
+        with zipfile.ZipFile(bio) as zf:
+            yield zf
+
+
+def test_raw_ferc714_asset_reports_rows_kept():
+    """The asset keeps the configured years and reports how many rows it scanned."""
+    asset = generate_raw_ferc714_asset("hourly_planning_area_demand")
+    context = build_asset_context(
+        resources={
+            "datastore": FakeDatastore(),
+            "dataset_settings": DatasetsSettings(ferc714=Ferc714Settings(years=[2020])),
+        }
+    )
+    output = asset(context)
+    assert output.value.respondent_id.tolist() == [101, 102]
+    assert output.metadata["rows_scanned"].value == 4
+    assert output.metadata["rows_kept"].value == 2
@@ -1,9 +1,20 @@
 """Tests for xbrl extraction module."""
 
+import io
+import json
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
 import pytest
 from dagster import ResourceDefinition, build_op_context
 
-from pudl.extract.xbrl import FercXbrlDatastore, convert_form, xbrl2sqlite_op_factory
+from pudl.extract.xbrl import (
+    FercXbrlDatastore,
+    convert_form,
+    merge_sqlite_dbs,
+    xbrl2sqlite_op_factory,
+)
 from pudl.ferc_to_sqlite import ferc_to_sqlite
 from pudl.resources import RuntimeSettings
 from pudl.settings import (
@@ -43,20 +54,31 @@ def test_ferc_xbrl_datastore_get_taxonomy(mocker):
 
 def test_ferc_xbrl_datastore_get_filings(mocker):
     datastore_mock = mocker.MagicMock()
-    datastore_mock.get_unique_resource = mocker.MagicMock(
-        return_value=b"Just some bogus bytes"
+    datastore_mock.get_unique_resource_file = mocker.MagicMock(
+        return_value=io.BytesIO(b"Just some bogus bytes")
     )
 
     # Call method
     ferc_datastore = FercXbrlDatastore(datastore_mock)
     ferc_datastore.get_filings(2021, XbrlFormNumber.FORM1)
 
-    # Check that get_unique_resource was called correctly
-    datastore_mock.get_unique_resource.assert_called_with(
+    # Check that get_unique_resource_file was called correctly
+    datastore_mock.get_unique_resource_file.assert_called_with(
         "ferc1", year=2021, data_format="xbrl"
     )
 
 
+def test_ferc_xbrl_datastore_get_filings_from_local_cache(mocker, tmp_path):
+    """Locally cached filings archives are passed on by path, not read into memory."""
+    archive_path = tmp_path / "ferc1-xbrl-2021.zip"
+    archive_path.write_bytes(b"Just some bogus bytes")
+    datastore_mock = mocker.MagicMock()
+    datastore_mock.get_unique_resource_file.return_value = archive_path
+
+    ferc_datastore = FercXbrlDatastore(datastore_mock)
+    assert ferc_datastore.get_filings(2021, XbrlFormNumber.FORM1) == archive_path
+
+
 @pytest.mark.parametrize(
     "settings,forms",
     [
@@ -132,6 +154,7 @@ def test_xbrl2sqlite(settings, forms, mocker, tmp_path):
             sql_path=PudlPaths().output_dir / f"ferc{form.value}_xbrl.sqlite",
             batch_size=20,
             workers=10,
+            year_workers=1,
         )
 
 
@@ -257,3 +280,80 @@ def test_convert_form(mocker):
             )
         assert extractor_mock.mock_calls == expected_calls
         extractor_mock.reset_mock()
+
+
+def fake_run_main(
+    instance_path, sql_path, metadata_path, datapackage_path, **kwargs
+) -> None:
+    """Stand in for the XBRL extractor, which writes one row per year."""
+    year = int(instance_path.split("_")[1])
+    pd.DataFrame({"year": [year], "value": [year * 10]}).to_sql(
+        "filings", f"sqlite:///{sql_path}", if_exists="append"
+    )
+    Path(metadata_path).write_text(json.dumps({"year": year}))
+    Path(datapackage_path).write_text(
+        json.dumps({"resources": [{"name": "filings", "path": f"{sql_path}"}]})
+    )
+
+
+def test_convert_form_concurrent_years(mocker, tmp_path):
+    """Years converted concurrently are merged in order, as if done one by one."""
+    mocker.patch("pudl.extract.xbrl.run_main", new=fake_run_main)
+    years_converted = {}
+
+    class FakeDatastore:
+        def get_taxonomy(self, year, form: XbrlFormNumber):
+            return f"taxonomy_{year}", f"entry_point_{year}"
+
+        def get_filings(self, year, form: XbrlFormNumber):
+            years_converted[year] = len(list(tmp_path.rglob("*.datapackage.json")))
+            return f"filings_{year}"
+
+    sql_path = tmp_path / "ferc1_xbrl.sqlite"
+    convert_form(
+        FercGenericXbrlToSqliteSettings(
+            taxonomy="https://www.fake.taxonomy.url", years=[2021, 2022, 2023]
+        ),
+        XbrlFormNumber.FORM1,
+        FakeDatastore(),
+        output_path=tmp_path,
+        sql_path=sql_path,
+        year_workers=2,
+    )
+
+    with sqlite3.connect(sql_path) as conn:
+        assert conn.execute("SELECT year, value FROM filings").fetchall() == [
+            (2021, 20210),
+            (2022, 20220),
+            (2023, 20230),
+        ]
+        # The index created by to_sql is carried over to the merged database.
+        assert conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        ).fetchall() == [("ix_filings_index",)]
+    # The last year's filings aren't fetched until one of the first two is converted.
+    assert years_converted[2023] >= 1
+    metadata = json.loads((tmp_path / "ferc1_xbrl_taxonomy_metadata.json").read_text())
+    assert metadata == {"year": 2023}
+    datapackage = json.loads((tmp_path / "ferc1_xbrl_datapackage.json").read_text())
+    assert datapackage["resources"][0]["path"] == f"sqlite:///{sql_path}"
+    # Only the final outputs are left behind.
+    assert {p.name for p in tmp_path.iterdir()} == {
+        "ferc1_xbrl.sqlite",
+        "ferc1_xbrl_taxonomy_metadata.json",
+        "ferc1_xbrl_datapackage.json",
+    }
+
+
+def test_merge_sqlite_dbs_appends_to_existing_tables(tmp_path):
+    sql_path = tmp_path / "out.sqlite"
+    staging = [tmp_path / "a.sqlite", tmp_path / "b.sqlite"]
+    pd.DataFrame({"x": [1]}).to_sql("t", f"sqlite:///{sql_path}", index=False)
+    pd.DataFrame({"x": [2]}).to_sql("t", f"sqlite:///{staging[0]}", index=False)
+    pd.DataFrame({"x": [3], "y": ["a"]}).to_sql(
+        "u", f"sqlite:///{staging[1]}", index=False
+    )
+    merge_sqlite_dbs(sql_path, [*staging, tmp_path / "missing.sqlite"])
+    with sqlite3.connect(sql_path) as conn:
+        assert conn.execute("SELECT x FROM t").fetchall() == [(1,), (2,)]
+        assert conn.execute("SELECT x, y FROM u").fetchall() == [(3, "a")]
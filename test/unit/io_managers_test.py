@@ -20,10 +20,12 @@ from pudl.etl.check_foreign_keys import (
 )
 from pudl.io_managers import (
     FercXBRLSQLiteIOManager,
+    PudlParquetIOManager,
     PudlSQLiteIOManager,
     SQLiteIOManager,
 )
 from pudl.metadata.classes import Package, Resource
+from pudl.workspace.setup import PudlPaths
 
 
 @pytest.fixture
@@ -619,3 +621,196 @@ def test_report_year_fixing_duration():
 def test_report_year_fixing_bad_values(df, match):
     with pytest.raises(ValueError, match=match):
         FercXBRLSQLiteIOManager.refine_report_year(df, xbrl_years=[2021, 2022])
+
+
+def test_bulk_load_matches_to_sql(tmp_path):
+    """The bulk loader should store exactly the same values as DataFrame.to_sql."""
+    fields = [
+        {"name": "id", "type": "integer", "description": "id"},
+        {"name": "flag", "type": "boolean", "description": "flag"},
+        {"name": "amount", "type": "number", "description": "amount"},
+        {"name": "label", "type": "string", "description": "label"},
+        {
+            "name": "kind",
+            "type": "string",
+            "constraints": {"enum": ["a", "b"]},
+            "description": "kind",
+        },
+        {"name": "day", "type": "date", "description": "day"},
+        {"name": "moment", "type": "datetime", "description": "moment"},
+    ]
+    res = Resource(
+        name="things",
+        schema={"fields": fields, "primary_key": ["id"]},
+        description="Things",
+    )
+    md = Package(name="stuff", resources=[res]).to_sql()
+    sa_table = md.tables["things"]
+    sa.Index("ix_things_label", sa_table.c.label)
+    df = res.enforce_schema(
+        pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "flag": [True, False, pd.NA],
+                "amount": [1.5, float("nan"), 3.0],
+                "label": ["x", pd.NA, "z"],
+                "kind": ["a", "b", pd.NA],
+                "day": pd.to_datetime(["2020-01-01", "2021-06-30", pd.NaT]),
+                "moment": pd.to_datetime(
+                    ["2020-01-01 01:00", pd.NaT, "2022-12-31 00:00"]
+                ),
+            }
+        )
+    )
+
+    manager = SQLiteIOManager(base_dir=tmp_path, db_name="bulk", md=md)
+    manager.handle_output(build_output_context(asset_key=AssetKey("things")), df)
+
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'to_sql.sqlite'}")
+    md.create_all(engine)
+    with engine.begin() as con:
+        df.to_sql(
+            "things",
+            con,
+            if_exists="append",
+            index=False,
+            dtype={c.name: c.type for c in sa_table.columns},
+        )
+
+    query = "SELECT * FROM things ORDER BY id"
+    with engine.connect() as con:
+        expected = con.exec_driver_sql(query).fetchall()
+    with manager.engine.connect() as con:
+        observed = con.exec_driver_sql(query).fetchall()
+        indexes = con.exec_driver_sql("PRAGMA index_list(things)").fetchall()
+        synchronous = con.exec_driver_sql("PRAGMA synchronous").scalar()
+    assert observed == expected
+    # The deferred index is recreated, and the load PRAGMAs are reset afterwards.
+    assert "ix_things_label" in {index[1] for index in indexes}
+    assert synchronous != 0
+
+
+def test_parquet_io_manager_input_selection():
+    """Inputs get the columns and rows they ask for, with PUDL dtypes."""
+    table_name = "core_eia__codes_energy_sources"
+    res = Resource.from_id(table_name)
+    expected = res.enforce_schema(res.encoder.df)
+    manager = PudlParquetIOManager()
+    manager.handle_output(
+        build_output_context(asset_key=AssetKey(table_name)), expected
+    )
+
+    full = manager.load_input(build_input_context(asset_key=AssetKey(table_name)))
+    pd.testing.assert_frame_equal(full, expected)
+
+    columns = ["code", "fuel_type_code_pudl", "max_fuel_mmbtu_per_unit"]
+    filters = [("fuel_type_code_pudl", "in", ["coal", "oil"])]
+    input_context = build_input_context(
+        asset_key=AssetKey(table_name),
+        metadata={"columns": columns, "filters": filters},
+    )
+    selected = manager.load_input(input_context)
+    pd.testing.assert_frame_equal(
+        selected,
+        expected.loc[
+            expected.fuel_type_code_pudl.isin(["coal", "oil"]), columns
+        ].reset_index(drop=True),
+    )
+
+    input_context = build_input_context(
+        asset_key=AssetKey(table_name),
+        metadata={"columns": columns, "dtype_backend": "pyarrow"},
+    )
+    arrow_backed = manager.load_input(input_context)
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in arrow_backed.dtypes)
+    assert len(arrow_backed) == len(expected)
+
+
+def test_pudl_sqlite_io_manager_input_selection(fake_pudl_sqlite_io_manager_fixture):
+    """The SQLite IO manager honors the same input selection as the Parquet one."""
+    artist = pd.DataFrame({"artistid": [1, 2, 3], "artistname": ["A", "B", "C"]})
+    output_context = build_output_context(asset_key=AssetKey("artist"))
+    fake_pudl_sqlite_io_manager_fixture.handle_output(output_context, artist)
+
+    input_context = build_input_context(
+        asset_key=AssetKey("artist"),
+        metadata={"columns": ["artistname"], "filters": [("artistid", ">", 1)]},
+    )
+    selected = fake_pudl_sqlite_io_manager_fixture.load_input(input_context)
+    assert selected.artistname.tolist() == ["B", "C"]
+    assert selected.columns.tolist() == ["artistname"]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [("fuel_phase", "not in", ["gas"])],
+        [("fuel_units", "!=", "mcf")],
+        [("max_fuel_mmbtu_per_unit", "!=", 1.0)],
+        [[("fuel_phase", "==", "gas")], [("fuel_units", "not in", ["mcf"])]],
+    ],
+)
+def test_sqlite_and_parquet_filter_nulls_alike(tmp_path, filters):
+    """Filters on columns with nulls select the same rows from SQLite and Parquet."""
+    table_name = "core_eia__codes_energy_sources"
+    res = Resource.from_id(table_name)
+    df = res.enforce_schema(res.encoder.df)
+    package = Package(name="codes", resources=[res])
+    package.to_sql().create_all(
+        sa.create_engine(f"sqlite:///{tmp_path / 'codes.sqlite'}")
+    )
+    sqlite_manager = PudlSQLiteIOManager(
+        base_dir=tmp_path, db_name="codes", package=package
+    )
+    parquet_manager = PudlParquetIOManager()
+    for manager in (sqlite_manager, parquet_manager):
+        manager.handle_output(build_output_context(asset_key=AssetKey(table_name)), df)
+
+    input_context = build_input_context(
+        asset_key=AssetKey(table_name), metadata={"filters": filters}
+    )
+    from_sqlite = sqlite_manager.load_input(input_context)
+    from_parquet = parquet_manager.load_input(input_context)
+    assert 0 < len(from_parquet) < len(df)
+    pd.testing.assert_frame_equal(from_sqlite, from_parquet, check_categorical=False)
+
+
+def test_parquet_io_manager_enforces_selected_columns(mocker, tmp_path):
+    """Selected columns of files with another schema still get the PUDL schema."""
+    table_name = "core_eia__codes_energy_sources"
+    res = Resource.from_id(table_name)
+    expected = res.enforce_schema(res.encoder.df)
+    parquet_path = tmp_path / f"{table_name}.parquet"
+    # Written by pandas, without the PUDL schema
+    expected.astype(
+        {"max_fuel_mmbtu_per_unit": "float32", "fuel_type_code_pudl": str}
+    ).to_parquet(parquet_path)
+    mocker.patch.object(PudlPaths, "parquet_path", return_value=parquet_path)
+    enforce_schema = mocker.spy(Resource, "enforce_schema")
+
+    columns = ["max_fuel_mmbtu_per_unit", "fuel_type_code_pudl"]
+    input_context = build_input_context(
+        asset_key=AssetKey(table_name), metadata={"columns": columns}
+    )
+    selected = PudlParquetIOManager().load_input(input_context)
+    assert enforce_schema.call_count == 1
+    assert selected.dtypes.to_dict() == {
+        col: res.get_field(col).to_pandas_dtype() for col in columns
+    }
+    pd.testing.assert_frame_equal(
+        selected,
+        expected.loc[:, columns],
+        check_exact=False,
+        check_categorical=False,
+        rtol=1e-6,
+    )
+
+    columns = ["code", "fuel_type_code_pudl"]
+    input_context = build_input_context(
+        asset_key=AssetKey(table_name), metadata={"columns": columns}
+    )
+    pd.testing.assert_frame_equal(
+        PudlParquetIOManager().load_input(input_context),
+        expected.loc[:, columns],
+        check_categorical=False,
+    )
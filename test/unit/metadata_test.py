@@ -2,17 +2,20 @@
 
 import pandas as pd
 import pandera as pr
+import pyarrow as pa
 import pytest
 
+from pudl.metadata import registry
 from pudl.metadata.classes import (
     DataSource,
+    Encoder,
     Field,
     Package,
     PudlResourceDescriptor,
     Resource,
 )
 from pudl.metadata.fields import FIELD_METADATA, apply_pudl_dtypes
-from pudl.metadata.helpers import format_errors
+from pudl.metadata.helpers import format_errors, has_duplicate_rows
 from pudl.metadata.resources import RESOURCE_METADATA
 from pudl.metadata.sources import SOURCES
 
@@ -59,6 +62,112 @@ def test_pyarrow_schemas(resource_name: str):
     _ = PUDL_RESOURCES[resource_name].to_pyarrow()
 
 
+def test_metadata_registry() -> None:
+    """The registry caches each resource and the schemas derived from it."""
+    resource_id = "core_eia923__monthly_generation_fuel"
+    registry.preload([resource_id])
+    resource = registry.get_resource(resource_id)
+    assert registry.get_resource(resource_id) is resource
+    # Resources built from their ID are private copies
+    fresh = Resource.from_id(resource_id)
+    assert fresh is not resource
+    assert Resource.from_id(resource_id) is not fresh
+    fresh.description = "Modified"
+    assert registry.get_resource(resource_id).description != "Modified"
+    assert registry.get_pyarrow_schema(resource_id) is registry.get_pyarrow_schema(
+        resource_id
+    )
+    assert registry.get_pyarrow_schema(resource_id).equals(resource.to_pyarrow())
+    assert registry.get_sql_table(resource_id).name == resource_id
+    assert registry.get_pandas_dtypes(resource_id) == resource.to_pandas_dtypes()
+    with pytest.raises(TypeError):
+        registry.get_pandas_dtypes(resource_id)["plant_id_eia"] = "string"
+
+
+ENCODER = Encoder(
+    df=pd.DataFrame({"code": ["ST", "GT"], "description": ["Steam", "Gas"]}),
+    code_fixes={"st": "ST", "CT": "GT"},
+    ignored_codes=["XX"],
+)
+CODES = ["ST", "st", None, "CT", "XX", "GT", "ST"]
+ENCODED = ["ST", "ST", pd.NA, "GT", pd.NA, "GT", "ST"]
+
+
+@pytest.mark.parametrize("dtype", [object, "string", "category"])
+def test_encoder_encode(dtype) -> None:
+    """Codes are standardized the same way whatever type the column is."""
+    col = pd.Series(CODES, index=range(10, 17), name="prime_mover_code", dtype=dtype)
+    pd.testing.assert_series_equal(
+        ENCODER.encode(col, dtype="string"),
+        pd.Series(ENCODED, index=col.index, name=col.name, dtype="string"),
+    )
+    # The codes are looked up in the same compiled map every time.
+    assert ENCODER.code_map is ENCODER.code_map
+    with pytest.raises(ValueError, match="unknown_codes={'XY'}"):
+        ENCODER.encode(pd.concat([col, pd.Series(["XY"], dtype=dtype)]))
+
+
+def test_encoder_encode_arrow() -> None:
+    """Arrow arrays are standardized by recoding their dictionaries."""
+    expected = pd.Series(ENCODED, dtype="string")
+    for array in [
+        pa.array(CODES),
+        pa.array(CODES).dictionary_encode(),
+        pa.chunked_array([CODES[:3], CODES[3:]]),
+    ]:
+        encoded = ENCODER.encode_arrow(array, name="prime_mover_code")
+        assert encoded.type == pa.dictionary(pa.int32(), pa.string())
+        pd.testing.assert_series_equal(
+            encoded.to_pandas().astype("string"), expected, check_names=False
+        )
+    # Unknown codes are only a problem if they're actually used.
+    unused = pa.DictionaryArray.from_arrays(
+        pa.array([0, 1, None], pa.int8()), pa.array(["st", "CT", "XY"])
+    )
+    assert ENCODER.encode_arrow(unused).to_pylist() == ["ST", "GT", None]
+    with pytest.raises(ValueError, match="unknown_codes={'XY'}"):
+        ENCODER.encode_arrow(pa.array(["ST", "XY"]), name="prime_mover_code")
+
+
+def test_enforce_schema_fast_path(mocker) -> None:
+    """Columns which already conform to the schema aren't converted again."""
+    resource = Resource.from_id("core_eia__codes_prime_movers")
+    raw = pd.DataFrame(
+        {
+            "code": ["ST", "GT"],
+            "label": ["steam", "gas"],
+            "description": ["Steam turbine", "Gas turbine"],
+        }
+    )
+    formatted = resource.enforce_schema(raw)
+    assert formatted is not raw
+    assert formatted.dtypes.to_dict() == resource.to_pandas_dtypes()
+    astype = mocker.spy(pd.DataFrame, "astype")
+    again = resource.enforce_schema(formatted)
+    astype.assert_not_called()
+    pd.testing.assert_frame_equal(again, formatted)
+    # The result never shares its data with the input.
+    again.loc[0, "code"] = "CT"
+    assert formatted.loc[0, "code"] == "ST"
+    with pytest.raises(ValueError, match="Duplicate primary keys"):
+        resource.enforce_schema(pd.concat([formatted, formatted.iloc[:1]]))
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]}),
+        pd.DataFrame({"a": [1, 2, 1], "b": ["x", "y", "x"]}),
+        pd.DataFrame({"a": [1.0, None, None], "b": pd.array([None, "y", None])}),
+        pd.DataFrame({"a": [1.0, None, None], "b": pd.array(["x", "y", None])}),
+        pd.DataFrame({"a": pd.Series([], dtype="Int64")}),
+    ],
+)
+def test_has_duplicate_rows(df: pd.DataFrame) -> None:
+    """Duplicated rows are found just like pandas finds them."""
+    assert has_duplicate_rows(df) == df.duplicated().any()
+
+
 @pytest.mark.parametrize("field_name", sorted(FIELD_METADATA.keys()))
 def test_field_definitions(field_name: str):
     """Check that all defined fields are valid."""
@@ -2,9 +2,16 @@
 
 import logging
 
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pytest
+from upath import UPath
 
-from pudl.output.epacems import year_state_filter
+from pudl.etl.epacems_assets import write_state_partitions
+from pudl.io_managers import EpaCemsIOManager
+from pudl.output.epacems import epacems, epacems_row_groups, year_state_filter
 
 logger = logging.getLogger(__name__)
 
@@ -23,3 +30,93 @@ def test_year_state_filter(years, states, expected_filter):
     assert (  # nosec: B101
         year_state_filter(years=years, states=states) == expected_filter
     )
+
+
+@pytest.fixture
+def epacems_dataset(tmp_path, fake_epacems_quarter):
+    """A small hive-partitioned EPA CEMS dataset with two years and three states."""
+    for year in (2020, 2021):
+        table = fake_epacems_quarter(year, 1, ["CO", "ID", "TX"], seed=year)
+        write_state_partitions(table, tmp_path, year, f"{year}q1", row_group_size=48)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "kwargs,num_row_groups",
+    [
+        ({}, 12),
+        ({"years": [2020]}, 6),
+        ({"years": [2020], "states": ["co"]}, 2),
+        ({"plant_ids": [1, 5]}, 4),
+        ({"years": [2021], "states": ["TX"], "plant_ids": [1]}, 0),
+    ],
+)
+def test_epacems_reader(epacems_dataset, kwargs, num_row_groups):
+    """Only the matching partitions and row groups should be read."""
+    row_groups = epacems_row_groups(epacems_path=epacems_dataset, **kwargs)
+    assert len(list(row_groups.get_fragments())) == num_row_groups
+
+    everything = epacems(epacems_path=epacems_dataset, output="pandas")
+    mask = pd.Series(True, index=everything.index)
+    if "years" in kwargs:
+        mask &= everything.year.isin(kwargs["years"])
+    if "states" in kwargs:
+        mask &= everything.state.isin([s.upper() for s in kwargs["states"]])
+    if "plant_ids" in kwargs:
+        mask &= everything.plant_id_eia.isin(kwargs["plant_ids"])
+    expected = everything[mask].reset_index(drop=True)
+
+    columns = ["plant_id_eia", "year", "state", "gross_load_mw"]
+    arrow = epacems(epacems_path=epacems_dataset, output="arrow", **kwargs)
+    assert isinstance(arrow, pa.Table)
+    assert arrow.num_rows == len(expected)
+
+    lazy = epacems(
+        epacems_path=epacems_dataset, columns=columns, output="dask", **kwargs
+    )
+    assert isinstance(lazy, dd.DataFrame)
+    pd.testing.assert_frame_equal(
+        lazy.compute().reset_index(drop=True),
+        expected[columns],
+        check_categorical=False,
+    )
+
+
+def test_epacems_row_groups_plant_ids(tmp_path, fake_epacems_quarter):
+    """Row groups are sorted and skipped by ``plant_id_eia``, not ``plant_id_epa``."""
+    table = fake_epacems_quarter(2020, 1, ["CO", "CO"], seed=1)
+    # EPA plants 2 and 3 are EIA plants 3 and 2
+    plant_id_eia = np.array([0, 1, 3, 2, 4])[table["plant_id_epa"].to_numpy()]
+    table = table.set_column(
+        table.schema.get_field_index("plant_id_eia"),
+        "plant_id_eia",
+        pa.array(plant_id_eia, type=pa.int32()),
+    )
+    # Two plants of 48 hours in each row group
+    write_state_partitions(table, tmp_path, 2020, "2020q1", row_group_size=96)
+
+    assert len(list(epacems_row_groups(epacems_path=tmp_path).get_fragments())) == 2
+    row_groups = epacems_row_groups(plant_ids=[2], epacems_path=tmp_path)
+    assert len(list(row_groups.get_fragments())) == 1
+    df = epacems(plant_ids=[2], epacems_path=tmp_path, output="pandas")
+    assert len(df) == 48
+    assert set(df.plant_id_epa) == {3}
+
+
+def test_epacems_io_manager(epacems_dataset, epacems_resource):
+    """The partitioned dataset can be loaded through the EPA CEMS IO manager."""
+    manager = EpaCemsIOManager(
+        base_path=UPath(epacems_dataset), schema=epacems_resource.to_pyarrow()
+    )
+    loaded = manager.load_from_path(context=None, path=UPath(epacems_dataset))
+    assert isinstance(loaded, dd.DataFrame)
+    pd.testing.assert_frame_equal(
+        loaded[["plant_id_eia", "year", "state"]].compute().reset_index(drop=True),
+        epacems(
+            epacems_path=epacems_dataset,
+            columns=["plant_id_eia", "year", "state"],
+            output="pandas",
+        ),
+        check_dtype=False,
+        check_categorical=False,
+    )
@@ -16,6 +16,7 @@ from pudl.settings import (
     Eia923Settings,
     EiaSettings,
     EpaCemsSettings,
+    EtlSettings,
     Ferc1DbfToSqliteSettings,
     Ferc1Settings,
     GenericDatasetSettings,
@@ -295,6 +296,33 @@ def test_partitions_with_json_normalize(pudl_etl_settings):
         )
 
 
+def test_get_datastore_partitions():
+    """ETL settings should select the corresponding raw datastore partitions."""
+    settings = EtlSettings(
+        ferc_to_sqlite_settings={
+            "ferc1_dbf_to_sqlite_settings": {"years": [2019, 2020]},
+            "ferc1_xbrl_to_sqlite_settings": {"years": [2021]},
+            "ferc2_dbf_to_sqlite_settings": {"years": [2020], "disabled": True},
+        },
+        datasets={
+            "ferc1": {"years": [2020, 2021]},
+            "eia": EiaSettings(
+                eia923=Eia923Settings(years=[2020]),
+                eia860m=Eia860mSettings(year_months=["2023-11"]),
+            ),
+            "epacems": {"year_quarters": ["2022q1"]},
+        },
+    )
+    partitions = settings.get_datastore_partitions()
+    assert partitions["ferc1"] == [{"year": 2020}, {"year": 2021}, {"year": 2019}]
+    assert partitions["eia923"] == [{"year": 2020}]
+    assert partitions["eia860"] == [{"year": 2020}]
+    assert partitions["eia860m"] == [{"year_month": "2023-11"}]
+    assert partitions["epacems"] == [{"year_quarter": "2022q1"}]
+    assert "ferc2" not in partitions
+    assert "glue" not in partitions
+
+
 @pytest.mark.slow
 def test_partitions_for_datasource_table(pudl_etl_settings):
     """Test whether or not we can make the datasource table."""
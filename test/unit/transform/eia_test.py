@@ -0,0 +1,125 @@
+"""Unit tests for the pudl.transform.eia module."""
+
+import hypothesis
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.transform.eia import consistent_values, occurrence_consistency
+
+ID_COLS = ["plant_id_eia", "generator_id"]
+COLS = ["city", "capacity_mw", "sector_id_eia"]
+
+
+def harvest_one_column(
+    compiled_df: pd.DataFrame, col: str, cols_to_consit: list[str], strictness: float
+) -> tuple[pd.Series, int, int]:
+    """Harvests a single column the way harvest_entity_tables does without the engine.
+
+    Returns:
+        The consistent value of the column for each unique combination of
+        ``cols_to_consit``, the number of those with any value, and the number of
+        those with a consistent value.
+    """
+    col_df = occurrence_consistency(
+        ID_COLS, compiled_df, col, cols_to_consit, strictness=strictness
+    )
+    correct = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+        subset=(cols_to_consit + [f"{col}_is_consistent"])
+    )
+    if correct.empty:
+        correct = pd.DataFrame(columns=col_df.columns)
+    total = len(col_df.drop_duplicates(subset=cols_to_consit))
+    keys = pd.MultiIndex.from_frame(compiled_df[cols_to_consit].drop_duplicates())
+    values = correct.set_index(cols_to_consit)[col].reindex(keys.dropna())
+    return values, total, len(correct)
+
+
+compiled_dfs = hypothesis.strategies.integers(0, 60).flatmap(
+    lambda n: hypothesis.strategies.fixed_dictionaries(
+        {
+            "plant_id_eia": hypothesis.strategies.lists(
+                hypothesis.strategies.sampled_from([1, 2, 3, None]),
+                min_size=n,
+                max_size=n,
+            ),
+            "generator_id": hypothesis.strategies.lists(
+                hypothesis.strategies.sampled_from(["a", "b"]), min_size=n, max_size=n
+            ),
+            "report_date": hypothesis.strategies.lists(
+                hypothesis.strategies.sampled_from(
+                    ["2020-01-01", "2021-01-01", "2022-01-01", None]
+                ),
+                min_size=n,
+                max_size=n,
+            ),
+            "city": hypothesis.strategies.lists(
+                hypothesis.strategies.sampled_from(["x", "y", "nan", None]),
+                min_size=n,
+                max_size=n,
+            ),
+            "capacity_mw": hypothesis.strategies.lists(
+                hypothesis.strategies.sampled_from([1.5, 2.0, np.nan]),
+                min_size=n,
+                max_size=n,
+            ),
+            "sector_id_eia": hypothesis.strategies.lists(
+                hypothesis.strategies.sampled_from([1, 2, 3, None]),
+                min_size=n,
+                max_size=n,
+            ),
+        }
+    )
+)
+
+
+@hypothesis.settings(deadline=None)
+@hypothesis.given(
+    compiled_dfs,
+    hypothesis.strategies.booleans(),
+    hypothesis.strategies.sampled_from([0.5, 0.7, 0.9]),
+)
+def test_consistent_values_parity(data, annual, strictness):
+    """All columns are harvested at once exactly like they are one at a time."""
+    compiled_df = pd.DataFrame(data).astype(
+        {
+            "plant_id_eia": "Int64",
+            "generator_id": "string",
+            "report_date": "datetime64[s]",
+            "city": "string",
+            "capacity_mw": "float64",
+            "sector_id_eia": "Int64",
+        }
+    )
+    cols_to_consit = ID_COLS + ["report_date"] if annual else ID_COLS
+    values_df, stats = consistent_values(
+        compiled_df, ID_COLS, COLS, cols_to_consit, dict.fromkeys(COLS, strictness)
+    )
+    assert not values_df.duplicated(cols_to_consit).any()
+    values_df = values_df.set_index(cols_to_consit)
+    for col in COLS:
+        expected, total, consistent = harvest_one_column(
+            compiled_df, col, cols_to_consit, strictness
+        )
+        assert stats.loc[col, "total"] == total
+        assert stats.loc[col, "consistent"] == consistent
+        pd.testing.assert_series_equal(
+            values_df[col].reindex(expected.index),
+            expected,
+            check_dtype=False,
+            check_index_type=False,
+        )
+
+
+def test_consistent_values_requires_unique_answers():
+    """A strictness below 0.5 could make several values consistent."""
+    compiled_df = pd.DataFrame(
+        {
+            "plant_id_eia": [1],
+            "generator_id": ["a"],
+            "report_date": pd.to_datetime(["2020-01-01"]),
+            "city": ["x"],
+        }
+    )
+    with pytest.raises(ValueError):
+        consistent_values(compiled_df, ID_COLS, ["city"], ID_COLS, {"city": 0.4})
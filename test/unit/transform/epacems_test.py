@@ -1,6 +1,7 @@
 """Unit tests for the pudl.transform.epacems module."""
 
 import pandas as pd
+import pytest
 
 import pudl.transform.epacems as epacems
 
@@ -38,3 +39,17 @@ def test_harmonize_eia_epa_orispl():
     )
     actual_df = epacems.harmonize_eia_epa_orispl(cems_test_df, crosswalk_test_df)
     pd.testing.assert_frame_equal(expected_df, actual_df, check_dtype=False)
+
+
+def test_harmonize_eia_epa_orispl_one_to_many():
+    """A crosswalk mapping one EPA unit to several EIA plants should be rejected."""
+    cems_test_df = pd.DataFrame({"plant_id_epa": [3], "emissions_unit_id_epa": ["1"]})
+    crosswalk_test_df = pd.DataFrame(
+        {
+            "plant_id_epa": [3, 3, 10],
+            "plant_id_eia": [3, 4, 10],
+            "emissions_unit_id_epa": ["1", "1", "2"],
+        }
+    )
+    with pytest.raises(AssertionError, match="more than one plant_id_eia"):
+        epacems.harmonize_eia_epa_orispl(cems_test_df, crosswalk_test_df)
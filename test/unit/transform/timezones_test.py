@@ -0,0 +1,97 @@
+"""Unit tests for the pudl.transform.timezones module."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from pudl.transform import eia, timezones
+from pudl.transform.eia import find_timezone
+
+PLANTS = pd.DataFrame(
+    {
+        "longitude": [-122.42, -73.94, -97.74, np.nan, -500.0, -73.94, -155.5],
+        "latitude": [37.77, 40.67, 30.27, 40.0, 40.0, 40.67, 19.6],
+        "state": ["CA", "NY", "TX", "CO", "AZ", None, "HI"],
+    },
+    index=[10, 11, 12, 13, 14, 15, 16],
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_timezone_cache(mocker):
+    """Start every test without any timezones cached in memory."""
+    mocker.patch.object(timezones, "_TIMEZONE_CACHE", {})
+
+
+def test_find_timezones_parity():
+    """The timezones are the same as those found one location at a time."""
+    expected = pd.Series(
+        [
+            find_timezone(lng=p.longitude, lat=p.latitude, state=p.state, strict=False)
+            for p in PLANTS.itertuples()
+        ],
+        index=PLANTS.index,
+        dtype="string",
+    )
+    actual = timezones.find_timezones(
+        PLANTS.longitude, PLANTS.latitude, PLANTS.state, strict=False
+    )
+    pd.testing.assert_series_equal(actual, expected)
+    assert actual.tolist()[:3] == [
+        "America/Los_Angeles",
+        "America/New_York",
+        "America/Chicago",
+    ]
+
+
+def test_find_timezones_strict():
+    """Locations without valid coordinates are errors when being strict."""
+    with pytest.raises(ValueError):
+        timezones.find_timezones(PLANTS.longitude, PLANTS.latitude, PLANTS.state)
+    valid = PLANTS.iloc[:3]
+    assert timezones.find_timezones(valid.longitude, valid.latitude).notna().all()
+
+
+def test_find_timezones_cache(tmp_path, mocker):
+    """Each distinct location is looked up once, and the results are kept on disk."""
+    timezone_at = mocker.spy(timezones, "_timezone_at")
+    expected = timezones.find_timezones(
+        PLANTS.longitude, PLANTS.latitude, strict=False, cache_dir=tmp_path
+    )
+    # The duplicated location and the one missing its longitude aren't looked up.
+    assert timezone_at.call_count == 5
+    assert [path.name for path in tmp_path.iterdir()] == [
+        f"timezones-{timezones.TZ_DATA_VERSION}.parquet"
+    ]
+
+    mocker.patch.object(timezones, "_TIMEZONE_CACHE", {})
+    actual = timezones.find_timezones(
+        PLANTS.longitude, PLANTS.latitude, strict=False, cache_dir=tmp_path
+    )
+    assert timezone_at.call_count == 5
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_add_timezone_cache_is_opt_in(tmp_path, monkeypatch, mocker):
+    """Plant timezones are only kept on disk if PUDL_CACHE is set."""
+    find_timezones = mocker.spy(eia, "find_timezones")
+    monkeypatch.delenv("PUDL_CACHE", raising=False)
+    eia._add_timezone(PLANTS.copy())
+    assert find_timezones.call_args.kwargs["cache_dir"] is None
+
+    monkeypatch.setenv("PUDL_CACHE", str(tmp_path))
+    mocker.patch.object(timezones, "_TIMEZONE_CACHE", {})
+    eia._add_timezone(PLANTS.copy())
+    assert find_timezones.call_args.kwargs["cache_dir"] == tmp_path / "timezones"
+    assert (tmp_path / "timezones").is_dir()
+
+
+def test_utc_offsets():
+    """UTC offsets are the same as those found one timezone at a time."""
+    tz = pd.Series(["America/New_York", "America/Denver", "America/New_York", "UTC"])
+    jan1 = datetime.datetime(2011, 1, 1)
+    expected = tz.apply(lambda tz: pytz.timezone(tz).localize(jan1).utcoffset())
+    pd.testing.assert_series_equal(timezones.utc_offsets(tz, when=jan1), expected)
@@ -1,10 +1,14 @@
 """Unit tests for Datastore module."""
 
+import hashlib
+import http.server
 import json
 import re
+import threading
 import unittest
 from typing import Any
 
+import pytest
 import responses
 
 from pudl.workspace import datastore
@@ -335,4 +339,127 @@ class TestZenodoFetcher(unittest.TestCase):
         self.assertRaises(KeyError, self.fetcher.get_resource, res)
 
 
+class _FakeZenodoHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the files in ``server.files``, honoring simple HTTP Range requests."""
+
+    def do_GET(self):  # noqa: N802
+        content = self.server.files.get(self.path.lstrip("/"))
+        if content is None:
+            self.send_error(404)
+            return
+        self.server.requests.append((self.path, self.headers.get("Range")))
+        start = 0
+        if range_header := self.headers.get("Range"):
+            start = int(re.fullmatch(r"bytes=(\d+)-", range_header).group(1))
+            if start >= len(content):
+                self.send_error(416)
+                return
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+        self.wfile.write(content[start:])
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def fake_zenodo():
+    """A local HTTP stand-in for zenodo serving a few resources."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FakeZenodoHandler)
+    server.files = {
+        f"file{i}.zip": f"contents of file {i}".encode() * 1000 for i in range(4)
+    }
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def prefetch_datastore(fake_zenodo, tmp_path) -> datastore.Datastore:
+    """A datastore whose epacems descriptor points at the fake zenodo server."""
+    doi = datastore.ZenodoDoiSettings().epacems
+    host, port = fake_zenodo.server_address
+    descriptor = datastore.DatapackageDescriptor(
+        {
+            "resources": [
+                {
+                    "name": name,
+                    "path": f"http://{host}:{port}/{name}",
+                    "hash": hashlib.md5(content).hexdigest(),  # noqa: S324
+                    "parts": {"year_quarter": f"2020q{i + 1}"},
+                }
+                for i, (name, content) in enumerate(fake_zenodo.files.items())
+            ]
+        },
+        dataset="epacems",
+        doi=doi,
+    )
+    dstore = datastore.Datastore(local_cache_path=tmp_path)
+    dstore._zenodo_fetcher = MockableZenodoFetcher(descriptors={doi: descriptor})
+    return dstore
+
+
+def test_prefetch(prefetch_datastore, fake_zenodo, tmp_path):
+    """Selected resources are downloaded concurrently, and only once."""
+    partitions = {
+        "epacems": [
+            {"year_quarter": "2020q1"},
+            {"year_quarter": "2020q3", "state": "ignored"},
+            {"year_quarter": "2020q4"},
+        ]
+    }
+    fetched = prefetch_datastore.prefetch(partitions, max_workers=3)
+    # Each of the workers can keep its own connection open
+    http = prefetch_datastore._zenodo_fetcher.http
+    assert http.get_adapter("https://zenodo.org")._pool_maxsize == 3
+    assert sorted(res.name for res in fetched) == [
+        "file0.zip",
+        "file2.zip",
+        "file3.zip",
+    ]
+    for res in fetched:
+        path = prefetch_datastore._local_cache.get_path(res)
+        assert path.read_bytes() == fake_zenodo.files[res.name]
+        assert not path.with_name(f"{path.name}.partial").exists()
+
+    # Everything is already cached, so nothing should be requested the second time.
+    num_requests = len(fake_zenodo.requests)
+    assert prefetch_datastore.prefetch(partitions) == []
+    assert len(fake_zenodo.requests) == num_requests
+
+
+def test_prefetch_resumes_partial_download(prefetch_datastore, fake_zenodo):
+    """An interrupted download only requests the bytes which are still missing."""
+    res = PudlResourceKey("epacems", datastore.ZenodoDoiSettings().epacems, "file1.zip")
+    path = prefetch_datastore._local_cache.get_path(res)
+    path.parent.mkdir(parents=True)
+    path.with_name(f"{path.name}.partial").write_bytes(
+        fake_zenodo.files[res.name][:100]
+    )
+
+    assert prefetch_datastore.prefetch({"epacems": [{"year_quarter": "2020q2"}]}) == [
+        res
+    ]
+    assert fake_zenodo.requests == [("/file1.zip", "bytes=100-")]
+    assert path.read_bytes() == fake_zenodo.files[res.name]
+
+
+def test_prefetch_checksum_mismatch(prefetch_datastore, fake_zenodo):
+    """Corrupted downloads are reported and discarded rather than cached."""
+    fake_zenodo.files["file0.zip"] = b"corrupted"
+    with pytest.raises(RuntimeError, match="Failed to prefetch 1 resources"):
+        prefetch_datastore.prefetch({"epacems": [{}]})
+    res = PudlResourceKey("epacems", datastore.ZenodoDoiSettings().epacems, "file0.zip")
+    path = prefetch_datastore._local_cache.get_path(res)
+    assert not path.exists()
+    assert not path.with_name(f"{path.name}.partial").exists()
+    assert prefetch_datastore._local_cache.contains(res._replace(name="file1.zip"))
+
+
 # TODO(rousik): add unit tests for Datasource class as well
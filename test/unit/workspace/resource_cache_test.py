@@ -13,6 +13,39 @@ from pudl.workspace import resource_cache
 from pudl.workspace.resource_cache import PudlResourceKey, extend_gcp_retry_predicate
 
 
+class FakeObjectStoreCache(resource_cache.AbstractCache):
+    """In-memory stand-in for a remote object store that counts its requests."""
+
+    def __init__(self, **kwargs):
+        """Creates an empty store."""
+        super().__init__(**kwargs)
+        self.blobs: dict[str, bytes] = {}
+        self.num_contains = 0
+        self.num_lists = 0
+
+    def get(self, resource: PudlResourceKey) -> bytes:
+        """Returns the content of the resource."""
+        return self.blobs[resource.get_local_path().as_posix()]
+
+    def add(self, resource: PudlResourceKey, content: bytes):
+        """Stores the content of the resource."""
+        self.blobs[resource.get_local_path().as_posix()] = content
+
+    def delete(self, resource: PudlResourceKey):
+        """Removes the resource."""
+        self.blobs.pop(resource.get_local_path().as_posix(), None)
+
+    def contains(self, resource: PudlResourceKey) -> bool:
+        """Probes the store for a single resource."""
+        self.num_contains += 1
+        return resource.get_local_path().as_posix() in self.blobs
+
+    def list_resource_paths(self) -> set[str]:
+        """Lists the whole store in one request."""
+        self.num_lists += 1
+        return set(self.blobs)
+
+
 class TestGoogleCloudStorageCache(unittest.TestCase):
     """Unit tests for the GoogleCloudStorageCache class."""
 
@@ -49,6 +82,16 @@ class TestLocalFileCache(unittest.TestCase):
         self.assertTrue(self.cache.contains(res))
         self.assertEqual(b"blah", self.cache.get(res))
 
+    def test_add_replaces_existing_resource(self):
+        """Adding a resource again replaces it without leaving temporary files."""
+        res = PudlResourceKey("ds", "doi", "file.txt")
+        self.cache.add(res, b"old")
+        self.cache.add(res, b"new")
+        self.assertEqual(b"new", self.cache.get(res))
+        self.assertEqual(
+            ["file.txt"], [p.name for p in self.cache.get_path(res).parent.iterdir()]
+        )
+
     def test_that_two_cache_objects_share_storage(self):
         """Two LocalFileCache instances with the same path share the object storage."""
         second_cache = resource_cache.LocalFileCache(Path(self.test_dir))
@@ -87,6 +130,24 @@ class TestLocalFileCache(unittest.TestCase):
         ro_cache.delete(res)
         self.assertTrue(ro_cache.contains(res))
 
+    def test_list_resource_paths(self):
+        """Listing the cache returns the relative paths of the cached resources."""
+        self.assertEqual(set(), self.cache.list_resource_paths())
+        res = PudlResourceKey("ds", "10.5281/zenodo.1", "file.txt")
+        self.cache.add(res, b"blah")
+        self.assertEqual(
+            {res.get_local_path().as_posix()}, self.cache.list_resource_paths()
+        )
+
+    def test_get_local_path(self):
+        """get_local_path() points at the cached file only once it has been added."""
+        res = PudlResourceKey("a", "b", "c.zip")
+        self.assertIsNone(self.cache.get_local_path(res))
+        self.cache.add(res, b"sampleContents")
+        path = self.cache.get_local_path(res)
+        self.assertEqual(Path(self.test_dir) / "a" / "b" / "c.zip", path)
+        self.assertEqual(b"sampleContents", path.read_bytes())
+
 
 class TestLayeredCache(unittest.TestCase):
     """Unit tests for LayeredCache class."""
@@ -147,6 +208,84 @@ class TestLayeredCache(unittest.TestCase):
         self.assertTrue(self.cache_2.contains(res))
         self.assertEqual(b"secondLayer", self.layered_cache.get(res))
 
+    def test_get_local_path_uses_innermost_layer(self):
+        """Local path is taken from the leftmost layer that contains the resource."""
+        res = PudlResourceKey("a", "b", "x.txt")
+        self.layered_cache.add_cache_layer(self.cache_1)
+        self.layered_cache.add_cache_layer(self.cache_2)
+        self.assertIsNone(self.layered_cache.get_local_path(res))
+        self.cache_2.add(res, b"secondLayer")
+        self.assertEqual(
+            self.cache_2.get_local_path(res), self.layered_cache.get_local_path(res)
+        )
+        self.cache_1.add(res, b"firstLayer")
+        self.assertEqual(
+            self.cache_1.get_local_path(res), self.layered_cache.get_local_path(res)
+        )
+
+    def test_index_lists_each_layer_once(self):
+        """With an index, only lookups of missing resources probe the layers."""
+        remote = FakeObjectStoreCache()
+        resources = [
+            PudlResourceKey("ds", "10.5281/zenodo.1", f"{i}.zip") for i in range(10)
+        ]
+        for res in resources[:5]:
+            remote.add(res, b"remote")
+        self.cache_1.add(resources[0], b"local")
+        lc = resource_cache.LayeredCache(self.cache_1, remote, use_index=True)
+
+        for res in resources:
+            self.assertEqual(res in resources[:5], lc.contains(res))
+            self.assertEqual(res == resources[0], lc.is_optimally_cached(res))
+        self.assertEqual(b"local", lc.get(resources[0]))
+        self.assertEqual(b"remote", lc.get(resources[1]))
+        self.assertEqual(1, remote.num_lists)
+        self.assertEqual(len(resources[5:]), remote.num_contains)
+
+    def test_index_tracks_add_and_delete(self):
+        """Changes made through the layered cache are reflected by the index."""
+        remote = FakeObjectStoreCache()
+        lc = resource_cache.LayeredCache(remote, use_index=True)
+        res = PudlResourceKey("a", "b", "c")
+        self.assertFalse(lc.contains(res))
+        lc.add(res, b"test")
+        self.assertTrue(lc.contains(res))
+        lc.delete(res)
+        self.assertFalse(lc.contains(res))
+        self.assertEqual(1, remote.num_lists)
+        # Only the lookups of the missing resource probe the layer
+        self.assertEqual(2, remote.num_contains)
+
+    def test_index_revalidates_misses(self):
+        """Resources added to a layer directly are found without reindexing."""
+        lc = resource_cache.LayeredCache(self.cache_1, use_index=True)
+        res = PudlResourceKey("a", "b", "c")
+        self.assertFalse(lc.contains(res))
+        self.cache_1.add(res, b"test")
+        self.assertTrue(lc.contains(res))
+        self.assertEqual(b"test", lc.get(res))
+
+    def test_invalidate_index(self):
+        """Direct deletions from a layer are only seen once the index is invalidated."""
+        lc = resource_cache.LayeredCache(self.cache_1, use_index=True)
+        res = PudlResourceKey("a", "b", "c")
+        self.cache_1.add(res, b"test")
+        self.assertTrue(lc.contains(res))
+        self.cache_1.delete(res)
+        self.assertTrue(lc.contains(res))
+        lc.invalidate_index()
+        self.assertFalse(lc.contains(res))
+
+    def test_index_probes_layers_without_listing(self):
+        """Layers which can't be listed are still probed for each resource."""
+        remote = FakeObjectStoreCache()
+        remote.list_resource_paths = lambda: None
+        lc = resource_cache.LayeredCache(remote, use_index=True)
+        res = PudlResourceKey("a", "b", "c")
+        remote.add(res, b"test")
+        self.assertTrue(lc.contains(res))
+        self.assertEqual(1, remote.num_contains)
+
     def test_add_with_no_layers_does_nothing(self):
         """When add() is called on cache with no layers nothing happens."""
         res = PudlResourceKey("a", "b", "c")